@@ -5,12 +5,63 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 
+# Gmail accepts up to 100 calls per batch request but rate-limits large
+# batches; Google recommends staying at or below 50.
+MESSAGE_BATCH_SIZE = 50
+
+
+def fetch_messages_batch(service, message_ids: List[str]) -> Dict[str, Any]:
+    """
+    Fetch full Gmail messages MESSAGE_BATCH_SIZE per HTTP request.
+
+    Returns message_id -> message dict, or -> the exception for messages that
+    could not be fetched. A 404 is recorded as-is; any other per-message error
+    (e.g. a 429 inside the batch) is retried once with a plain messages.get.
+    Errors of the batch request itself propagate.
+    """
+    results: Dict[str, Any] = {}
+    retry_ids: List[str] = []
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            results[request_id] = response
+        elif isinstance(exception, HttpError) and exception.resp.status == 404:
+            results[request_id] = exception
+        else:
+            retry_ids.append(request_id)
+
+    unique_ids = list(dict.fromkeys(message_ids))
+    for i in range(0, len(unique_ids), MESSAGE_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        for message_id in unique_ids[i : i + MESSAGE_BATCH_SIZE]:
+            batch.add(
+                service.users().messages().get(userId="me", id=message_id, format="full"),
+                request_id=message_id,
+            )
+        batch.execute()
+
+    for message_id in retry_ids:
+        try:
+            results[message_id] = (
+                service.users()
+                .messages()
+                .get(userId="me", id=message_id, format="full")
+                .execute()
+            )
+        except Exception as e:
+            results[message_id] = e
+
+    return results
+
+
 class GmailClient:
     """
     Thin Gmail API wrapper.
     Responsible ONLY for Gmail API interactions.
     """
 
+    MESSAGE_BATCH_SIZE = MESSAGE_BATCH_SIZE
+
     def __init__(self, token_data: Dict[str, Any]):
         """
         token_data must contain:
@@ -159,3 +210,32 @@ class GmailClient:
             raise RuntimeError(
                 f"Gmail message fetch failed: {e.error_details if hasattr(e, 'error_details') else str(e)}"
             )
+
+    def get_messages_batch(self, message_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch many full Gmail messages via fetch_messages_batch().
+
+        Returns a dict of message_id -> message. Messages Gmail reports as not
+        found (404) map to None. Any other per-message failure that survives
+        the single retry raises RuntimeError.
+        """
+
+        try:
+            fetched = fetch_messages_batch(self.service, message_ids)
+        except HttpError as e:
+            raise RuntimeError(
+                f"Gmail batch message fetch failed: {e.error_details if hasattr(e, 'error_details') else str(e)}"
+            )
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for message_id, message in fetched.items():
+            if not isinstance(message, Exception):
+                results[message_id] = message
+            elif isinstance(message, HttpError) and message.resp.status == 404:
+                results[message_id] = None
+            else:
+                raise RuntimeError(
+                    f"Gmail message fetch failed: {message.error_details if hasattr(message, 'error_details') else str(message)}"
+                )
+
+        return results
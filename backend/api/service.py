@@ -12,6 +12,7 @@ Bootstrap:
     No manual sys.path manipulation needed.
 """
 import base64
+import hmac
 import inspect
 import mimetypes
 import os
@@ -286,6 +287,40 @@ async def health():
     """Render survival health check (accepts GET and HEAD)"""
     return {"status": "ok", "schema": ControlPlane.schema_state}
 
+@app.post("/pubsub/push")
+async def gmail_push_notification(request: Request):
+    """
+    Pub/Sub push endpoint for Gmail watch notifications.
+
+    Each notification ({emailAddress, historyId}) wakes the in-process sync
+    worker so new mail is ingested now rather than at the next poll. The
+    worker's own delta cursor decides what to fetch, so the historyId is only
+    logged. The subscription's push URL must carry PUBSUB_PUSH_TOKEN as
+    ?token=; with no token configured every push is rejected (fail closed),
+    since each accepted push forces a sync cycle. Malformed messages are
+    acknowledged (204) so Pub/Sub does not redeliver them.
+    """
+    expected_token = os.getenv("PUBSUB_PUSH_TOKEN", "")
+    if not expected_token or not hmac.compare_digest(
+        request.query_params.get("token", ""), expected_token
+    ):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    try:
+        envelope = await request.json()
+        notification = json.loads(base64.b64decode(envelope["message"]["data"]))
+    except Exception as e:
+        logger.warning(f"[PUBSUB] Ignoring malformed push message: {type(e).__name__}")
+        return Response(status_code=204)
+
+    logger.info(f"[PUBSUB] Gmail notification historyId={notification.get('historyId')}")
+    try:
+        from backend.infrastructure.worker import request_sync_wakeup
+        request_sync_wakeup()
+    except Exception as e:
+        logger.warning(f"[PUBSUB] Worker wake-up unavailable: {e}")
+    return Response(status_code=204)
+
 @app.get("/healthz")
 @app.head("/healthz")
 async def healthz():
@@ -317,19 +352,26 @@ async def healthz():
     # ── worker_sync section ───────────────────────────────────────────────
     ws = _get_worker_heartbeat()
     lcs = ws.get("last_cycle_started_at")
+    lcs_monotonic = ws.get("last_cycle_monotonic")
     lsucc = ws.get("last_success_ts")
+    if lcs_monotonic is not None:
+        # Same-process worker: age on the monotonic clock, immune to NTP steps
+        last_cycle_seconds_ago = round(time.monotonic() - lcs_monotonic, 1)
+    else:
+        last_cycle_seconds_ago = round(now - lcs, 1) if lcs else None
     worker_sync = {
         "enabled": ws.get("enabled"),
         "status": ws.get("status", "unknown"),
         "started_at": ws.get("started_at"),
         "last_cycle_started_at": lcs,
         "last_cycle_completed_at": ws.get("last_cycle_completed_at"),
-        "last_cycle_seconds_ago": round(now - lcs, 1) if lcs else None,
+        "last_cycle_seconds_ago": last_cycle_seconds_ago,
         "last_success_seconds_ago": round(now - lsucc, 1) if lsucc else None,
         "last_account_count": ws.get("last_account_count"),
         "last_error_at": ws.get("last_error_at"),
         "last_error_type": ws.get("last_error_type"),
         "schema_error_count": ws.get("schema_error_count", 0),
+        "restart_count": ws.get("restart_count", 0),
     }
 
     # ── ai_summarizer section ─────────────────────────────────────────────
@@ -2542,19 +2584,22 @@ async def get_inbox_threads(
     effective_account_id = _require_account_ownership(claims.uid, account_id, store)
     try:
         preferred_language = normalize_language(preferred_language)
-        # Fetch raw inbox messages with a larger cap to avoid cutting mid-thread duplicates
-        raw_emails = await asyncio.to_thread(
-            store.get_emails_with_summaries, limit=200, account_id=effective_account_id,
-            preferred_language=preferred_language
-        )
-        # Fetch sent timestamps per thread to capture user-reply activity ordering
-        sent_result = await asyncio.to_thread(
-            lambda: store.client.table("sent_emails")
-                .select("thread_id, sent_at")
-                .eq("account_id", effective_account_id)
-                .order("sent_at", desc=True)
-                .limit(200)
-                .execute()
+        # The two reads are independent: run them side by side.
+        raw_emails, sent_result = await asyncio.gather(
+            # Fetch raw inbox messages with a larger cap to avoid cutting mid-thread duplicates
+            asyncio.to_thread(
+                store.get_emails_with_summaries, limit=200, account_id=effective_account_id,
+                preferred_language=preferred_language
+            ),
+            # Fetch sent timestamps per thread to capture user-reply activity ordering
+            asyncio.to_thread(
+                lambda: store.client.table("sent_emails")
+                    .select("thread_id, sent_at")
+                    .eq("account_id", effective_account_id)
+                    .order("sent_at", desc=True)
+                    .limit(200)
+                    .execute()
+            ),
         )
         # Map: thread_id -> latest sent_at (first-seen = latest since ordered DESC)
         sent_latest: dict = {}
@@ -3228,7 +3273,7 @@ async def list_accounts(claims: JWTClaims = Depends(require_jwt_auth)):
         raw = await asyncio.to_thread(
             lambda: (
                 store.client.table("credentials")
-                .select("*")
+                .select("account_id,updated_at,scopes")  # payload is loaded via CredentialStore below
                 .eq("provider", "gmail")
                 .in_("account_id", account_ids)
                 .execute()
@@ -3237,19 +3282,27 @@ async def list_accounts(claims: JWTClaims = Depends(require_jwt_auth)):
         gmail_creds = raw.data or []
 
         credential_store = CredentialStore(persistence)
-        accounts = []
-        for c in gmail_creds:
-            account_id = c.get("account_id")
-            scopes_raw = c.get("scopes", "") or ""
-            scopes = [s.strip() for s in scopes_raw.split(",") if s.strip()] if isinstance(scopes_raw, str) else (scopes_raw or [])
+
+        async def _auth_required(account_id) -> bool:
             # Attempt decrypt to distinguish "row exists" from "usable credentials"
             try:
                 token_data = await asyncio.to_thread(
                     credential_store.load_credentials, account_id
                 )
-                auth_required = (token_data is None or "token" not in token_data)
+                return token_data is None or "token" not in token_data
             except Exception:
-                auth_required = True
+                return True
+
+        # Decrypt checks are independent per account: run them side by side.
+        auth_flags = await asyncio.gather(
+            *(_auth_required(c.get("account_id")) for c in gmail_creds)
+        )
+
+        accounts = []
+        for c, auth_required in zip(gmail_creds, auth_flags):
+            account_id = c.get("account_id")
+            scopes_raw = c.get("scopes", "") or ""
+            scopes = [s.strip() for s in scopes_raw.split(",") if s.strip()] if isinstance(scopes_raw, str) else (scopes_raw or [])
             send_scope = any("gmail.send" in (s or "") for s in scopes)
             modify_scope = any("gmail.modify" in (s or "") for s in scopes)
             accounts.append({
@@ -3326,8 +3379,7 @@ async def delete_user_account(
             "metadata": {
                 "uid": claims.uid,
                 "sub": claims.sub,
-                "initiated_at": datetime.utcnow()
-                                .isoformat()
+                "initiated_at": datetime.now(timezone.utc).isoformat()
             }
         }).execute()
     except Exception:
@@ -118,6 +118,8 @@ class PersistenceManager:
             temp_path = f"{self.storage_path}.tmp"
             with open(temp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
             
             shutil.move(temp_path, self.storage_path)
 
@@ -6,6 +6,13 @@ import warnings
 from typing import Dict, Any, Optional, List
 from mistralai import Mistral
 
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+    # except clauses below catch decode failures from either backend.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,7 +109,7 @@ class MistralEngine:
                     )
 
                 content = choice.message.content
-                return json.loads(content)
+                return _json_loads(content)
 
             except asyncio.TimeoutError:
                 if attempt < max_retries:
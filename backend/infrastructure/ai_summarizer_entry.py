@@ -12,7 +12,7 @@ import os
 import time
 import socket
 from backend.infrastructure.ai_summarizer_worker import AISummarizerWorker
-from backend.infrastructure.supabase_store import SupabaseStore
+from backend.infrastructure.supabase_store import get_store_instance
 from backend.engine.nlp_engine import MistralEngine
 
 logger = logging.getLogger(__name__)
@@ -104,7 +104,7 @@ def main():
 
     # Initialize dependencies
     try:
-        store = SupabaseStore()
+        store = get_store_instance()
         mistral_engine = MistralEngine()
         worker = AISummarizerWorker(store, mistral_engine)
     except Exception as e:
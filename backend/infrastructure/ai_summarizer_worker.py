@@ -14,6 +14,7 @@ ZERO-BUDGET OPTIMIZATIONS (Phase 1):
 - Model: open-mistral-nemo (cost-optimized)
 """
 
+import asyncio
 import hashlib
 import logging
 import os
@@ -143,6 +144,24 @@ _HANGUL_RE = re.compile(r"[가-힣ᄀ-ᇿ]")
 # Word tokenizer for Latin-script mismatch detection (ASCII alpha, 2+ chars)
 _WORD_RE = re.compile(r'[a-zA-Z]{2,}')
 
+# PII masking: precompiled once at import. Uses the linear-time re2 engine when
+# google-re2 is installed (no backtracking blow-ups on adversarial bodies);
+# falls back to stdlib re. Patterns run in this exact order: it decides which
+# match wins on overlapping text (e.g. "+1555...@x.com" must mask as an email)
+# and the masked text feeds _compute_input_hash, so reordering or merging
+# them would leak PII and invalidate cached summaries.
+try:
+    import re2 as _pii_re_engine
+except ImportError:
+    _pii_re_engine = re
+
+_PII_PATTERNS = (
+    (_pii_re_engine.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), '[EMAIL]'),
+    (_pii_re_engine.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'), '[PHONE]'),
+    (_pii_re_engine.compile(r'\+\d{1,3}\s?\d{1,14}'), '[PHONE]'),
+    (_pii_re_engine.compile(r'https?://[^\s<>"{}|\\^`\[\]]+'), '[URL]'),
+)
+
 # Languages that need script-based evidence (no Latin fallback)
 _NON_LATIN_LANGS = frozenset({"ar", "zh", "ja", "ko"})
 # Latin non-English languages — English-dominance detection
@@ -252,6 +271,9 @@ class AISummarizerWorker:
     # Class-level semaphore for concurrency control (shared across instances)
     _api_semaphore = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
 
+    # Timestamp shared by every write in the current process_batch (None outside a batch)
+    _batch_now_iso: Optional[str] = None
+
     def __init__(self, store: SupabaseStore, mistral_engine: MistralEngine):
         self.store = store
         self.mistral = mistral_engine
@@ -265,6 +287,10 @@ class AISummarizerWorker:
         )
         self.token_counter = TokenCounter()
 
+    def _now_iso(self) -> str:
+        """Batch timestamp when inside process_batch, else the current UTC time."""
+        return self._batch_now_iso or datetime.now(timezone.utc).isoformat()
+
     def claim_jobs(self, batch_size: int, worker_id: str, job_type: str = EMAIL_JOB_TYPE) -> list[Dict[str, Any]]:
         """
         Claim jobs atomically using ai_claim_jobs RPC.
@@ -478,16 +504,8 @@ class AISummarizerWorker:
         if not text:
             return ""
 
-        # Mask emails
-        text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL]', text)
-
-        # Mask phone numbers (basic patterns)
-        text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '[PHONE]', text)
-        text = re.sub(r'\+\d{1,3}\s?\d{1,14}', '[PHONE]', text)
-
-        # Mask URLs
-        text = re.sub(r'https?://[^\s<>"{}|\\^`\[\]]+', '[URL]', text)
-
+        for pattern, placeholder in _PII_PATTERNS:
+            text = pattern.sub(placeholder, text)
         return text
 
     def _compute_input_hash(self, masked_input: str) -> str:
@@ -648,7 +666,7 @@ class AISummarizerWorker:
     ):
         """Upsert language-variant summary to email_ai_summaries."""
         try:
-            now_iso = datetime.now(timezone.utc).isoformat()
+            now_iso = self._now_iso()
             self.store.client.table("email_ai_summaries").upsert({
                 "account_id": account_id,
                 "gmail_message_id": gmail_message_id,
@@ -672,7 +690,7 @@ class AISummarizerWorker:
     def _mark_job_succeeded(self, job_id: str):
         """Mark job as succeeded."""
         try:
-            now_iso = datetime.now(timezone.utc).isoformat()
+            now_iso = self._now_iso()
             result = self.store.client.table("ai_jobs").update({
                 "status": "succeeded",
                 "updated_at": now_iso
@@ -699,7 +717,7 @@ class AISummarizerWorker:
         """
         try:
             new_attempts = attempts + 1
-            now_iso = datetime.now(timezone.utc).isoformat()
+            now_iso = self._now_iso()
 
             if new_attempts >= AI_MAX_ATTEMPTS:
                 # Dead letter
@@ -1040,7 +1058,7 @@ class AISummarizerWorker:
     ) -> None:
         """Upsert document summary to email_ai_summaries using DOCUMENT_PROMPT_VERSION."""
         try:
-            now_iso = datetime.now(timezone.utc).isoformat()
+            now_iso = self._now_iso()
             self.store.client.table("email_ai_summaries").upsert(
                 {
                     "account_id": account_id,
@@ -1239,6 +1257,31 @@ class AISummarizerWorker:
             logger.error(f"[AI-WORKER][DOC] Job {job_id} failed (type={type(e).__name__})")
             self._mark_job_failed(job_id, attempts, "WORKER_EXCEPTION")
 
+    async def process_job_async(self, job: Dict[str, Any]) -> None:
+        """Run process_job off the event loop so independent jobs overlap their I/O."""
+        await asyncio.to_thread(self.process_job, job)
+
+    async def _process_jobs_concurrently(self, jobs: List[Dict[str, Any]]) -> None:
+        """
+        Process claimed email jobs concurrently.
+
+        Supabase reads/writes of one job overlap with those of the others;
+        Mistral calls stay bounded by _api_semaphore.
+        """
+        results = await asyncio.gather(
+            *(self.process_job_async(job) for job in jobs),
+            return_exceptions=True,
+        )
+        for job, result in zip(jobs, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"[AI-WORKER] Job {job.get('id')} raised "
+                    f"(account={job.get('account_id')}, "
+                    f"msg={(job.get('gmail_message_id') or '')[:8]}..., "
+                    f"type={type(result).__name__})",
+                    exc_info=result,
+                )
+
     def process_batch(self, batch_size: int, worker_id: str) -> int:
         """
         Claim and process a bounded batch of email + document jobs.
@@ -1254,10 +1297,16 @@ class AISummarizerWorker:
         if remaining_capacity > 0:
             doc_jobs = self.claim_jobs(remaining_capacity, worker_id, DOCUMENT_JOB_TYPE)
 
-        for job in email_jobs:
-            self.process_job(job)
-
-        for job in doc_jobs:
-            self.process_document_job(job)
+        self._batch_now_iso = datetime.now(timezone.utc).isoformat()
+        try:
+            # Same path for one job or many, so error handling does not
+            # depend on batch size: a raising job is logged, never propagated.
+            if email_jobs:
+                asyncio.run(self._process_jobs_concurrently(email_jobs))
+
+            for job in doc_jobs:
+                self.process_document_job(job)
+        finally:
+            self._batch_now_iso = None
 
         return len(email_jobs) + len(doc_jobs)
@@ -4,7 +4,7 @@ import logging
 import threading
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta, timezone
-from backend.infrastructure.supabase_store import SupabaseStore
+from backend.infrastructure.supabase_store import get_store_instance
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +38,7 @@ class ControlPlane:
                 return True
 
             try:
-                self.store = SupabaseStore()
+                self.store = get_store_instance()
                 return True
             except Exception as e:
                 logger.warning(f"[CONTROLPLANE] Persistence layer unavailable: {e}")
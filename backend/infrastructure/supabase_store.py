@@ -1,13 +1,302 @@
 import os
 import logging
-from typing import Optional
-from supabase import create_client
-from datetime import datetime, timezone
 import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from postgrest.exceptions import APIError
+from supabase import create_client, ClientOptions
+
+from backend.languages import normalize_language
+from backend.summary_versions import EMAIL_SUMMARY_PROMPT_VERSION
+from backend.utils.summary_utils import resolve_summary_for_language
+
+try:
+    import orjson as _orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    import json as _json
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class EmptyResponse:
+    """
+    Stand-in for a supabase-py APIResponse on read-error paths, so callers
+    can keep using result.data / result.count without a None check.
+    """
+    data: list = field(default_factory=list)
+    count: int = 0
+
+
+# PostgREST caps rows per request; bulk upserts are chunked to this size.
+POSTGREST_UPSERT_CHUNK_SIZE = 500
+
+# Batch writes back off only when Supabase answers 429: 1s, 2s, 4s (max 30s).
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_MAX_BACKOFF_SECONDS = 30
+
+
+def _json_loads(raw):
+    """Decode a JSON document, preferring orjson when it is installed."""
+    if _ORJSON_AVAILABLE:
+        return _orjson.loads(raw)
+    return _json.loads(raw)
+
+
+def _json_dumps(obj) -> str:
+    """Encode to a JSON string, preferring orjson."""
+    if _ORJSON_AVAILABLE:
+        return _orjson.dumps(obj).decode()
+    return _json.dumps(obj)
+
+
+class _TTLCache:
+    """
+    Small thread-safe TTL + LRU cache (stdlib stand-in for cachetools.TTLCache).
+    None is never stored, so get() returning None always means a miss.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        if value is None:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Credentials and sync cursors are read on every sync tick but change rarely.
+# Entries are dropped/refreshed by the matching write paths in this process;
+# writers in other processes are picked up after at most the TTL.
+STORE_CACHE_TTL_SECONDS = 60
+_credential_cache = _TTLCache(maxsize=256, ttl=STORE_CACHE_TTL_SECONDS)
+_sync_state_cache = _TTLCache(maxsize=256, ttl=STORE_CACHE_TTL_SECONDS)
+
+
+def invalidate_store_caches() -> None:
+    """Drops every cached credential and sync cursor (tests, key rotation)."""
+    _credential_cache.clear()
+    _sync_state_cache.clear()
+
+
+# Background writer for cursor updates the caller does not need to wait on.
+# Non-daemon pool threads are joined at interpreter exit, so queued writes
+# still land on a clean shutdown.
+_deferred_writes: "ThreadPoolExecutor | None" = None
+_deferred_writes_lock = threading.Lock()
+_deferred_lock = threading.Lock()
+# key -> (value, write_fn) waiting to be written; newer values replace older.
+_pending_writes: dict = {}
+# key -> Future of the task currently draining that key.
+_active_writes: dict = {}
+
+
+def _get_deferred_writes() -> ThreadPoolExecutor:
+    global _deferred_writes
+    if _deferred_writes is None:
+        with _deferred_writes_lock:
+            if _deferred_writes is None:
+                _deferred_writes = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="supabase-writes"
+                )
+    return _deferred_writes
+
+
+def defer_coalesced_write(key, value, write) -> Future:
+    """
+    Runs write(value) on a background thread and returns immediately.
+
+    Writes are coalesced per key: while a write for `key` is waiting, a newer
+    value replaces it, so a burst of cursor updates costs at most one write in
+    flight plus one for the latest value. One task drains each key, so writes
+    for the same key never land out of order.
+
+    Returns:
+        Future that resolves once no write is pending for `key`; it raises
+        if the last write it performed raised.
+    """
+    executor = _get_deferred_writes()
+    with _deferred_lock:
+        _pending_writes[key] = (value, write)
+        future = _active_writes.get(key)
+        if future is None:
+            future = executor.submit(_drain_deferred_writes, key)
+            _active_writes[key] = future
+        return future
+
+
+def has_pending_write(key) -> bool:
+    """True if a newer value for `key` is queued and not yet written."""
+    with _deferred_lock:
+        return key in _pending_writes
+
+
+def _drain_deferred_writes(key) -> None:
+    last_error = None
+    while True:
+        with _deferred_lock:
+            item = _pending_writes.pop(key, None)
+            if item is None:
+                _active_writes.pop(key, None)
+                break
+        value, write = item
+        try:
+            write(value)
+            last_error = None
+        except Exception as e:
+            last_error = e
+    if last_error is not None:
+        raise last_error
+
+
+def _parse_scopes(scopes) -> list:
+    """
+    credentials.scopes is text[] (migrations/perf_03) and arrives as a list;
+    rows on the legacy comma-separated TEXT column are split here.  On a TEXT
+    column, a list written by save_credential() is stored as its JSON text
+    ('["a","b"]'), so JSON arrays are decoded before falling back to the split.
+    """
+    if not scopes:
+        return []
+    if isinstance(scopes, list):
+        return scopes
+    stripped = scopes.strip()
+    if stripped.startswith("["):
+        try:
+            decoded = _json_loads(stripped)
+        except ValueError:
+            decoded = None
+        if isinstance(decoded, list):
+            return [s for s in (str(p).strip() for p in decoded) if s]
+    return [s for s in (p.strip() for p in scopes.split(",")) if s]
+
+
+def _decode_encrypted_payload(value):
+    """
+    credentials.encrypted_payload is a JSONB object; rows written before
+    migrations/perf_02 hold a JSON-encoded string instead.
+    """
+    if isinstance(value, (str, bytes)):
+        return _json_loads(value)
+    return value
+
+
+# Explicit projections for inbox reads. Naming the columns keeps derived ones
+# (e.g. the emails.search_vector tsvector) off the wire and lets the planner
+# use emails_account_date_idx (migrations/perf_04) for the ordered scan.
+EMAIL_SELECT_COLUMNS = (
+    "id,subject,sender,date,body,gmail_message_id,thread_id,"
+    "tenant_id,created_at,updated_at,account_id,has_attachments"
+)
+SUMMARY_SELECT_COLUMNS = "gmail_message_id,summary_json,summary_text,model,summary_language,updated_at"
+# The only credential columns get_credential() returns.
+CREDENTIAL_SELECT_COLUMNS = "encrypted_payload,scopes,updated_at"
+
+# How many subjects save_emails_bulk quotes when it skips rows without an id.
+MISSING_ID_LOG_SAMPLES = 3
+
+# Legacy recovery switch: insert emails without gmail_message_id (no dedupe).
+# Read once at import; toggling it requires a process restart.
+ALLOW_NULL_GMAIL_ID = os.getenv("ALLOW_NULL_GMAIL_ID", "false").lower() == "true"
+
+
+def _truncate_subject(subject, limit: int = 50) -> str:
+    """Log-safe subject: coerced to str and cut to `limit` chars."""
+    if not isinstance(subject, str):
+        subject = "" if subject is None else str(subject)
+    return (subject[:limit] + "...") if len(subject) > limit else subject
+
+
+# Shared keep-alive HTTP pool for every Supabase client built in this process.
+# Without it each create_client() opens its own httpx pool and pays a fresh
+# TCP/TLS handshake on first use.
+# Sized so bulk writers and gather()-ed reads are not queued behind a small
+# pool; with HTTP/2 most requests multiplex over a few kept-alive connections.
+# Connect/pool waits fail fast; read/write keep the postgrest default so large
+# bulk upserts and RPCs are not cut off.
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+SUPABASE_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0, pool=10.0)
+
+_http_client: "httpx.Client | None" = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Returns the process-wide httpx client (HTTP/2, keep-alive pool)."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=True,
+                    limits=SUPABASE_HTTP_LIMITS,
+                    timeout=SUPABASE_HTTP_TIMEOUT,
+                    follow_redirects=True,
+                )
+    return _http_client
+
+
+@lru_cache(maxsize=1)
+def _get_client(url: str, key: str):
+    """
+    Returns the process-wide supabase client for (url, key).
+    Cached so repeated SupabaseStore() construction reuses one warm client
+    instead of rebuilding auth/postgrest sub-clients each time.
+    """
+    return create_client(
+        url,
+        key,
+        options=ClientOptions(httpx_client=_get_http_client()),
+    )
+
+
 class SupabaseStore:
+    # Flipped off once PostgREST reports the get_emails_with_summaries RPC missing.
+    _summaries_rpc_available = True
+    # Same, for the get_sync_state RPC (migrations/perf_05).
+    _sync_state_rpc_available = True
+    # Same, for the save_emails_with_ai_jobs_v1 RPC (migrations/perf_06).
+    _atomic_bulk_rpc_available = True
+    # Direct PostgREST endpoint for hot equality reads; set in __init__.
+    _rest_base: Optional[str] = None
+    _rest_headers: Optional[dict] = None
+
     def __init__(self):
         self.url = os.getenv("SUPABASE_URL")
         self.key = os.getenv("SUPABASE_SERVICE_KEY")
@@ -15,7 +304,63 @@ class SupabaseStore:
         if not self.url or not self.key:
             raise RuntimeError("Supabase environment variables missing")
 
-        self.client = create_client(self.url, self.key)
+        self.client = _get_client(self.url, self.key)
+        self._rest_base = f"{self.url.rstrip('/')}/rest/v1/"
+        self._rest_headers = {
+            "apikey": self.key,
+            "Authorization": f"Bearer {self.key}",
+            "Accept": "application/json",
+        }
+
+    def _select_one(self, table: str, columns: str, **filters) -> Optional[dict]:
+        """
+        SELECT columns FROM table WHERE col = value AND ... LIMIT 1.
+
+        Returns the first matching row as a dict, or None. Hot per-sync-tick
+        reads go straight to PostgREST over the shared HTTP pool with a
+        prebuilt base URL and auth headers, skipping the query builder
+        allocations. Falls back to the supabase client when the store was not
+        built from env (no _rest_base). Raises on HTTP errors.
+        """
+        if self._rest_base is None:
+            query = self.client.table(table).select(columns)
+            for col, val in filters.items():
+                query = query.eq(col, val)
+            rows = query.limit(1).execute().data
+            return rows[0] if rows else None
+
+        params = {"select": columns, "limit": "1"}
+        for col, val in filters.items():
+            params[col] = f"eq.{val}"
+        response = _get_http_client().get(
+            self._rest_base + table, params=params, headers=self._rest_headers
+        )
+        response.raise_for_status()
+        rows = _json_loads(response.content)
+        return rows[0] if rows else None
+
+    def _rpc_scalar(self, name: str, params: dict):
+        """
+        Calls a PostgREST RPC and returns its decoded JSON body.
+
+        Uses the same direct HTTP path as _select_one when available. Errors are
+        raised as postgrest APIError so callers can check .code (e.g. PGRST202
+        for a function that has not been deployed).
+        """
+        if self._rest_base is None:
+            return self.client.rpc(name, params).execute().data
+
+        response = _get_http_client().post(
+            f"{self._rest_base}rpc/{name}", content=_json_dumps(params),
+            headers={**self._rest_headers, "Content-Type": "application/json"},
+        )
+        if response.is_error:
+            try:
+                detail = _json_loads(response.content)
+            except Exception:
+                detail = {"message": response.text}
+            raise APIError(detail if isinstance(detail, dict) else {"message": str(detail)})
+        return _json_loads(response.content)
 
     def save_thread(self, thread_id, subject, summary, account_id="default"):
         return self.client.table("email_threads").insert({
@@ -23,7 +368,7 @@ class SupabaseStore:
             "account_id": account_id,
             "subject": subject,
             "summary": summary,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            # created_at: email_threads column DEFAULT now()
         }).execute()
 
     def get_threads(self, account_id="default"):
@@ -35,77 +380,141 @@ class SupabaseStore:
                 .execute()
         except Exception as e:
             logger.warning(f"Supabase thread fetch error: {e}")
-            return type('obj', (object,), {'data': []})
+            return EmptyResponse()
 
     def save_email(self, subject, sender, date, body=None, message_id=None, tenant_id="primary", account_id="default", thread_id=None, has_attachments=False):
         """
-        Upserts an email into Supabase.
+        Upserts a single email into Supabase.
+
+        Thin wrapper around save_emails_bulk(); see there for dedupe, timestamp
+        validation and missing-id handling.
+
+        Unlike the bulk path this keeps return=representation, so
+        response.data holds the written row (callers such as /diagnostic
+        check it to confirm the write).
+
+        Returns:
+            Supabase response object, or None when the email was skipped
+        """
+        results = self.save_emails_bulk(
+            [{
+                "subject": subject,
+                "sender": sender,
+                "date": date,
+                "body": body,
+                "message_id": message_id,
+                "thread_id": thread_id,
+                "has_attachments": has_attachments,
+            }],
+            tenant_id=tenant_id,
+            account_id=account_id,
+            returning="representation",
+        )
+        return results[0] if results else None
+
+    def save_emails_bulk(self, emails, tenant_id="primary", account_id="default", returning="minimal"):
+        """
+        Upserts many emails in as few round trips as possible.
         Deduplication is handled by (account_id, gmail_message_id) unique index.
 
+        Each item is a dict with the save_email fields: subject, sender, date,
+        body, message_id, thread_id, has_attachments. Rows are sent in chunks of
+        POSTGREST_UPSERT_CHUNK_SIZE (PostgREST row cap) with return=minimal
+        unless `returning="representation"` is passed.
+
         Note: created_at is NOT included in payload - database sets it on INSERT only.
         updated_at tracks when the record was last synced from Gmail.
 
         CRITICAL: account_id MUST be included in payload for multi-account isolation.
         CRITICAL: Timestamp validation ensures UTC timezone consistency.
         CRITICAL: thread_id required for email send functionality.
+
+        Returns:
+            List of Supabase response objects (one per request issued)
         """
-        from datetime import datetime, timezone
-        import logging
-        logger = logging.getLogger("supabase_store")
 
-        # CRITICAL VALIDATION: Ensure date timestamp is timezone-aware UTC
-        # This prevents timestamp drift caused by naive datetime objects
-        validated_date = date
-        if isinstance(date, str):
-            # Verify ISO format includes timezone (+00:00 or Z suffix)
-            if not ('+' in date or date.endswith('Z')):
-                logger.warning(f"[TIMESTAMP-VALIDATION] Received naive timestamp string without timezone: {date}")
-                logger.warning(f"[TIMESTAMP-VALIDATION] Subject: {subject[:50] if subject else 'Unknown'}")
-                # Assume UTC and add timezone suffix
-                validated_date = f"{date}+00:00" if not date.endswith('Z') else date
-                logger.warning(f"[TIMESTAMP-VALIDATION] Corrected to: {validated_date}")
-            else:
-                logger.info(f"[TIMESTAMP-VALIDATION] Timestamp OK: {date[:19]}... (has timezone)")
+        now_iso = datetime.now(timezone.utc).isoformat()
+        with_id = {}
+        without_id = []
+
+        for email in emails:
+            subject = email.get("subject")
+            date = email.get("date")
+
+            # CRITICAL VALIDATION: Ensure date timestamp is timezone-aware UTC
+            # This prevents timestamp drift caused by naive datetime objects
+            validated_date = date
+            if isinstance(date, str):
+                # Verify ISO format includes timezone (+00:00 or Z suffix)
+                if not ('+' in date or date.endswith('Z')):
+                    logger.warning(f"[TIMESTAMP-VALIDATION] Received naive timestamp string without timezone: {date}")
+                    logger.warning(f"[TIMESTAMP-VALIDATION] Subject: {subject[:50] if subject else 'Unknown'}")
+                    # Assume UTC and add timezone suffix
+                    validated_date = f"{date}+00:00" if not date.endswith('Z') else date
+                    logger.warning(f"[TIMESTAMP-VALIDATION] Corrected to: {validated_date}")
+                else:
+                    logger.debug("[TIMESTAMP-VALIDATION] Timestamp OK: %s... (has timezone)", date[:19])
 
-        payload = {
-            "subject": subject,
-            "sender": sender,
-            "date": validated_date,
-            "body": body,
-            "tenant_id": tenant_id,
-            "account_id": account_id,  # CRITICAL: Required for multi-account email isolation
-            "updated_at": datetime.now(timezone.utc).isoformat(),  # ✅ FIXED: Use timezone-aware datetime
-            "thread_id": thread_id,  # CRITICAL: Gmail thread ID for send functionality
-            "has_attachments": bool(has_attachments),
-        }
+            payload = {
+                "subject": subject,
+                "sender": email.get("sender"),
+                "date": validated_date,
+                "body": email.get("body"),
+                "tenant_id": tenant_id,
+                "account_id": account_id,  # CRITICAL: Required for multi-account email isolation
+                "updated_at": now_iso,
+                "thread_id": email.get("thread_id"),  # CRITICAL: Gmail thread ID for send functionality
+                "has_attachments": bool(email.get("has_attachments")),
+            }
 
-        if message_id:
-            payload["gmail_message_id"] = message_id
-            return self.client.table("emails").upsert(
-                payload,
-                on_conflict="account_id,gmail_message_id"
-            ).execute()
+            message_id = email.get("message_id")
+            if message_id:
+                payload["gmail_message_id"] = message_id
+                # Last occurrence wins: Postgres rejects an upsert that touches
+                # the same conflict key twice in one statement.
+                with_id[message_id] = payload
+            else:
+                without_id.append(payload)
+
+        with_id = list(with_id.values())
+        results = []
+        for i in range(0, len(with_id), POSTGREST_UPSERT_CHUNK_SIZE):
+            results.append(
+                self.client.table("emails").upsert(
+                    with_id[i : i + POSTGREST_UPSERT_CHUNK_SIZE],
+                    on_conflict="account_id,gmail_message_id",
+                    returning=returning,
+                ).execute()
+            )
 
-        # Fallback: check env flag before inserting without dedupe
-        allow_null_id = os.getenv("ALLOW_NULL_GMAIL_ID", "false").lower() == "true"
-        if allow_null_id:
+        if not without_id:
+            return results
+
+        # Fallback: check ALLOW_NULL_GMAIL_ID before inserting without dedupe.
+        # One aggregated warning per batch (count + a few samples) instead of a
+        # log line per row; a large sync with missing ids would otherwise emit
+        # thousands of lines under the logging handler lock.
+        samples = [
+            f"{_truncate_subject(p['subject'])} @ {p['date']}"
+            for p in without_id[:MISSING_ID_LOG_SAMPLES]
+        ]
+        if ALLOW_NULL_GMAIL_ID:
             # Legacy unsafe mode: insert without dedup (use only for recovery)
-            subj = subject if isinstance(subject, str) else ("" if subject is None else str(subject))
-            subject_truncated = (subj[:50] + "...") if len(subj) > 50 else subj
             logger.warning(
-                f"[SYNC] UNSAFE MODE: Missing gmail_message_id; inserting without dedupe "
-                f"(tenant={tenant_id}, subject={subject_truncated}, date={date})"
+                f"[SYNC] UNSAFE MODE: {len(without_id)} emails missing gmail_message_id; "
+                f"inserting without dedupe (tenant={tenant_id}, samples={samples})"
+            )
+        else:
+            # Default: skip insert to prevent DB corruption
+            logger.warning(
+                f"[SYNC] Skipped {len(without_id)} emails missing gmail_message_id "
+                f"to prevent corruption (tenant={tenant_id}, samples={samples})"
             )
-            return self.client.table("emails").insert(payload).execute()
-
-        # Default: skip insert to prevent DB corruption
-        subj = subject if isinstance(subject, str) else ("" if subject is None else str(subject))
-        subject_truncated = (subj[:50] + "...") if len(subj) > 50 else subj
-        logger.warning(
-            f"[SYNC] Missing gmail_message_id; SKIPPING insert to prevent corruption "
-            f"(tenant={tenant_id}, subject={subject_truncated}, date={date})"
-        )
-        return None
+
+        if ALLOW_NULL_GMAIL_ID:
+            results.append(self.client.table("emails").insert(without_id).execute())
+
+        return results
 
     
     def save_email_atomic(
@@ -142,9 +551,6 @@ class SupabaseStore:
         Returns:
             RPC response with {email_id, job_id, job_created} or None on failure
         """
-        from datetime import datetime, timezone
-        import logging
-        logger = logging.getLogger("supabase_store")
 
         if not message_id:
             logger.error("[ATOMIC-SAVE] Missing gmail_message_id - SKIPPING to prevent corruption")
@@ -183,6 +589,102 @@ class SupabaseStore:
             logger.error(f"[ATOMIC-SAVE] RPC failed for {message_id[:8]}...: {type(e).__name__}: {e}")
             return None
 
+    def save_emails_atomic_bulk(self, emails, tenant_id="primary", account_id="default", provider="gmail"):
+        """
+        Batch form of save_email_atomic(): one RPC call for a whole sync batch.
+
+        Each item is a dict with the save_email_atomic fields: subject, sender,
+        date, body, message_id, thread_id, thread_ref, has_attachments,
+        create_ai_job. Items without a message_id are skipped.
+
+        Uses save_emails_with_ai_jobs_v1 (migrations/perf_06), which applies
+        save_email_with_ai_job_v2 to every item in one transaction. A 429 is
+        retried with exponential backoff; if the RPC is missing or the batch
+        still fails, each item is retried through save_email_atomic() so one
+        bad email cannot drop the rest.
+
+        Returns:
+            Dict of message_id -> {email_id, job_id, job_existed, job_created}
+            for every email that was saved
+        """
+        rows = []
+        for email in emails:
+            message_id = email.get("message_id")
+            if not message_id:
+                logger.error("[ATOMIC-SAVE] Missing gmail_message_id - SKIPPING to prevent corruption")
+                continue
+
+            date = email.get("date")
+            if isinstance(date, str) and not ('+' in date or date.endswith('Z')):
+                date = f"{date}+00:00"
+
+            rows.append({
+                "subject": email.get("subject"),
+                "sender": email.get("sender"),
+                "date": date,
+                "body": email.get("body") or "",
+                "message_id": message_id,
+                "thread_id": email.get("thread_id"),
+                "thread_ref": email.get("thread_ref"),
+                "has_attachments": bool(email.get("has_attachments")),
+                "create_ai_job": bool(email.get("create_ai_job")),
+            })
+
+        if not rows:
+            return {}
+
+        attempt = 0
+        while SupabaseStore._atomic_bulk_rpc_available:
+            try:
+                result = self.client.rpc("save_emails_with_ai_jobs_v1", {
+                    "p_emails": rows,
+                    "p_account_id": account_id,
+                    "p_tenant_id": tenant_id,
+                    "p_provider": provider,
+                }).execute()
+                saved = {item["message_id"]: item for item in (result.data or []) if item.get("message_id")}
+                logger.info(f"[ATOMIC-SAVE] Batch saved: {len(saved)}/{len(rows)} email(s) for {account_id}")
+                return saved
+            except Exception as rpc_err:
+                err_msg = str(rpc_err)
+                is_rate_limit = "429" in err_msg or str(getattr(rpc_err, "code", "")) == "429"
+                if is_rate_limit and attempt < RATE_LIMIT_MAX_RETRIES:
+                    delay = min(2 ** attempt, RATE_LIMIT_MAX_BACKOFF_SECONDS)
+                    attempt += 1
+                    logger.warning(
+                        f"[ATOMIC-SAVE] Rate limited (429), retry {attempt}/{RATE_LIMIT_MAX_RETRIES} in {delay}s"
+                    )
+                    time.sleep(delay)
+                    continue
+                # PGRST202: function not found -> migration not applied; stop trying.
+                if getattr(rpc_err, "code", None) == "PGRST202":
+                    SupabaseStore._atomic_bulk_rpc_available = False
+                logger.warning(
+                    f"[ATOMIC-SAVE] Batch RPC failed for {len(rows)} email(s), saving one by one: "
+                    f"{type(rpc_err).__name__}: {rpc_err}"
+                )
+                break
+
+        saved = {}
+        for row in rows:
+            result = self.save_email_atomic(
+                subject=row["subject"],
+                sender=row["sender"],
+                date=row["date"],
+                body=row["body"],
+                message_id=row["message_id"],
+                tenant_id=tenant_id,
+                account_id=account_id,
+                create_ai_job=row["create_ai_job"],
+                thread_id=row["thread_id"],
+                provider=provider,
+                thread_ref=row["thread_ref"],
+                has_attachments=row["has_attachments"],
+            )
+            if result and result.data:
+                saved[row["message_id"]] = result.data
+        return saved
+
     def get_emails(self, limit=50, account_id=None):
         """
         Fetches emails from Supabase.
@@ -197,12 +699,10 @@ class SupabaseStore:
         Returns:
             Supabase response object with .data attribute containing email list
         """
-        import logging
-        logger = logging.getLogger("supabase_store")
 
         try:
             # Direct query without LEFT JOIN for maximum reliability
-            query = self.client.table("emails").select("*")
+            query = self.client.table("emails").select(EMAIL_SELECT_COLUMNS)
 
             # Filter by account_id if provided
             if account_id:
@@ -219,16 +719,16 @@ class SupabaseStore:
             return result
         except Exception as e:
             logger.error(f"[EMAILS] Supabase fetch error: {type(e).__name__}: {e}")
-            import traceback
             logger.error(f"[EMAILS] Traceback: {traceback.format_exc()}")
-            return type('obj', (object,), {'data': []})
+            return EmptyResponse()
 
     def get_emails_with_summaries(self, limit=50, account_id=None, preferred_language: str = "en"):
         """
         Fetches emails with AI summaries via LEFT JOIN (OPTIMIZED VERSION).
 
-        This eliminates the N+1 query pattern by fetching emails and summaries
-        in a single database query.
+        Uses the get_emails_with_summaries RPC (migrations/perf_01) so emails and
+        their resolved summary come back in a single round trip. Falls back to
+        two queries + an in-process merge when the RPC is not deployed.
 
         Args:
             limit: Maximum number of emails to return (default: 50)
@@ -242,18 +742,33 @@ class SupabaseStore:
             - ai_summary_model: Model used (e.g., "mistral-small-latest")
             - ai_summary_language: Actual language of the returned summary
         """
-        import logging
-        from backend.languages import normalize_language
-        from backend.summary_versions import EMAIL_SUMMARY_PROMPT_VERSION
-        from backend.utils.summary_utils import resolve_summary_for_language
-        logger = logging.getLogger("supabase_store")
         preferred_language = normalize_language(preferred_language)
 
+        if SupabaseStore._summaries_rpc_available:
+            try:
+                rpc_result = self.client.rpc("get_emails_with_summaries", {
+                    "p_account_id": account_id,
+                    "p_limit": limit,
+                    "p_preferred_language": preferred_language,
+                    "p_prompt_version": EMAIL_SUMMARY_PROMPT_VERSION,
+                }).execute()
+                emails = rpc_result.data or []
+                logger.info(f"[EMAILS] Returning {len(emails)} emails with summary data (rpc)")
+                return emails
+            except Exception as rpc_err:
+                # PGRST202: function not found -> migration not applied; stop trying.
+                if getattr(rpc_err, "code", None) == "PGRST202":
+                    SupabaseStore._summaries_rpc_available = False
+                logger.warning(
+                    f"[EMAILS] get_emails_with_summaries RPC failed, using two-query path: "
+                    f"{type(rpc_err).__name__}: {rpc_err}"
+                )
+
         try:
             # Build query with LEFT JOIN to email_ai_summaries
             # CRITICAL: Use proper Supabase syntax to avoid empty responses
             query = self.client.table("emails").select(
-                "*",
+                EMAIL_SELECT_COLUMNS,
                 count=None  # Don't include count in response
             )
 
@@ -276,7 +791,7 @@ class SupabaseStore:
             summaries_map = {}
             if email_ids:
                 try:
-                    summaries_query = self.client.table("email_ai_summaries").select("*")
+                    summaries_query = self.client.table("email_ai_summaries").select(SUMMARY_SELECT_COLUMNS)
 
                     # Filter by account_id and gmail_message_ids.
                     # Also filter by prompt_version to exclude document-summary rows
@@ -328,38 +843,43 @@ class SupabaseStore:
                     logger.warning(f"[EMAILS] Summary fetch failed: {type(summary_err).__name__}: {summary_err}")
                     # Continue without summaries rather than failing
 
-            # Merge summaries into email objects
-            enriched_emails = []
-            for email in result.data:
-                msg_id = email.get("gmail_message_id")
-                entry = summaries_map.get(msg_id) if msg_id else None
-                if entry:
-                    summary = entry["row"]
-                    actual_lang = summary.get("summary_language", "en")
-                    email["ai_summary_json"] = summary.get("summary_json")
-                    email["ai_summary_text"] = summary.get("summary_text")
-                    email["ai_summary_model"] = summary.get("model")
-                    email["ai_summary_language"] = actual_lang
-                    email["ai_summary_is_fallback"] = actual_lang != preferred_language
-                    email["ai_preferred_language"] = preferred_language
-                    email["ai_preferred_language_available"] = entry["preferred_available"]
-                else:
-                    email["ai_summary_json"] = None
-                    email["ai_summary_text"] = None
-                    email["ai_summary_model"] = None
-                    email["ai_summary_language"] = None
-                    email["ai_summary_is_fallback"] = False
-                    email["ai_preferred_language"] = preferred_language
-                    email["ai_preferred_language_available"] = False
+            # Merge summaries into email objects (locals bound once; this is the
+            # only CPU-bound step here and scales with `limit`)
+            summaries_get = summaries_map.get
+            no_summary = {
+                "ai_summary_json": None,
+                "ai_summary_text": None,
+                "ai_summary_model": None,
+                "ai_summary_language": None,
+                "ai_summary_is_fallback": False,
+                "ai_preferred_language": preferred_language,
+                "ai_preferred_language_available": False,
+            }
 
-                enriched_emails.append(email)
+            def _summary_fields(entry):
+                summary = entry["row"]
+                actual_lang = summary.get("summary_language", "en")
+                return {
+                    "ai_summary_json": summary.get("summary_json"),
+                    "ai_summary_text": summary.get("summary_text"),
+                    "ai_summary_model": summary.get("model"),
+                    "ai_summary_language": actual_lang,
+                    "ai_summary_is_fallback": actual_lang != preferred_language,
+                    "ai_preferred_language": preferred_language,
+                    "ai_preferred_language_available": entry["preferred_available"],
+                }
+
+            enriched_emails = [
+                {**email, **(_summary_fields(entry) if entry else no_summary)}
+                for email in result.data
+                for entry in (summaries_get(email.get("gmail_message_id")),)
+            ]
 
             logger.info(f"[EMAILS] Returning {len(enriched_emails)} emails with summary data")
             return enriched_emails
 
         except Exception as e:
             logger.error(f"[EMAILS] Fetch with summaries error: {type(e).__name__}: {e}")
-            import traceback
             logger.error(f"[EMAILS] Traceback: {traceback.format_exc()}")
             return []
 
@@ -374,26 +894,24 @@ class SupabaseStore:
             scopes: List of OAuth scopes
 
         Returns:
-            Supabase response object
+            Supabase response object. Written with return=minimal, so
+            response.data is empty; callers must not index into it.
         """
-        import json
-
-        # Convert scopes list to comma-separated string for TEXT column
-        scopes_str = ",".join(scopes) if scopes else ""
-
         payload = {
             "provider": provider,
             "account_id": account_id,
-            "encrypted_payload": json.dumps(encrypted_payload),
-            "scopes": scopes_str,
+            "encrypted_payload": encrypted_payload,  # JSONB: serialized once with the request body
+            "scopes": list(scopes) if scopes else [],  # text[] column
             "updated_at": datetime.now(timezone.utc).isoformat()
         }
 
         try:
             result = self.client.table("credentials").upsert(
                 payload,
-                on_conflict="provider,account_id"
+                on_conflict="provider,account_id",
+                returning="minimal",
             ).execute()
+            _credential_cache.pop((provider, account_id))
             logger.info(f"[SUPABASE] Stored credentials (provider={provider}, account_id={account_id})")
             return result
         except Exception as e:
@@ -411,28 +929,27 @@ class SupabaseStore:
         Returns:
             Dict with encrypted_payload and scopes, or None if not found
         """
-        import json
+        cache_key = (provider, account_id)
+        cached = _credential_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
 
         try:
-            response = self.client.table("credentials") \
-                .select("*") \
-                .eq("provider", provider) \
-                .eq("account_id", account_id) \
-                .execute()
-
-            if response.data and len(response.data) > 0:
-                cred = response.data[0]
+            cred = self._select_one(
+                "credentials", CREDENTIAL_SELECT_COLUMNS, provider=provider, account_id=account_id
+            )
 
-                # Parse scopes from comma-separated string to list
-                scopes_str = cred.get("scopes", "")
-                scopes = [s.strip() for s in scopes_str.split(",") if s.strip()] if scopes_str else []
+            if cred is not None:
+                scopes = _parse_scopes(cred.get("scopes"))
 
                 logger.info(f"[SUPABASE] Loaded credentials (provider={provider}, account_id={account_id})")
-                return {
-                    "encrypted_payload": json.loads(cred["encrypted_payload"]),
+                result = {
+                    "encrypted_payload": _decode_encrypted_payload(cred["encrypted_payload"]),
                     "scopes": scopes,
                     "updated_at": cred.get("updated_at")
                 }
+                _credential_cache.set(cache_key, result)
+                return dict(result)
             return None
         except Exception as e:
             logger.warning(f"Supabase credential fetch error: {e}")
@@ -449,20 +966,83 @@ class SupabaseStore:
         Returns:
             String historyId or None if no cursor exists
         """
+        cache_key = (tenant_id, account_id)
+        cached = _sync_state_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if SupabaseStore._sync_state_rpc_available:
+            try:
+                # STABLE SQL function: one cached plan, no per-request filter parse.
+                cursor = self._rpc_scalar(
+                    "get_sync_state", {"p_tenant_id": tenant_id, "p_account_id": account_id}
+                )
+                if cursor is not None:
+                    _sync_state_cache.set(cache_key, cursor)
+                return cursor
+            except Exception as rpc_err:
+                # PGRST202: function not found -> migration not applied; stop trying.
+                if getattr(rpc_err, "code", None) == "PGRST202":
+                    SupabaseStore._sync_state_rpc_available = False
+                logger.warning(
+                    f"[SYNC-STATE] get_sync_state RPC failed, using table read: "
+                    f"{type(rpc_err).__name__}: {rpc_err}"
+                )
+
         try:
-            response = self.client.table("gmail_sync_state") \
-                .select("last_history_id") \
-                .eq("tenant_id", tenant_id) \
-                .eq("account_id", account_id) \
-                .execute()
+            row = self._select_one(
+                "gmail_sync_state", "last_history_id", tenant_id=tenant_id, account_id=account_id
+            )
 
-            if response.data and len(response.data) > 0:
-                return response.data[0].get("last_history_id")
+            if row is not None:
+                cursor = row.get("last_history_id")
+                _sync_state_cache.set(cache_key, cursor)
+                return cursor
             return None
         except Exception as e:
             logger.warning(f"Supabase sync state fetch error: {e}")
             return None
 
+    def get_sync_states(self, tenant_id: str, account_ids) -> dict:
+        """
+        Batch form of get_sync_state() for many accounts of one tenant.
+
+        Cached cursors are served from the sync-state cache; the rest are read
+        with a single gmail_sync_state query instead of one request per account.
+
+        Returns:
+            Dict of account_id -> last_history_id for accounts that have a cursor
+        """
+        cursors = {}
+        missing = []
+        for account_id in dict.fromkeys(account_ids):
+            cached = _sync_state_cache.get((tenant_id, account_id))
+            if cached is not None:
+                cursors[account_id] = cached
+            else:
+                missing.append(account_id)
+
+        if not missing:
+            return cursors
+
+        try:
+            result = (
+                self.client.table("gmail_sync_state")
+                .select("account_id,last_history_id")
+                .eq("tenant_id", tenant_id)
+                .in_("account_id", missing)
+                .execute()
+            )
+            for row in result.data or []:
+                cursor = row.get("last_history_id")
+                if cursor:
+                    _sync_state_cache.set((tenant_id, row["account_id"]), cursor)
+                    cursors[row["account_id"]] = cursor
+        except Exception as e:
+            logger.warning(f"[SYNC-STATE] Batch sync state fetch failed for {len(missing)} account(s): {e}")
+
+        return cursors
+
     def set_sync_state(self, tenant_id: str, account_id: str, last_history_id: str):
         """
         Upserts the last_history_id cursor into gmail_sync_state table.
@@ -482,13 +1062,42 @@ class SupabaseStore:
         try:
             self.client.table("gmail_sync_state").upsert(
                 payload,
-                on_conflict="tenant_id,account_id"
+                on_conflict="tenant_id,account_id",
+                returning="minimal",
             ).execute()
+            _sync_state_cache.set((tenant_id, account_id), last_history_id)
             logger.info(f"[SYNC-STATE] Cursor saved: {last_history_id[:8]}... (tenant={tenant_id}, account={account_id})")
         except Exception as e:
             logger.error(f"Supabase sync state save failed: {e}")
             raise
 
+    def set_sync_state_deferred(self, tenant_id: str, account_id: str, last_history_id: str) -> Future:
+        """
+        Fire-and-forget variant of set_sync_state().
+
+        The cursor goes into the read cache immediately and the upsert runs
+        through defer_coalesced_write(), so the caller does not pay the round
+        trip and a burst of updates only writes the latest cursor.
+
+        Returns:
+            Future for the write; callers may ignore it. A failed write is
+            logged and, unless a newer cursor is already queued, evicts the
+            cached cursor so the next read goes to the DB.
+        """
+        key = ("gmail_sync_state", tenant_id, account_id)
+        cache_key = (tenant_id, account_id)
+        _sync_state_cache.set(cache_key, last_history_id)
+
+        def write(cursor):
+            try:
+                self.set_sync_state(tenant_id, account_id, cursor)
+            except Exception:
+                # set_sync_state already logged the failure.
+                if not has_pending_write(key):
+                    _sync_state_cache.pop(cache_key)
+                raise
+
+        return defer_coalesced_write(key, last_history_id, write)
 
     def list_credentials(self, provider: str):
         """Lists credentials for provider without exposing encrypted_payload."""
@@ -497,8 +1106,7 @@ class SupabaseStore:
 
             data = response.data or []
             for cred in data:
-                scopes_str = cred.get("scopes", "") or ""
-                cred["scopes"] = [s.strip() for s in scopes_str.split(",") if s.strip()] if scopes_str else []
+                cred["scopes"] = _parse_scopes(cred.get("scopes"))
             return data
         except Exception as e:
             logger.warning(f"Supabase credential list error: {e}")
@@ -508,6 +1116,7 @@ class SupabaseStore:
         """Deletes credentials for provider/account_id from Supabase."""
         try:
             self.client.table("credentials")                 .delete()                 .eq("provider", provider)                 .eq("account_id", account_id)                 .execute()
+            _credential_cache.pop((provider, account_id))
             logger.info(f"[SUPABASE] Deleted credentials (provider={provider}, account_id={account_id})")
         except Exception as e:
             logger.warning(f"Supabase credential delete error: {e}")
@@ -533,23 +1142,25 @@ class SupabaseStore:
             job_id (str) if successful, None if failed
         """
         try:
+            now_iso = datetime.now(timezone.utc).isoformat()
             payload = {
                 "job_type": job_type,
                 "account_id": account_id,
                 "gmail_message_id": gmail_message_id,
                 "status": "queued",
                 "attempts": 0,
-                "run_after": datetime.now(timezone.utc).isoformat(),
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "run_after": now_iso,
+                "created_at": now_iso,
+                "updated_at": now_iso,
             }
             if ai_language is not None:
                 payload["ai_language"] = ai_language
 
+            # Only the generated id is used: ask for that column, not the whole row.
             result = self.client.table("ai_jobs").upsert(
                 payload,
                 on_conflict="job_type,account_id,gmail_message_id"
-            ).execute()
+            ).select("id").execute()
 
             if result.data and len(result.data) > 0:
                 job_id = result.data[0].get("id")
@@ -563,6 +1174,60 @@ class SupabaseStore:
             logger.warning(f"AI job enqueue failed: {e}")
             return None
 
+    def enqueue_ai_jobs_bulk(
+        self,
+        jobs,
+        job_type: str = "email_summarize_v1",
+        ai_language: Optional[str] = None,
+    ) -> list:
+        """
+        Enqueue many AI jobs with one upsert per POSTGREST_UPSERT_CHUNK_SIZE rows.
+
+        Same idempotent upsert as enqueue_ai_job() (unique index on
+        job_type, account_id, gmail_message_id), but a sync burst costs one
+        round trip instead of one per message.
+
+        Args:
+            jobs: Iterable of (account_id, gmail_message_id) pairs; duplicates are dropped
+            job_type: Job type identifier (default: "email_summarize_v1")
+            ai_language: Desired output language persisted on every job row
+
+        Returns:
+            List of job ids that were queued (empty on failure)
+        """
+        now_iso = datetime.now(timezone.utc).isoformat()
+        payloads = []
+        for account_id, gmail_message_id in dict.fromkeys(jobs):
+            payload = {
+                "job_type": job_type,
+                "account_id": account_id,
+                "gmail_message_id": gmail_message_id,
+                "status": "queued",
+                "attempts": 0,
+                "run_after": now_iso,
+                "created_at": now_iso,
+                "updated_at": now_iso,
+            }
+            if ai_language is not None:
+                payload["ai_language"] = ai_language
+            payloads.append(payload)
+
+        job_ids = []
+        for i in range(0, len(payloads), POSTGREST_UPSERT_CHUNK_SIZE):
+            chunk = payloads[i : i + POSTGREST_UPSERT_CHUNK_SIZE]
+            try:
+                result = self.client.table("ai_jobs").upsert(
+                    chunk,
+                    on_conflict="job_type,account_id,gmail_message_id"
+                ).select("id").execute()
+                job_ids.extend(row.get("id") for row in (result.data or []) if row.get("id"))
+            except Exception as e:
+                logger.warning(f"AI job bulk enqueue failed ({len(chunk)} job(s), type={job_type}): {e}")
+
+        if job_ids:
+            logger.info(f"[AI-ENQUEUE] {len(job_ids)} {job_type} job(s) queued")
+        return job_ids
+
     def record_observed_category(self, account_id: str, category: Optional[str]) -> None:
         if not account_id or not str(account_id).strip():
             raise ValueError("[INTELLIGENCE-PROFILE] account_id must not be blank")
@@ -863,4 +1528,6 @@ def reset_store_instance() -> None:
     """
     global _store_instance
     with _store_lock:
-        _store_instance = None
\ No newline at end of file
+        _store_instance = None
+        _get_client.cache_clear()
+    invalidate_store_caches()
\ No newline at end of file
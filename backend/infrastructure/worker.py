@@ -3,35 +3,152 @@ import sys
 import time
 import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from backend.infrastructure.control_plane import ControlPlane
+from backend.infrastructure.supabase_store import defer_coalesced_write
 from backend.providers.registry import get_provider
 
 # Schema mismatch retry configuration
 MAX_SCHEMA_RETRIES = 5
 SCHEMA_RETRY_DELAY = 300  # 5 minutes between retry attempts
 
+# Poll interval between cycles: WORKER_POLL_SECONDS after the first empty
+# cycle, doubling per consecutive empty cycle up to WORKER_MAX_POLL_SECONDS;
+# WORKER_ACTIVE_POLL_SECONDS right after a cycle that wrote mail.
+WORKER_POLL_SECONDS = max(1, int(os.getenv("WORKER_POLL_SECONDS", "60")))
+WORKER_ACTIVE_POLL_SECONDS = max(1, int(os.getenv("WORKER_ACTIVE_POLL_SECONDS", "15")))
+WORKER_MAX_POLL_SECONDS = max(WORKER_POLL_SECONDS, int(os.getenv("WORKER_MAX_POLL_SECONDS", "600")))
+
+# Gmail push: each account's mailbox is watched (users.watch) on this Pub/Sub
+# topic and the push endpoint wakes the loop as soon as mail arrives. The
+# adaptive poll above stays as the watchdog. Disabled unless both are set.
+GMAIL_WATCH_TOPIC = (
+    f"projects/{os.getenv('GCP_PROJECT_ID')}/topics/{os.getenv('PUBSUB_TOPIC_ID')}"
+    if os.getenv("GCP_PROJECT_ID") and os.getenv("PUBSUB_TOPIC_ID")
+    else ""
+)
+GMAIL_WATCH_RENEW_SECONDS = 6 * 24 * 3600  # Gmail expires a watch after 7 days
+GMAIL_WATCH_RETRY_SECONDS = 3600
+
+# Accounts synced side by side per cycle (1 = strictly sequential).
+WORKER_ACCOUNT_CONCURRENCY = max(1, int(os.getenv("WORKER_ACCOUNT_CONCURRENCY", "4")))
+
+# LOG_LEVEL=DEBUG turns on per-email ingest lines; unknown values mean INFO.
+WORKER_LOG_LEVEL = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+if not isinstance(WORKER_LOG_LEVEL, int):
+    WORKER_LOG_LEVEL = logging.INFO
+
 # Configure logger for worker process
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+logger.setLevel(WORKER_LOG_LEVEL)
 
 if not logger.handlers:
     handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logging.INFO)
+    handler.setLevel(WORKER_LOG_LEVEL)
     formatter = logging.Formatter("[%(levelname)s] [%(name)s] %(message)s")
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 logger.propagate = False
 
-# Socket.IO for realtime notifications
+# Socket.IO for realtime notifications. Imported on the first emit rather than
+# at module load: backend.api.service pulls in the whole FastAPI app, which a
+# worker that never writes new emails does not need.
+SOCKETIO_AVAILABLE: Optional[bool] = None  # None until the first import attempt
+sio = None
+safe_get_store = None
+
+
+def _load_socketio() -> bool:
+    global SOCKETIO_AVAILABLE, sio, safe_get_store
+    if SOCKETIO_AVAILABLE is None:
+        try:
+            from backend.api.service import sio as _sio, safe_get_store as _safe_get_store
+            sio, safe_get_store = _sio, _safe_get_store
+            SOCKETIO_AVAILABLE = True
+        except ImportError:
+            SOCKETIO_AVAILABLE = False
+            logger.warning("[WORKER] Socket.IO not available - realtime updates disabled")
+    return SOCKETIO_AVAILABLE
+
+
+# One event loop for Socket.IO emits, kept alive on a daemon thread for the
+# life of the process, so an emit does not build and tear down its own loop.
+# Uses uvloop when available (it ships with uvicorn[standard] on Linux).
 try:
-    from backend.api.service import sio, safe_get_store
-    SOCKETIO_AVAILABLE = True
+    import uvloop
 except ImportError:
-    SOCKETIO_AVAILABLE = False
-    logger.warning("[WORKER] Socket.IO not available - realtime updates disabled")
+    uvloop = None
+
+# Emits in flight on the emit loop; further emits are dropped (the frontend
+# refetches on the next emails_updated anyway) rather than queued unbounded.
+EMIT_MAX_PENDING = 100
+_emit_loop: Optional[asyncio.AbstractEventLoop] = None
+_emit_loop_lock = threading.Lock()
+_emit_slots = threading.BoundedSemaphore(EMIT_MAX_PENDING)
+
+
+def _get_emit_loop() -> asyncio.AbstractEventLoop:
+    global _emit_loop
+    if _emit_loop is None:
+        with _emit_loop_lock:
+            if _emit_loop is None:
+                loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+                    # Emits that finish without blocking complete inside
+                    # task creation instead of waiting a loop iteration.
+                    loop.set_task_factory(asyncio.eager_task_factory)
+                threading.Thread(
+                    target=loop.run_forever, name="worker-emit-loop", daemon=True
+                ).start()
+                _emit_loop = loop
+    return _emit_loop
+
+
+def _on_emit_done(future) -> None:
+    _emit_slots.release()
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"[WORKER] Socket.IO emission failed: {error}")
+
+
+def _submit_to_emit_loop(coro) -> bool:
+    """
+    Schedules a coroutine on the shared emit loop without waiting for it.
+
+    Returns False, dropping the coroutine, when EMIT_MAX_PENDING emits are
+    already in flight.
+    """
+    if not _emit_slots.acquire(blocking=False):
+        coro.close()
+        return False
+    asyncio.run_coroutine_threadsafe(coro, _get_emit_loop()).add_done_callback(_on_emit_done)
+    return True
+
+
+def _resolve_user_uid(account_id: str) -> Optional[str]:
+    store = safe_get_store()
+    if not store:
+        return None
+    try:
+        return store.resolve_uid_by_account("gmail", account_id)
+    except Exception:
+        return None
+
+
+async def _emit_emails_updated(account_id: str, payload: Dict[str, Any]) -> None:
+    # The uid lookup is a Supabase read; it runs here, off the ingest path.
+    uid = await asyncio.to_thread(_resolve_user_uid, account_id)
+    if uid:
+        await sio.emit("emails_updated", payload, room=f"user:{uid}")
+    else:
+        await sio.emit("emails_updated", payload)
+
 
 # Shared operational heartbeat - accessible by health check server.
 # In single-process deployments the API and worker share this dict in-memory.
@@ -48,10 +165,59 @@ WORKER_HEARTBEAT: Dict[str, Any] = {
     "last_error_at": None,
     "last_error_type": None,
     "schema_error_count": 0,
+    "restart_count": 0,            # crash restarts by worker_entry.start_worker()
     "last_cycle": None,            # legacy key preserved for existing consumers
+    "last_cycle_monotonic": None,  # same instant on time.monotonic(), for in-process age checks
 }
 
 
+# Set by request_sync_wakeup(); cleared each time the loop wakes.
+_wake_event = threading.Event()
+_watch_lock = threading.Lock()
+_watch_renewed_at: Dict[str, float] = {}
+
+
+def request_sync_wakeup() -> None:
+    """Start the next sync cycle now instead of after the poll sleep."""
+    _wake_event.set()
+
+
+def _wait_for_next_cycle(sleep_s: int) -> bool:
+    """Sleep up to sleep_s seconds; returns True if woken by a push notification."""
+    woken = _wake_event.wait(sleep_s)
+    _wake_event.clear()
+    return woken
+
+
+def _renew_gmail_watch(account_id: str, provider: Any) -> None:
+    """
+    Register (or renew) the Gmail push watch for one account when due.
+
+    Best-effort: a failure only means this account falls back to polling
+    until the next attempt, GMAIL_WATCH_RETRY_SECONDS later.
+    """
+    if not GMAIL_WATCH_TOPIC or not hasattr(provider, "start_watch"):
+        return
+
+    now = time.time()
+    with _watch_lock:
+        if now - _watch_renewed_at.get(account_id, 0.0) < GMAIL_WATCH_RENEW_SECONDS:
+            return
+        _watch_renewed_at[account_id] = now
+
+    try:
+        response = provider.start_watch(account_id, GMAIL_WATCH_TOPIC)
+        logger.info(
+            f"[WORKER] [{account_id}] Gmail watch active until {response.get('expiration')}"
+        )
+    except Exception as e:
+        with _watch_lock:
+            _watch_renewed_at[account_id] = (
+                now - GMAIL_WATCH_RENEW_SECONDS + GMAIL_WATCH_RETRY_SECONDS
+            )
+        logger.warning(f"[WORKER] [{account_id}] Gmail watch registration failed: {e}")
+
+
 
 def _fetch_account_records(
     control: ControlPlane,
@@ -90,26 +256,26 @@ def _fetch_account_records(
 
         provider_name = (row.get("provider") or "gmail").strip().lower()
 
-        
-        delta_cursor = row.get("delta_cursor")
-
-        if not delta_cursor:
-            try:
-                delta_cursor = control.store.get_sync_state(tenant_id, account_id)
-            except Exception as e:
-                logger.warning(
-                    f"[WORKER] [{account_id}] Failed to load legacy gmail_sync_state cursor: {e}"
-                )
-                delta_cursor = None
-
         records.append(
             {
                 "account_id": account_id,
                 "provider": provider_name,
-                "delta_cursor": delta_cursor,
+                "delta_cursor": row.get("delta_cursor"),
             }
         )
 
+    # Accounts without a credentials.delta_cursor fall back to the legacy
+    # gmail_sync_state cursor, read for all of them in one query.
+    legacy_ids = [record["account_id"] for record in records if not record["delta_cursor"]]
+    if legacy_ids:
+        try:
+            legacy_cursors = control.store.get_sync_states(tenant_id, legacy_ids)
+        except Exception as e:
+            logger.warning(f"[WORKER] Failed to load legacy gmail_sync_state cursors: {e}")
+            legacy_cursors = {}
+        for record in records:
+            if not record["delta_cursor"]:
+                record["delta_cursor"] = legacy_cursors.get(record["account_id"])
 
     return records
 
@@ -152,10 +318,11 @@ def _sync_one_account(
     last_cursor: Optional[str],
     control: ControlPlane,
     tenant_id: str,
-) -> None:
+) -> int:
     """
     Run one sync cycle for a single account using provider abstraction.
 
+    Returns the number of emails written this cycle (0 on NO-OP or failure).
     Safe: all per-account exceptions are caught internally.
     A failure here must not halt other accounts.
     """
@@ -165,7 +332,9 @@ def _sync_one_account(
         provider = get_provider(provider_name, control.store, None)
     except ValueError as e:
         logger.error(f"[WORKER] [{account_id}] {e}")
-        return
+        return 0
+
+    _renew_gmail_watch(account_id, provider)
 
     changed_ids_count = 0
     fetched_emails_count = 0
@@ -186,18 +355,18 @@ def _sync_one_account(
                 f"[WORKER] [{account_id}] Provider auth invalid for provider={provider_name}. "
                 f"Re-auth required."
             )
-            return
+            return 0
 
         if "auth_required" in error_text:
             logger.warning(
                 f"[WORKER] [{account_id}] No valid token for provider={provider_name} - skipping account"
             )
-            return
+            return 0
 
         logger.warning(
             f"[WORKER] [{account_id}] Provider sync failed for provider={provider_name}: {e}"
         )
-        return
+        return 0
 
     if not last_cursor:
         logger.info(
@@ -209,7 +378,7 @@ def _sync_one_account(
             f"[WORKER] [{account_id}] NO-OP: cursor unchanged for provider={provider_name} "
             f"({current_cursor[:8]}...)."
         )
-        return
+        return 0
     else:
         fetched_emails_count = len(emails)
         changed_ids_count = fetched_emails_count
@@ -257,10 +426,16 @@ def _sync_one_account(
             logger.warning(f"[WORKER] [{account_id}] Could not query existing emails: {e}")
 
         batch_size = 25
+        document_job_msg_ids: List[str] = []
 
         for i in range(0, len(emails), batch_size):
             batch = emails[i : i + batch_size]
 
+            rows = []
+            planned_ai_jobs = ai_job_count
+            # Fallback date for emails without one: one timestamp per batch.
+            batch_now_iso = datetime.now(timezone.utc).isoformat()
+
             for email in batch:
                 m_id = email.message_id
 
@@ -270,75 +445,80 @@ def _sync_one_account(
                     )
                     continue
 
-                date_val = email.date or datetime.now(timezone.utc).isoformat()
-
                 is_new_email = m_id not in existing_message_ids
-                create_ai_job = is_new_email and ai_job_count < 20
-                new_or_existing = "NEW" if is_new_email else "existing"
-
-                logger.info(
-                    f"[WORKER] [{account_id}] Ingesting ({new_or_existing}) via provider={provider_name}: "
-                    f"{email.subject} (message_id={m_id})"
+                create_ai_job = is_new_email and planned_ai_jobs < 20
+                if create_ai_job:
+                    planned_ai_jobs += 1
+
+                # Per-email line: lazy %-args so nothing is formatted unless DEBUG is on.
+                logger.debug(
+                    "[WORKER] [%s] Ingesting (%s) via provider=%s: %s (message_id=%s)",
+                    account_id, "NEW" if is_new_email else "existing", provider_name,
+                    email.subject, m_id,
                 )
 
-                result = control.store.save_email_atomic(
-                    subject=email.subject or "No Subject",
-                    sender=email.sender or "Unknown",
-                    date=date_val,
-                    body=email.body or "",
-                    message_id=m_id,
-                    tenant_id=tenant_id,
-                    account_id=account_id,
-                    create_ai_job=create_ai_job,
-                    thread_id=email.thread_id,
-                    provider=provider_name,
-                    thread_ref=email.thread_id,
-                    has_attachments=email.has_attachments,
-                )
-                written_count += 1
+                rows.append({
+                    "subject": email.subject or "No Subject",
+                    "sender": email.sender or "Unknown",
+                    "date": email.date or batch_now_iso,
+                    "body": email.body or "",
+                    "message_id": m_id,
+                    "thread_id": email.thread_id,
+                    "thread_ref": email.thread_id,
+                    "has_attachments": email.has_attachments,
+                    "create_ai_job": create_ai_job,
+                })
 
-                if result and result.data:
-                    job_was_created = (
-                        create_ai_job
-                        and result.data.get("job_created")
-                        and not result.data.get("job_existed")
-                    )
-                    if job_was_created:
-                        ai_job_count += 1
-
-                    # Best-effort: enqueue document processing job for new emails.
-                    # This keeps the canonical auto-sync worker aligned with the
-                    # manual /sync-now path and supports attachment-bearing emails
-                    # entering through the normal runtime ingestion loop.
-                    if is_new_email:
-                        try:
-                            document_job_id = control.store.enqueue_ai_job(
-                                account_id=account_id,
-                                gmail_message_id=m_id,
-                                job_type="document_process_v1",
-                            )
-                            if document_job_id:
-                                document_job_count += 1
-                                logger.info(
-                                    f"[WORKER] [{account_id}] Document job queued for provider={provider_name}: "
-                                    f"{m_id[:8]}... (job_id={document_job_id})"
-                                )
-                            else:
-                                logger.warning(
-                                    f"[WORKER] [{account_id}] Document job enqueue returned no job_id "
-                                    f"for provider={provider_name}: {m_id[:8]}..."
-                                )
-                        except Exception as e:
-                            logger.warning(
-                                f"[WORKER] [{account_id}] Document job enqueue failed for "
-                                f"provider={provider_name}: {type(e).__name__}: {e}"
-                            )
-
-            if i + batch_size < len(emails):
+            if not rows:
+                continue
+
+            # One round trip per batch instead of one RPC per email.
+            saved = control.store.save_emails_atomic_bulk(
+                rows,
+                tenant_id=tenant_id,
+                account_id=account_id,
+                provider=provider_name,
+            )
+            written_count += len(rows)
+
+            for row in rows:
+                m_id = row["message_id"]
+                result = saved.get(m_id)
+                if not result:
+                    continue
+
+                job_was_created = (
+                    row["create_ai_job"]
+                    and result.get("job_created")
+                    and not result.get("job_existed")
+                )
+                if job_was_created:
+                    ai_job_count += 1
+
+                # Best-effort: document processing job for new emails,
+                # enqueued for the whole account below in one upsert.
+                # This keeps the canonical auto-sync worker aligned with the
+                # manual /sync-now path and supports attachment-bearing emails
+                # entering through the normal runtime ingestion loop.
+                if m_id not in existing_message_ids:
+                    document_job_msg_ids.append(m_id)
+
+        if document_job_msg_ids:
+            try:
+                document_job_ids = control.store.enqueue_ai_jobs_bulk(
+                    [(account_id, msg_id) for msg_id in document_job_msg_ids],
+                    job_type="document_process_v1",
+                )
+                document_job_count = len(document_job_ids)
                 logger.info(
-                    f"[WORKER] [{account_id}] Batch commit complete. Cooling for 500ms..."
+                    f"[WORKER] [{account_id}] Document jobs queued for provider={provider_name}: "
+                    f"{document_job_count}/{len(document_job_msg_ids)}"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"[WORKER] [{account_id}] Document job enqueue failed for "
+                    f"provider={provider_name}: {type(e).__name__}: {e}"
                 )
-                time.sleep(0.5)
 
         control.log_audit(
             "ingestion_complete",
@@ -357,45 +537,37 @@ def _sync_one_account(
             f"{document_job_count} document job(s) queued"
         )
 
-        if written_count > 0 and SOCKETIO_AVAILABLE:
+        if written_count > 0 and _load_socketio():
             try:
-                uid = None
-                store = safe_get_store()
-                if store:
-                    try:
-                        uid = store.resolve_uid_by_account(
-                            "gmail", account_id)
-                    except Exception:
-                        uid = None
-                if uid:
-                    asyncio.run(
-                        sio.emit(
-                            "emails_updated",
-                            {"count": written_count,
-                             "timestamp": datetime.now(
-                                 timezone.utc).isoformat()},
-                            room=f"user:{uid}"
-                        )
+                payload = {
+                    "count": written_count,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                }
+                # Fire-and-forget: the next account or cycle does not wait on
+                # the uid lookup or the WebSocket fanout.
+                emitted = _submit_to_emit_loop(_emit_emails_updated(account_id, payload))
+                if emitted:
+                    logger.info(
+                        f"[WORKER] [{account_id}] Socket.IO event queued: emails_updated "
+                        f"(count={written_count})"
                     )
                 else:
-                    asyncio.run(
-                        sio.emit(
-                            "emails_updated",
-                            {"count": written_count,
-                             "timestamp": datetime.now(
-                                 timezone.utc).isoformat()}
-                        )
+                    logger.warning(
+                        f"[WORKER] [{account_id}] Socket.IO emit backlog full "
+                        f"({EMIT_MAX_PENDING} pending) - dropped emails_updated"
                     )
-                emitted = True
-                logger.info(
-                    f"[WORKER] [{account_id}] Socket.IO event emitted: emails_updated "
-                    f"(count={written_count})"
-                )
             except Exception as e:
                 logger.warning(f"[WORKER] [{account_id}] Socket.IO emission failed: {e}")
 
     if current_cursor:
-        _save_delta_cursor(control, provider_name, account_id, current_cursor)
+        # Off the per-account critical path: the loop moves on to the next
+        # account while the cursor is written. A lost write only means a
+        # slightly wider delta fetch next cycle.
+        defer_coalesced_write(
+            ("credentials.delta_cursor", provider_name, account_id),
+            current_cursor,
+            lambda cursor: _save_delta_cursor(control, provider_name, account_id, cursor),
+        )
 
     logger.info(
         f"[WORKER] [{account_id}] Counters: provider={provider_name}, "
@@ -404,6 +576,63 @@ def _sync_one_account(
         f"ai_jobs={ai_job_count}, document_jobs={document_job_count}"
     )
 
+    return written_count
+
+
+def _sync_record(record: Dict[str, Optional[str]], control: ControlPlane, tenant_id: str) -> int:
+    account_id = record.get("account_id")
+    provider_name = record.get("provider") or "gmail"
+    last_cursor = record.get("delta_cursor")
+
+    if not account_id:
+        logger.warning("[WORKER] Skipping credential record with missing account_id")
+        return 0
+
+    try:
+        return _sync_one_account(account_id, provider_name, last_cursor, control, tenant_id) or 0
+    except Exception as e:
+        logger.error(
+            f"[WORKER] [{account_id}] Unhandled error during sync for provider={provider_name}: {e}"
+        )
+        return 0
+
+
+def _sync_accounts(
+    account_records: List[Dict[str, Optional[str]]],
+    control: ControlPlane,
+    tenant_id: str,
+) -> int:
+    """
+    Sync every account for one cycle, up to WORKER_ACCOUNT_CONCURRENCY at a time.
+
+    Each account's work is network-bound (Gmail fetch, then Supabase writes),
+    so running a few accounts side by side overlaps one account's Gmail fetch
+    with another's Supabase writes. Accounts share no state; a failure stays
+    contained to its own account.
+
+    Returns the total number of emails written across all accounts.
+    """
+    workers = min(WORKER_ACCOUNT_CONCURRENCY, len(account_records))
+    if workers <= 1:
+        return sum(_sync_record(record, control, tenant_id) for record in account_records)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="worker-sync") as pool:
+        return sum(pool.map(lambda record: _sync_record(record, control, tenant_id), account_records))
+
+
+def _next_poll_interval(written_count: int, idle_streak: int) -> Tuple[int, int]:
+    """
+    Pick the sleep before the next cycle and the updated idle streak.
+
+    A cycle that wrote mail polls again soon to catch the rest of a burst;
+    each consecutive empty cycle doubles the wait, capped so a quiet mailbox
+    is still checked every WORKER_MAX_POLL_SECONDS.
+    """
+    if written_count > 0:
+        return WORKER_ACTIVE_POLL_SECONDS, 0
+    sleep_s = min(WORKER_POLL_SECONDS * (2 ** min(idle_streak, 16)), WORKER_MAX_POLL_SECONDS)
+    return sleep_s, idle_streak + 1
+
 
 def run_worker_loop():
     """
@@ -436,6 +665,7 @@ def run_worker_loop():
 
         WORKER_HEARTBEAT.update({
             "last_cycle": time.time(),
+            "last_cycle_monotonic": time.monotonic(),
             "schema_error_count": schema_retry_count,
             "status": "schema_retry",
         })
@@ -454,12 +684,14 @@ def run_worker_loop():
     WORKER_HEARTBEAT["status"] = "running"
 
     tenant_id = "primary"
+    idle_streak = 0
 
     while True:
         try:
             _now = time.time()
             WORKER_HEARTBEAT["last_cycle"] = _now
             WORKER_HEARTBEAT["last_cycle_started_at"] = _now
+            WORKER_HEARTBEAT["last_cycle_monotonic"] = time.monotonic()
 
             if not control.is_worker_enabled():
                 logger.info("[WORKER] Ingestion suspended by ControlPlane policy.")
@@ -469,7 +701,6 @@ def run_worker_loop():
 
             logger.info(f"[WORKER] Cycle started: {time.strftime('%Y-%m-%d %H:%M:%S')}")
             WORKER_HEARTBEAT["status"] = "running"
-            control.log_audit("cycle_start", "provider_ingest")
 
             try:
                 account_records = _fetch_account_records(control, tenant_id)
@@ -490,30 +721,31 @@ def run_worker_loop():
             WORKER_HEARTBEAT["last_account_count"] = len(account_records)
             logger.info(f"[WORKER] Processing {len(account_records)} account(s) this cycle")
 
-            for record in account_records:
-                account_id = record.get("account_id")
-                provider_name = record.get("provider") or "gmail"
-                last_cursor = record.get("delta_cursor")
-
-                if not account_id:
-                    logger.warning("[WORKER] Skipping credential record with missing account_id")
-                    continue
+            written_count = _sync_accounts(account_records, control, tenant_id)
+            sleep_s, idle_streak = _next_poll_interval(written_count, idle_streak)
 
-                try:
-                    _sync_one_account(account_id, provider_name, last_cursor, control, tenant_id)
-                except Exception as e:
-                    logger.error(
-                        f"[WORKER] [{account_id}] Unhandled error during sync for provider={provider_name}: {e}"
-                    )
+            # Audited only when the cycle ingested mail, so a NO-OP cycle
+            # makes no Supabase write at all.
+            if written_count > 0:
+                control.log_audit(
+                    "cycle_complete",
+                    "provider_ingest",
+                    {"accounts": len(account_records), "count": written_count},
+                )
 
-            logger.info("[WORKER] Cycle complete - sleeping 60s")
+            logger.info(
+                f"[WORKER] Cycle complete - {written_count} email(s) written, "
+                f"sleeping {sleep_s}s (idle_streak={idle_streak})"
+            )
             _now = time.time()
             WORKER_HEARTBEAT.update({
                 "status": "idle",
                 "last_cycle_completed_at": _now,
                 "last_success_ts": _now,
+                "next_poll_seconds": sleep_s,
             })
-            time.sleep(60)
+            if _wait_for_next_cycle(sleep_s):
+                logger.info("[WORKER] Woken early by Gmail push notification")
 
         except Exception as e:
             logger.error(f"[WORKER] ERROR: {e}")
@@ -5,10 +5,61 @@ Provides JWT-based authentication for WebSocket connections.
 Prevents unauthorized access to real-time updates.
 """
 
+import re
+import threading
+import time
 import socketio
-from typing import Optional
+from collections import OrderedDict
+from http.cookies import CookieError, SimpleCookie
+from urllib.parse import unquote
+from typing import Dict, Optional
 from backend.auth.jwt_service import JWTService
 
+# auth_token=<value> as a whole cookie (not a suffix of another cookie name);
+# surrounding whitespace is excluded from the captured value.
+_AUTH_TOKEN_RE = re.compile(r'(?:^|;)\s*auth_token=([^;]*?)\s*(?=;|$)')
+
+# Verified payloads only (token -> (expires_at, payload)), LRU-bounded. Rejected
+# tokens are never stored, so garbage tokens cannot evict valid entries and a
+# token rejected for a time-based claim (nbf/iat) is re-checked next connect.
+VERIFY_CACHE_MAXSIZE = 4096
+VERIFY_CACHE_TTL_SECONDS = 300
+_verified_tokens: "OrderedDict[str, tuple]" = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+def _verify_token(token: str) -> Optional[Dict]:
+    """
+    Verify a JWT, reusing the decoded payload for tokens already verified.
+
+    Reconnect storms present the same token repeatedly; only its first
+    connect pays for the signature check. An entry lives until the token's
+    exp or VERIFY_CACHE_TTL_SECONDS, whichever is first. Callers get their
+    own copy of the payload.
+    """
+    now = time.time()
+    with _verified_tokens_lock:
+        entry = _verified_tokens.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                _verified_tokens.move_to_end(token)
+                return dict(entry[1])
+            del _verified_tokens[token]
+
+    payload = JWTService.verify_token(token)
+    if payload is None:
+        return None
+    expires_at = now + VERIFY_CACHE_TTL_SECONDS
+    exp = payload.get('exp')
+    if exp is not None:
+        expires_at = min(expires_at, exp)
+    with _verified_tokens_lock:
+        _verified_tokens[token] = (expires_at, payload)
+        _verified_tokens.move_to_end(token)
+        while len(_verified_tokens) > VERIFY_CACHE_MAXSIZE:
+            _verified_tokens.popitem(last=False)
+    return dict(payload)
+
 
 async def authenticate_socket(sid: str, environ: dict) -> bool:
     """
@@ -27,24 +78,15 @@ async def authenticate_socket(sid: str, environ: dict) -> bool:
     Returns:
         True if authenticated, False otherwise
     """
-    # Extract cookies from environ
-    cookies = environ.get('HTTP_COOKIE', '')
-    token = None
-    
-    # Parse auth_token from cookies
-    for cookie in cookies.split(';'):
-        cookie = cookie.strip()
-        if cookie.startswith('auth_token='):
-            token = cookie.split('auth_token=')[1]
-            break
+    # Extract auth_token from the cookie header
+    token = extract_token_from_cookie(environ.get('HTTP_COOKIE', ''))
     
     if not token:
         print(f"[WebSocket Auth] No token found for {sid}")
         return False
     
     # Verify JWT
-    jwt_service = JWTService()
-    payload = jwt_service.verify_token(token)
+    payload = _verify_token(token)
     
     if not payload:
         print(f"[WebSocket Auth] Invalid token for {sid}")
@@ -71,9 +113,19 @@ def extract_token_from_cookie(cookie_header: str) -> Optional[str]:
     if not cookie_header:
         return None
     
-    for cookie in cookie_header.split(';'):
-        cookie = cookie.strip()
-        if cookie.startswith('auth_token='):
-            return cookie.split('auth_token=')[1]
-    
-    return None
+    match = _AUTH_TOKEN_RE.search(cookie_header)
+    if not match:
+        return None
+    raw = match.group(1)
+    # A bare JWT never contains '"' or '%'; only then pay for the full parsers
+    if '"' in raw:
+        cookie = SimpleCookie()
+        try:
+            cookie.load(cookie_header)
+        except CookieError:
+            return raw.strip('"')
+        morsel = cookie.get("auth_token")
+        return morsel.value if morsel else raw.strip('"')
+    if '%' in raw:
+        return unquote(raw)
+    return raw
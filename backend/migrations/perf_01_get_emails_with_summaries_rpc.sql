@@ -0,0 +1,72 @@
+-- Migration: perf_01_get_emails_with_summaries_rpc.sql
+-- Purpose : Serve SupabaseStore.get_emails_with_summaries() in one round trip.
+--
+-- Why this function exists
+-- ------------------------
+-- get_emails_with_summaries() used to issue two serial PostgREST queries
+-- (emails, then email_ai_summaries .in_(gmail_message_id, ...)) and merge the
+-- results in Python. This function performs the same merge server-side with a
+-- LEFT JOIN LATERAL so the API pays a single request per inbox load.
+--
+-- Summary resolution matches backend/utils/summary_utils.py
+-- resolve_summary_for_language():
+--   1. preferred language
+--   2. English fallback
+--   3. newest row (updated_at DESC)
+-- Only rows for the requested prompt_version are considered, which keeps
+-- document-summary rows (DOCUMENT_SUMMARY_PROMPT_VERSION) out of the result.
+--
+-- Output shape
+-- ------------
+-- One jsonb object per email: every emails column (minus the derived
+-- search_vector tsvector, which the API never reads) plus the flattened
+-- ai_summary_* / ai_preferred_language* keys the Python path produced.
+-- p_account_id NULL returns emails across all accounts (legacy behaviour).
+--
+-- The Python caller falls back to the two-query path if this function has
+-- not been deployed yet, so applying this migration is safe at any time.
+
+CREATE OR REPLACE FUNCTION public.get_emails_with_summaries(
+    p_account_id         text,
+    p_limit              integer DEFAULT 50,
+    p_preferred_language text    DEFAULT 'en',
+    p_prompt_version     text    DEFAULT NULL
+)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT
+        (to_jsonb(e) - 'search_vector') || jsonb_build_object(
+            'ai_summary_json',     s.summary_json,
+            'ai_summary_text',     s.summary_text,
+            'ai_summary_model',    s.model,
+            'ai_summary_language', s.lang,
+            'ai_summary_is_fallback',
+                COALESCE(s.lang <> p_preferred_language, false),
+            'ai_preferred_language', p_preferred_language,
+            'ai_preferred_language_available',
+                COALESCE(s.lang = p_preferred_language, false)
+        )
+    FROM public.emails e
+    LEFT JOIN LATERAL (
+        SELECT
+            x.summary_json,
+            x.summary_text,
+            x.model,
+            COALESCE(x.summary_language, 'en') AS lang
+        FROM public.email_ai_summaries x
+        WHERE x.account_id = e.account_id
+          AND x.gmail_message_id = e.gmail_message_id
+          AND (p_prompt_version IS NULL OR x.prompt_version = p_prompt_version)
+        ORDER BY
+            (COALESCE(x.summary_language, 'en') = p_preferred_language) DESC,
+            (COALESCE(x.summary_language, 'en') = 'en') DESC,
+            x.updated_at DESC NULLS LAST
+        LIMIT 1
+    ) s ON true
+    WHERE p_account_id IS NULL OR e.account_id = p_account_id
+    ORDER BY e.date DESC
+    LIMIT GREATEST(COALESCE(p_limit, 50), 1);
+$$;
@@ -0,0 +1,39 @@
+-- Migration: perf_02_credentials_encrypted_payload_jsonb.sql
+-- Purpose : Store credentials.encrypted_payload as a real JSONB object.
+--
+-- Background
+-- ----------
+-- SupabaseStore.save_credential() used to json.dumps() the payload before the
+-- upsert and get_credential() json.loads()'d it on every read. Against the
+-- JSONB column declared in sql/setup_schema.sql that produced a JSON *string*
+-- scalar (double-encoded); deployments that created the column as TEXT stored
+-- the same text. The store now sends and receives the object directly, so the
+-- client serializes it once as part of the request body.
+--
+-- This migration:
+--   1. converts a TEXT column to JSONB (no-op when already JSONB)
+--   2. unwraps legacy string-scalar rows into JSON objects
+--
+-- get_credential() still accepts string payloads, so rows written by older
+-- code continue to load while this migration is pending. Idempotent.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name   = 'credentials'
+          AND column_name  = 'encrypted_payload'
+          AND data_type    = 'text'
+    ) THEN
+        ALTER TABLE public.credentials
+            ALTER COLUMN encrypted_payload TYPE jsonb
+            USING encrypted_payload::jsonb;
+    END IF;
+END
+$$;
+
+UPDATE public.credentials
+SET encrypted_payload = (encrypted_payload #>> '{}')::jsonb
+WHERE jsonb_typeof(encrypted_payload) = 'string';
@@ -0,0 +1,46 @@
+-- Migration: perf_03_credentials_scopes_text_array.sql
+-- Purpose : Store credentials.scopes as text[] instead of comma-separated TEXT.
+--
+-- SupabaseStore.save_credential() used to ",".join() the scope list and every
+-- get_credential()/list_credentials() row split it back apart in Python. With
+-- a native array column PostgREST returns a JSON list that is used as-is, and
+-- scope containment queries (scopes @> ARRAY[...]) become indexable.
+--
+-- The store still splits string values, so reads keep working on databases
+-- where this migration has not been applied yet. Rows written by the list-
+-- sending save_credential() before this migration hold JSON array text
+-- ('["a","b"]'); those are flattened to the comma form first so the cast
+-- below does not keep the brackets and quotes. Idempotent.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name   = 'credentials'
+          AND column_name  = 'scopes'
+          AND data_type    = 'text'
+    ) THEN
+        -- ALTER ... USING cannot contain subqueries, so decode JSON text here
+        UPDATE public.credentials
+           SET scopes = array_to_string(
+                   ARRAY(SELECT jsonb_array_elements_text(scopes::jsonb)), ','
+               )
+         WHERE scopes LIKE '[%]';
+
+        ALTER TABLE public.credentials ALTER COLUMN scopes DROP DEFAULT;
+        ALTER TABLE public.credentials
+            ALTER COLUMN scopes TYPE text[]
+            USING COALESCE(
+                array_remove(string_to_array(replace(scopes, ' ', ''), ','), ''),
+                '{}'
+            );
+    END IF;
+END
+$$;
+
+UPDATE public.credentials SET scopes = '{}' WHERE scopes IS NULL;
+
+ALTER TABLE public.credentials ALTER COLUMN scopes SET DEFAULT '{}';
+ALTER TABLE public.credentials ALTER COLUMN scopes SET NOT NULL;
@@ -0,0 +1,25 @@
+-- Migration: perf_04_emails_account_date_index.sql
+-- Purpose : Index the inbox read path: emails filtered by account_id, ordered
+--           by date DESC, LIMIT n (SupabaseStore.get_emails,
+--           get_emails_with_summaries and its RPC).
+--
+-- Without this index Postgres satisfies the query from
+-- emails_account_gmail_message_id_uq (or a seq scan) and then sorts every row
+-- of the account before applying the LIMIT. With (account_id, date DESC) the
+-- first n index entries are already in order, so only n heap rows are read.
+--
+-- Why no INCLUDE (... body ...)
+-- -----------------------------
+-- A covering index that carries subject/sender/body would turn this into an
+-- index-only scan, but body is unbounded TEXT: btree tuples are limited to
+-- ~2.7 kB, so long emails would make INSERTs into emails fail. The summaries
+-- lookup is already served by email_ai_summaries_uq
+-- (account_id, gmail_message_id, prompt_version, summary_language), and its
+-- summary_json/summary_text payloads have the same size problem.
+--
+-- On a large live table prefer running the statement on its own as
+-- CREATE INDEX CONCURRENTLY (outside a transaction) to avoid blocking writes.
+-- Idempotent.
+
+CREATE INDEX IF NOT EXISTS emails_account_date_idx
+ON public.emails (account_id, date DESC);
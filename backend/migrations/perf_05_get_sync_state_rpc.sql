@@ -0,0 +1,27 @@
+-- Migration: perf_05_get_sync_state_rpc.sql
+-- Purpose : Serve SupabaseStore.get_sync_state() through a STABLE SQL function.
+--
+-- The worker reads the gmail_sync_state cursor for every account on every
+-- sync tick. As a table read, PostgREST builds and parses the filtered query
+-- per request. As a SQL function it is one fixed parameterised statement
+-- whose plan Postgres caches per connection.
+--
+-- Returns the last_history_id text, or NULL when no cursor exists.
+-- The Python caller falls back to the table read if this function has not
+-- been deployed (PGRST202), so applying this migration is safe at any time.
+
+CREATE OR REPLACE FUNCTION public.get_sync_state(
+    p_tenant_id  text,
+    p_account_id text
+)
+RETURNS text
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT last_history_id
+    FROM public.gmail_sync_state
+    WHERE tenant_id = p_tenant_id
+      AND account_id = p_account_id
+    LIMIT 1;
+$$;
@@ -0,0 +1,62 @@
+-- Migration: perf_06_save_emails_with_ai_jobs_bulk_rpc.sql
+-- Purpose : Serve SupabaseStore.save_emails_atomic_bulk() in one round trip.
+--
+-- The worker used to call save_email_with_ai_job_v2 once per email, so a
+-- 25-email batch cost 25 PostgREST requests. This function takes the whole
+-- batch as a jsonb array and applies save_email_with_ai_job_v2 to each item
+-- inside a single transaction, keeping the exact per-row semantics (upsert on
+-- account_id + gmail_message_id, conditional email_summarize_v1 job).
+--
+-- Input item keys: subject, sender, date, body, message_id, thread_id,
+-- thread_ref, has_attachments, create_ai_job.
+--
+-- Output: jsonb array, one object per input item, in input order:
+--   {message_id, email_id, job_id, job_existed, job_created}
+--
+-- A failing row aborts the batch; the Python caller then retries the batch
+-- row by row through save_email_with_ai_job_v2 so one bad email cannot block
+-- the rest. The caller also falls back to the per-row path if this function
+-- has not been deployed (PGRST202), so applying this migration is safe at any
+-- time. Requires p5_5_attachment_presence_foundation.sql.
+
+CREATE OR REPLACE FUNCTION public.save_emails_with_ai_jobs_v1(
+  p_emails     jsonb,
+  p_account_id text,
+  p_tenant_id  text,
+  p_provider   text DEFAULT 'gmail'
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_item    jsonb;
+  v_result  json;
+  v_results jsonb := '[]'::jsonb;
+BEGIN
+  FOR v_item IN SELECT value FROM jsonb_array_elements(p_emails)
+  LOOP
+    v_result := save_email_with_ai_job_v2(
+      v_item->>'subject',
+      v_item->>'sender',
+      (v_item->>'date')::timestamptz,
+      COALESCE(v_item->>'body', ''),
+      v_item->>'message_id',
+      p_account_id,
+      p_tenant_id,
+      v_item->>'thread_id',
+      p_provider,
+      v_item->>'thread_ref',
+      COALESCE((v_item->>'create_ai_job')::boolean, false),
+      COALESCE((v_item->>'has_attachments')::boolean, false)
+    );
+
+    v_results := v_results || jsonb_build_array(
+      jsonb_build_object('message_id', v_item->>'message_id') || v_result::jsonb
+    );
+  END LOOP;
+
+  RETURN v_results;
+END;
+$$;
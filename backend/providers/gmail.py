@@ -1,8 +1,11 @@
 import base64
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from backend.api.gmail_client import GmailClient as WorkerGmailClient
 from backend.auth.credential_store import CredentialStore
@@ -10,10 +13,28 @@ from backend.core import EmailAssistant
 from backend.data.store import PersistenceManager
 from backend.integrations.gmail import GmailClient as RichGmailClient
 from backend.providers.base import EmailProvider, NormalizedEmail
-from backend.services.gmail_engine import get_message_body, gmail_payload_has_attachments
+from backend.services.gmail_engine import (
+    extract_headers,
+    get_message_body,
+    gmail_payload_has_attachments,
+)
 
 logger = logging.getLogger(__name__)
 
+# One idle Gmail API client per account, reused across worker cycles so the
+# discovery build and the client's keep-alive HTTPS connection survive
+# between polls. A client is checked out while in use (httplib2 is not
+# thread-safe); a concurrent caller for the same account builds its own.
+_IDLE_WORKER_CLIENTS: Dict[str, Tuple[Tuple[Any, ...], WorkerGmailClient]] = {}
+_IDLE_WORKER_CLIENTS_LOCK = threading.Lock()
+
+# Decrypted token data for the worker's polling paths, so each cycle skips the
+# credential read and Fernet decrypts. Any failed Gmail call drops the entry,
+# so a revoked or rotated grant is re-read on the next cycle.
+TOKEN_DATA_CACHE_TTL_SECONDS = 3600
+_TOKEN_DATA_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_TOKEN_DATA_CACHE_LOCK = threading.Lock()
+
 
 class GmailProvider(EmailProvider):
     def __init__(self, supabase=None, security_manager=None):
@@ -25,6 +46,19 @@ class GmailProvider(EmailProvider):
         credential_store = CredentialStore(persistence)
         return credential_store.load_credentials(account_id) or {}
 
+    def _load_cached_token_data(self, account_id: str) -> Dict[str, Any]:
+        now = time.monotonic()
+        with _TOKEN_DATA_CACHE_LOCK:
+            cached = _TOKEN_DATA_CACHE.get(account_id)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        token_data = self._load_token_data(account_id)
+        if token_data and "token" in token_data:
+            with _TOKEN_DATA_CACHE_LOCK:
+                _TOKEN_DATA_CACHE[account_id] = (now + TOKEN_DATA_CACHE_TTL_SECONDS, token_data)
+        return token_data
+
     def _build_worker_token_data(self, token_data: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "access_token": token_data.get("token"),
@@ -35,6 +69,42 @@ class GmailProvider(EmailProvider):
             "scopes": token_data.get("scopes", []),
         }
 
+    @staticmethod
+    def _worker_client_key(token_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        # The access token is left out: the cached client refreshes its own
+        # token, so only a re-auth (new grant or OAuth client) forces a rebuild.
+        return (
+            token_data.get("refresh_token") or token_data.get("token"),
+            token_data.get("client_id"),
+            tuple(token_data.get("scopes") or ()),
+        )
+
+    @contextmanager
+    def _worker_client(
+        self,
+        account_id: str,
+        token_data: Dict[str, Any],
+    ) -> Iterator[WorkerGmailClient]:
+        key = self._worker_client_key(token_data)
+        with _IDLE_WORKER_CLIENTS_LOCK:
+            cached = _IDLE_WORKER_CLIENTS.pop(account_id, None)
+
+        if cached and cached[0] == key:
+            gmail_client = cached[1]
+        else:
+            gmail_client = WorkerGmailClient(self._build_worker_token_data(token_data))
+
+        try:
+            yield gmail_client
+        except Exception:
+            with _TOKEN_DATA_CACHE_LOCK:
+                _TOKEN_DATA_CACHE.pop(account_id, None)
+            raise
+
+        # Only a client whose calls succeeded goes back to the pool.
+        with _IDLE_WORKER_CLIENTS_LOCK:
+            _IDLE_WORKER_CLIENTS[account_id] = (key, gmail_client)
+
     def _normalize_date(
         self,
         date_header: Optional[str],
@@ -77,18 +147,10 @@ class GmailProvider(EmailProvider):
         payload = raw_msg.get("payload", {})
         headers = payload.get("headers", [])
 
-        subject = next(
-            (h["value"] for h in headers if h["name"].lower() == "subject"),
-            "No Subject",
-        )
-        sender = next(
-            (h["value"] for h in headers if h["name"].lower() == "from"),
-            "Unknown",
-        )
-        date_header = next(
-            (h["value"] for h in headers if h["name"].lower() == "date"),
-            None,
-        )
+        hdrs = extract_headers(headers)
+        subject = hdrs.get("subject", "No Subject")
+        sender = hdrs.get("from", "Unknown")
+        date_header = hdrs.get("date")
         date_iso = self._normalize_date(date_header, raw_msg.get("internalDate"))
 
         raw_body = get_message_body(payload)
@@ -143,11 +205,19 @@ class GmailProvider(EmailProvider):
         account_id: str,
         cursor: Optional[str],
     ) -> Tuple[List[NormalizedEmail], Optional[str]]:
-        token_data = self._load_token_data(account_id)
+        token_data = self._load_cached_token_data(account_id)
         if not token_data or "token" not in token_data:
             raise RuntimeError("auth_required")
 
-        gmail_client = WorkerGmailClient(self._build_worker_token_data(token_data))
+        with self._worker_client(account_id, token_data) as gmail_client:
+            return self._get_delta_emails(gmail_client, account_id, cursor)
+
+    def _get_delta_emails(
+        self,
+        gmail_client: WorkerGmailClient,
+        account_id: str,
+        cursor: Optional[str],
+    ) -> Tuple[List[NormalizedEmail], Optional[str]]:
         current_cursor = gmail_client.get_current_history_id()
 
         if not current_cursor:
@@ -176,20 +246,19 @@ class GmailProvider(EmailProvider):
         if not message_ids:
             return [], current_cursor
 
+        # One batched HTTP request per MESSAGE_BATCH_SIZE ids instead of one per message.
+        raw_messages = gmail_client.get_messages_batch(message_ids)
+
         normalized: List[NormalizedEmail] = []
         for message_id in message_ids:
-            try:
-                raw_msg = gmail_client.get_message(message_id)
-            except RuntimeError as e:
-                err_str = str(e)
-                if "Requested entity was not found" in err_str or "notFound" in err_str:
-                    logger.warning(
-                        "[GmailProvider] Message not found, skipping: account=%s msg=%s...",
-                        account_id,
-                        message_id[:8],
-                    )
-                    continue
-                raise
+            raw_msg = raw_messages.get(message_id)
+            if raw_msg is None:
+                logger.warning(
+                    "[GmailProvider] Message not found, skipping: account=%s msg=%s...",
+                    account_id,
+                    message_id[:8],
+                )
+                continue
             item = self._normalize_raw_message(raw_msg)
             if item and item.message_id:
                 normalized.append(item)
@@ -277,6 +346,14 @@ class GmailProvider(EmailProvider):
 
         return result.get("message_id", "")
 
+    def start_watch(self, account_id: str, topic_name: str) -> Dict[str, Any]:
+        token_data = self._load_cached_token_data(account_id)
+        if not token_data or "token" not in token_data:
+            raise RuntimeError("auth_required")
+
+        with self._worker_client(account_id, token_data) as gmail_client:
+            return gmail_client.start_watch(topic_name, ["INBOX"])
+
     def refresh_token(self, account_id: str) -> None:
         token_data = self._load_token_data(account_id)
         if not token_data or "token" not in token_data:
@@ -51,8 +51,14 @@ def finalize_phase_1():
             "scopes": list(creds.scopes),
         }
 
-        with open(STORE_PATH, "w") as f:
-            json.dump(payload, f, indent=2)
+        # Temp file + fsync + os.replace: a crash mid-write leaves either the
+        # old store.json or the new one, never a truncated file
+        temp_path = f"{STORE_PATH}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(json.dumps(payload))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, STORE_PATH)
         
         print(f"✅ SUCCESS: Credentials stored safely at {STORE_PATH}")
         return True
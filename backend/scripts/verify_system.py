@@ -17,6 +17,9 @@ import requests
 from cryptography.fernet import Fernet
 from dotenv import load_dotenv
 
+# Shared session: repeated probes from the same process reuse the connection
+_SESSION = requests.Session()
+
 
 def fail(msg):
     """Fail-fast with error message and exit"""
@@ -96,7 +99,8 @@ def main():
     print(f"    - Target: {base_url}/health")
 
     try:
-        res = requests.get(f"{base_url}/health", timeout=10)
+        # (connect, read): an unreachable host fails in 3s, a slow one gets 7s more
+        res = _SESSION.get(f"{base_url}/health", timeout=(3, 7))
 
         if res.status_code != 200:
             fail(f"Health endpoint returned {res.status_code} (expected 200)")
@@ -14,6 +14,7 @@ If encryption fails, the system MUST refuse to start.
 
 import os
 import logging
+import threading
 from typing import Optional
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -99,7 +100,8 @@ class SecurityManager:
         Raises:
             SecurityManagerError: If encryption fails or cipher is not initialized
         """
-        if not self._key_loaded or self._cipher is None:
+        # __init__ either loads the cipher or raises; python -O strips this check.
+        if __debug__ and (not self._key_loaded or self._cipher is None):
             logger.critical("[FAIL] [SECURITY] Attempted to encrypt token with uninitialized cipher")
             raise SecurityManagerError("Cipher not initialized. Cannot encrypt tokens.")
 
@@ -137,11 +139,13 @@ class SecurityManager:
         Raises:
             SecurityManagerError: If decryption fails or token is invalid
         """
-        if not self._key_loaded or self._cipher is None:
+        # __init__ either loads the cipher or raises; python -O strips this check.
+        if __debug__ and (not self._key_loaded or self._cipher is None):
             logger.critical("[FAIL] [SECURITY] Attempted to decrypt token with uninitialized cipher")
             raise SecurityManagerError("Cipher not initialized. Cannot decrypt tokens.")
 
-        if not encrypted_token or not encrypted_token.strip():
+        # Whitespace-only input fails Fernet's own InvalidToken path below.
+        if not encrypted_token:
             raise SecurityManagerError("Cannot decrypt empty token")
 
         try:
@@ -188,6 +192,7 @@ class SecurityManager:
 
 # Singleton instance for application-wide use
 _security_manager_instance: Optional[SecurityManager] = None
+_security_manager_lock = threading.Lock()
 
 
 def get_security_manager() -> SecurityManager:
@@ -205,8 +210,11 @@ def get_security_manager() -> SecurityManager:
     global _security_manager_instance
 
     if _security_manager_instance is None:
-        logger.info("🔐 [SECURITY] Initializing SecurityManager singleton...")
-        _security_manager_instance = SecurityManager()
+        # Worker threads sync accounts concurrently; only one builds the cipher.
+        with _security_manager_lock:
+            if _security_manager_instance is None:
+                logger.info("🔐 [SECURITY] Initializing SecurityManager singleton...")
+                _security_manager_instance = SecurityManager()
 
     return _security_manager_instance
 
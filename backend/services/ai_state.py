@@ -1,6 +1,9 @@
+import logging
 import os
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class AIState:
     """
@@ -19,60 +22,61 @@ class AIState:
     DEGRADED_DWELL_SECONDS = 300
 
     # --------------- Internal state ----------------------------------------
-    _state = None
-    _last_checked = 0.0
-    _degraded_since = 0.0
+    # (state, degraded_since, last_checked), replaced with one assignment so
+    # request threads and the worker never read a torn mix of old and new
+    # fields.  None until _initialize() runs.
+    _snapshot = None
     _last_logged_state = None
-    _initialized = False
 
     # --------------- Initialization ----------------------------------------
     @classmethod
     def _initialize(cls):
         """Runs exactly once on first access.  Order is strict and locked."""
-        if cls._initialized:
+        if cls._snapshot is not None:
             return
-        cls._initialized = True
-        now = time.time()
-        cls._last_checked = now
+        now = time.monotonic()
 
         # 1. AI_ENABLED=false  →  DISABLED (precedence-absolute, terminal)
         if os.getenv("AI_ENABLED", "").lower() == "false":
-            cls._state = cls.DISABLED
-            cls._degraded_since = 0.0
+            cls._snapshot = (cls.DISABLED, 0.0, now)
             cls._emit("AI explicitly disabled via AI_ENABLED=false")
             return
 
         # 2. MISTRAL_API_KEY missing or empty  →  DEGRADED
         if not os.getenv("MISTRAL_API_KEY", "").strip():
-            cls._state = cls.DEGRADED
-            cls._degraded_since = now
+            cls._snapshot = (cls.DEGRADED, now, now)
             cls._emit("AI key missing — demo mode active")
             return
 
         # 3. Key present  →  ACTIVE (tentative)
-        cls._state = cls.ACTIVE
-        cls._degraded_since = 0.0
+        cls._snapshot = (cls.ACTIVE, 0.0, now)
         cls._emit("AI key detected — AI active (unconfirmed)")
 
     # --------------- Logging -----------------------------------------------
     @classmethod
     def _emit(cls, message: str):
-        """Prints once per state.  Repeated logs for the same state are suppressed."""
-        if cls._last_logged_state != cls._state:
-            print(f"[AI_STATE] {message}")
-            cls._last_logged_state = cls._state
+        """Logs once per state.  Repeated logs for the same state are suppressed."""
+        state = cls._snapshot[0]
+        if cls._last_logged_state != state:
+            logger.info("[AI_STATE] %s", message)
+            cls._last_logged_state = state
 
     # --------------- Public API --------------------------------------------
     @classmethod
     def state(cls) -> str:
         """Returns current state.  Performs TTL re-check if needed.  Never raises."""
+        snapshot = cls._snapshot
+        # Fast path: inside the TTL window nothing can change, skip the recheck
+        if snapshot is not None and (time.monotonic() - snapshot[2]) < cls.TTL_SECONDS:
+            return snapshot[0]
         try:
-            if not cls._initialized:
+            if snapshot is None:
                 cls._initialize()
             cls.maybe_recheck()
-            return cls._state
+            return cls._snapshot[0]
         except Exception:
-            return cls._state if cls._state else cls.DEGRADED
+            snapshot = cls._snapshot
+            return snapshot[0] if snapshot else cls.DEGRADED
 
     @classmethod
     def maybe_recheck(cls):
@@ -81,48 +85,49 @@ class AIState:
         Never performs network calls.
         Honors TTL gate and DEGRADED dwell anti-oscillation rules.
         """
-        if not cls._initialized:
+        snapshot = cls._snapshot
+        if snapshot is None:
             return
+        state, degraded_since, last_checked = snapshot
 
         # DISABLED is terminal — no recheck ever
-        if cls._state == cls.DISABLED:
+        if state == cls.DISABLED:
             return
 
-        now = time.time()
+        now = time.monotonic()
 
         # TTL gate: skip if interval has not elapsed
-        if now - cls._last_checked < cls.TTL_SECONDS:
+        if now - last_checked < cls.TTL_SECONDS:
             return
-        cls._last_checked = now
+
+        ai_enabled = os.getenv("AI_ENABLED", "").lower()
+        key = os.getenv("MISTRAL_API_KEY", "").strip()
 
         # AI_ENABLED=false is precedence-absolute at any point in time
-        if os.getenv("AI_ENABLED", "").lower() == "false":
-            cls._state = cls.DISABLED
-            cls._degraded_since = 0.0
+        if ai_enabled == "false":
+            cls._snapshot = (cls.DISABLED, 0.0, now)
             cls._emit("AI explicitly disabled via AI_ENABLED=false")
             return
 
-        key = os.getenv("MISTRAL_API_KEY", "").strip()
-
-        if cls._state == cls.DEGRADED:
+        if state == cls.DEGRADED:
             # Anti-oscillation: DEGRADED → ACTIVE requires TTL elapsed (already
             # gated above) AND dwell elapsed AND key present.
-            if not key:
-                return  # stay DEGRADED — key still missing
-            if (now - cls._degraded_since) < cls.DEGRADED_DWELL_SECONDS:
-                return  # stay DEGRADED — dwell not yet satisfied
+            if not key or (now - degraded_since) < cls.DEGRADED_DWELL_SECONDS:
+                # stay DEGRADED — key still missing or dwell not yet satisfied
+                cls._snapshot = (state, degraded_since, now)
+                return
             # Both conditions met: promote to ACTIVE
-            cls._state = cls.ACTIVE
-            cls._degraded_since = 0.0
+            cls._snapshot = (cls.ACTIVE, 0.0, now)
             cls._emit("AI key restored after dwell period — AI active")
             return
 
-        if cls._state == cls.ACTIVE:
+        if state == cls.ACTIVE and not key:
             # Key disappeared while ACTIVE → immediate DEGRADED
-            if not key:
-                cls._state = cls.DEGRADED
-                cls._degraded_since = now
-                cls._emit("AI key missing — demo mode active")
+            cls._snapshot = (cls.DEGRADED, now, now)
+            cls._emit("AI key missing — demo mode active")
+            return
+
+        cls._snapshot = (state, degraded_since, now)
 
     @classmethod
     def transition_to_degraded(cls, reason: str):
@@ -131,15 +136,15 @@ class AIState:
         Sets dwell timer.  Logs once per transition.  Never raises.
         """
         try:
-            if not cls._initialized:
+            if cls._snapshot is None:
                 cls._initialize()
+            state, _, last_checked = cls._snapshot
             # DISABLED is terminal — never leave it
-            if cls._state == cls.DISABLED:
+            if state == cls.DISABLED:
                 return
             # Only transition if not already DEGRADED (avoids resetting dwell timer)
-            if cls._state != cls.DEGRADED:
-                cls._state = cls.DEGRADED
-                cls._degraded_since = time.time()
+            if state != cls.DEGRADED:
+                cls._snapshot = (cls.DEGRADED, time.monotonic(), last_checked)
                 cls._emit(f"AI degraded: {reason}")
         except Exception:
             pass  # contract: never raises
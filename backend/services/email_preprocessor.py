@@ -16,6 +16,21 @@ import re
 from typing import Tuple
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser
+except ImportError:
+    _FastHTMLParser = None
+
+# Compiled once at import; each email previously re-resolved these through
+# re's pattern cache on every call.
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RE = re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}')
+_TAG_RE = re.compile(r'<[^>]+>')
+# Same sniff as the old '<html' / '<div' / '<p>' substring checks, minus the lower() copy
+_HTML_SNIFF_RE = re.compile(r'<(?:html|div|p>)', re.IGNORECASE)
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
 
 class EmailPreprocessor:
     """
@@ -52,6 +67,14 @@ class EmailPreprocessor:
         r'_+\nFrom:',  # Outlook-style separators
     ]
 
+    _SIGNATURE_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in SIGNATURE_PATTERNS]
+    _REPLY_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in REPLY_PATTERNS]
+    # One-pass pre-filters: most bodies match none of the patterns and skip the
+    # per-pattern loop. The loop still decides the cut, since list order (not
+    # match position) picks the winning pattern.
+    _SIGNATURE_ANY = re.compile('|'.join(f'(?:{p})' for p in SIGNATURE_PATTERNS), re.IGNORECASE | re.MULTILINE)
+    _REPLY_ANY = re.compile('|'.join(f'(?:{p})' for p in REPLY_PATTERNS), re.IGNORECASE | re.MULTILINE)
+
     def __init__(self, strip_html: bool = True, remove_signatures: bool = True,
                  remove_reply_chains: bool = True, normalize_whitespace: bool = True):
         """
@@ -101,7 +124,7 @@ class EmailPreprocessor:
         text = email_body
 
         # Step 1: Strip HTML (if present)
-        if self.strip_html and ('<html' in text.lower() or '<div' in text.lower() or '<p>' in text.lower()):
+        if self.strip_html and _HTML_SNIFF_RE.search(text):
             text = self._strip_html_tags(text)
             stats["html_stripped"] = True
 
@@ -133,9 +156,15 @@ class EmailPreprocessor:
         """
         Remove HTML tags and scripts, preserve text content.
 
-        Uses BeautifulSoup for robust HTML parsing.
+        Uses selectolax (lexbor, C) when installed, else BeautifulSoup.
         """
         try:
+            if _FastHTMLParser is not None:
+                tree = _FastHTMLParser(html_content)
+                for script_or_style in tree.css("script, style, head, meta, link"):
+                    script_or_style.decompose()
+                return tree.root.text(separator=' ') if tree.root else ""
+
             soup = BeautifulSoup(html_content, "html.parser")
 
             # Remove script and style elements completely
@@ -147,9 +176,9 @@ class EmailPreprocessor:
 
             return text
         except Exception as e:
-            # Fallback: basic regex stripping if BeautifulSoup fails
-            print(f"[WARN] BeautifulSoup HTML stripping failed: {e}, using regex fallback")
-            text = re.sub(r'<[^>]+>', ' ', html_content)
+            # Fallback: basic regex stripping if the HTML parser fails
+            print(f"[WARN] HTML parser stripping failed: {e}, using regex fallback")
+            text = _TAG_RE.sub(' ', html_content)
             return text
 
     def _remove_signature(self, text: str) -> Tuple[str, bool]:
@@ -161,13 +190,12 @@ class EmailPreprocessor:
         """
         original_text = text
 
-        # Try each signature pattern
-        for pattern in self.SIGNATURE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                # Split at first signature match and keep only the part before
-                parts = re.split(pattern, text, maxsplit=1, flags=re.IGNORECASE | re.MULTILINE)
-                if len(parts) > 1:
-                    text = parts[0]
+        # Try each signature pattern; keep only the part before the first match
+        if self._SIGNATURE_ANY.search(text):
+            for pattern in self._SIGNATURE_RES:
+                match = pattern.search(text)
+                if match:
+                    text = text[:match.start()]
                     break
 
         # Additional heuristic: Remove everything after common signature indicators
@@ -183,7 +211,7 @@ class EmailPreprocessor:
                     # Check if followed by contact-info-like patterns
                     if i + 1 < len(lines):
                         next_line = lines[i + 1].strip()
-                        if re.search(r'[\w\.-]+@[\w\.-]+\.\w+', next_line) or re.search(r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}', next_line):
+                        if _EMAIL_RE.search(next_line) or _PHONE_RE.search(next_line):
                             cutoff_idx = i
                             break
 
@@ -202,13 +230,12 @@ class EmailPreprocessor:
         """
         original_text = text
 
-        # Try each reply pattern
-        for pattern in self.REPLY_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                # Split at first reply indicator and keep only the part before
-                parts = re.split(pattern, text, maxsplit=1, flags=re.IGNORECASE | re.MULTILINE)
-                if len(parts) > 0:
-                    text = parts[0]
+        # Try each reply pattern; keep only the part before the first indicator
+        if self._REPLY_ANY.search(text):
+            for pattern in self._REPLY_RES:
+                match = pattern.search(text)
+                if match:
+                    text = text[:match.start()]
                     break
 
         # Remove lines starting with '>' (quoted text)
@@ -235,10 +262,10 @@ class EmailPreprocessor:
         Collapse excessive whitespace while preserving paragraph structure.
         """
         # Replace multiple spaces with single space
-        text = re.sub(r' {2,}', ' ', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
 
         # Replace excessive newlines (3+ becomes 2)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _MULTI_NEWLINE_RE.sub('\n\n', text)
 
         # Remove leading/trailing whitespace from each line
         lines = [line.strip() for line in text.split('\n')]
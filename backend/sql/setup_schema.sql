@@ -69,7 +69,7 @@ CREATE TABLE IF NOT EXISTS public.credentials (
   provider TEXT NOT NULL,
   account_id TEXT NOT NULL,
   encrypted_payload JSONB NOT NULL,
-  scopes TEXT DEFAULT '',
+  scopes TEXT[] NOT NULL DEFAULT '{}',
   updated_at TIMESTAMPTZ DEFAULT now()
 );
 
@@ -78,7 +78,7 @@ ALTER TABLE public.credentials
   ADD COLUMN IF NOT EXISTS provider TEXT,
   ADD COLUMN IF NOT EXISTS account_id TEXT,
   ADD COLUMN IF NOT EXISTS encrypted_payload JSONB,
-  ADD COLUMN IF NOT EXISTS scopes TEXT,
+  ADD COLUMN IF NOT EXISTS scopes TEXT[],
   ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ;
 
 -- Required by upsert(on_conflict="provider,account_id")
@@ -146,6 +146,10 @@ ON public.emails (account_id, gmail_message_id);
 CREATE INDEX IF NOT EXISTS idx_emails_created_at
 ON public.emails (created_at DESC);
 
+-- Inbox read path: WHERE account_id = ? ORDER BY date DESC LIMIT n
+CREATE INDEX IF NOT EXISTS emails_account_date_idx
+ON public.emails (account_id, date DESC);
+
 -- 6) EMAIL SUMMARIES (from DEPLOYMENT.md; not required for WORKER-PERF-01 but documented)
 CREATE TABLE IF NOT EXISTS public.email_summaries (
   id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -0,0 +1,56 @@
+"""AI-STATE-01 - AIState degradation state machine transitions and TTL gating."""
+
+import os
+import unittest
+from unittest.mock import patch
+
+from backend.services import ai_state
+from backend.services.ai_state import AIState
+
+
+class TestAIState(unittest.TestCase):
+    def setUp(self):
+        AIState._snapshot = None
+        AIState._last_logged_state = None
+        self.addCleanup(setattr, AIState, "_snapshot", None)
+        self.addCleanup(setattr, AIState, "_last_logged_state", None)
+        self.clock = [1000.0]
+        patcher = patch.object(ai_state.time, "monotonic", side_effect=lambda: self.clock[0])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_present_starts_active(self):
+        with patch.dict(os.environ, {"AI_ENABLED": "", "MISTRAL_API_KEY": "k"}):
+            self.assertEqual(AIState.state(), AIState.ACTIVE)
+
+    def test_disabled_is_terminal(self):
+        with patch.dict(os.environ, {"AI_ENABLED": "false", "MISTRAL_API_KEY": "k"}):
+            self.assertEqual(AIState.state(), AIState.DISABLED)
+        with patch.dict(os.environ, {"AI_ENABLED": "", "MISTRAL_API_KEY": "k"}):
+            self.clock[0] += 10_000
+            self.assertEqual(AIState.state(), AIState.DISABLED)
+
+    def test_env_change_ignored_inside_ttl_window(self):
+        with patch.dict(os.environ, {"AI_ENABLED": "", "MISTRAL_API_KEY": "k"}):
+            AIState.state()
+        with patch.dict(os.environ, {"AI_ENABLED": "", "MISTRAL_API_KEY": ""}):
+            self.clock[0] += AIState.TTL_SECONDS - 1
+            self.assertEqual(AIState.state(), AIState.ACTIVE)
+            self.clock[0] += 1
+            self.assertEqual(AIState.state(), AIState.DEGRADED)
+
+    def test_degraded_promotes_only_after_dwell(self):
+        with patch.dict(os.environ, {"AI_ENABLED": "", "MISTRAL_API_KEY": "k"}):
+            AIState.state()
+            AIState.transition_to_degraded("provider error")
+            self.assertEqual(AIState.state(), AIState.DEGRADED)
+            self.clock[0] += AIState.TTL_SECONDS
+            self.assertEqual(AIState.state(), AIState.DEGRADED)
+            self.clock[0] += AIState.DEGRADED_DWELL_SECONDS
+            self.assertEqual(AIState.state(), AIState.ACTIVE)
+            state, degraded_since, last_checked = AIState._snapshot
+            self.assertEqual((state, degraded_since, last_checked), (AIState.ACTIVE, 0.0, self.clock[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -378,6 +378,20 @@ class TestMaskPii(unittest.TestCase):
         text = "Hello, please review the attached document."
         self.assertEqual(self.worker._mask_pii(text), text)
 
+    def test_masks_mixed_pii(self):
+        result = self.worker._mask_pii("Mail a.b@corp.io, call +33 612345678 or see http://x.io/a")
+        self.assertEqual(result, "Mail [EMAIL], call [PHONE] or see [URL]")
+
+    def test_email_inside_url_is_masked_before_url(self):
+        result = self.worker._mask_pii("Unsubscribe: https://x.io/u?e=joe@corp.io")
+        self.assertEqual(result, "Unsubscribe: [URL][EMAIL]")
+
+    def test_email_takes_precedence_over_phone_prefix(self):
+        # Regression: a "+digits" local part must not mask as [PHONE] and
+        # leak the rest of the address.
+        result = self.worker._mask_pii("+15551234567abc@example.com")
+        self.assertEqual(result, "+[EMAIL]")
+
 
 # ---------------------------------------------------------------------------
 # W9 — _compute_input_hash determinism
@@ -699,6 +713,80 @@ class TestProcessBatch(unittest.TestCase):
         count = worker.process_batch(batch_size=5, worker_id="w")
         self.assertEqual(count, 0)
 
+    def test_processes_every_email_job_concurrently(self):
+        import threading
+        worker = make_worker()
+        email_jobs = self._jobs(4, "e")
+        # Every job blocks until all four are in flight; sequential processing
+        # would break the barrier (BrokenBarrierError after the timeout).
+        barrier = threading.Barrier(len(email_jobs), timeout=5)
+        seen = []
+
+        def fake_claim(batch_size, worker_id, job_type=EMAIL_JOB_TYPE):
+            return email_jobs if job_type == EMAIL_JOB_TYPE else []
+
+        def fake_process(job):
+            barrier.wait()
+            seen.append(job["id"])
+
+        worker.claim_jobs = fake_claim
+        worker.process_job = fake_process
+        worker.process_document_job = MagicMock()
+
+        count = worker.process_batch(batch_size=5, worker_id="w")
+        self.assertEqual(count, 4)
+        self.assertFalse(barrier.broken)
+        self.assertEqual(sorted(seen), ["e0", "e1", "e2", "e3"])
+
+    def test_single_failing_email_job_is_logged_not_raised(self):
+        worker = make_worker()
+        worker.claim_jobs = lambda batch_size, worker_id, job_type=EMAIL_JOB_TYPE: (
+            self._jobs(1, "e") if job_type == EMAIL_JOB_TYPE else []
+        )
+        worker.process_job = MagicMock(side_effect=RuntimeError("boom"))
+        worker.process_document_job = MagicMock()
+
+        with self.assertLogs("backend.infrastructure.ai_summarizer_worker", level="ERROR") as cm:
+            count = worker.process_batch(batch_size=5, worker_id="w")
+        self.assertEqual(count, 1)
+        self.assertIn("e0", cm.output[0])
+        self.assertIn("Traceback", cm.output[0])
+
+    def test_one_failing_email_job_does_not_stop_the_others(self):
+        worker = make_worker()
+        email_jobs = self._jobs(3, "e")
+        seen = []
+
+        def fake_process(job):
+            if job["id"] == "e1":
+                raise RuntimeError("boom")
+            seen.append(job["id"])
+
+        worker.claim_jobs = lambda batch_size, worker_id, job_type=EMAIL_JOB_TYPE: (
+            email_jobs if job_type == EMAIL_JOB_TYPE else []
+        )
+        worker.process_job = fake_process
+        worker.process_document_job = MagicMock()
+
+        worker.process_batch(batch_size=5, worker_id="w")
+        self.assertEqual(sorted(seen), ["e0", "e2"])
+
+    def test_batch_writes_share_one_timestamp(self):
+        worker = make_worker()
+        email_jobs = self._jobs(3, "e")
+        stamps = []
+
+        worker.claim_jobs = lambda batch_size, worker_id, job_type=EMAIL_JOB_TYPE: (
+            email_jobs if job_type == EMAIL_JOB_TYPE else []
+        )
+        worker.process_job = lambda job: stamps.append(worker._now_iso())
+        worker.process_document_job = MagicMock()
+
+        worker.process_batch(batch_size=5, worker_id="w")
+        self.assertEqual(len(stamps), 3)
+        self.assertEqual(len(set(stamps)), 1)
+        self.assertIsNone(worker._batch_now_iso)
+
 
 # ---------------------------------------------------------------------------
 # A — _call_mistral: success, governor deferral, retry, exhaustion
@@ -7,10 +7,12 @@ Coverage groups:
   C   ControlPlane schema state / schema version checks
   D   ControlPlane audit logging / control events
   E   SupabaseStore constructor / client handling
-  F   SupabaseStore save_email_atomic RPC contract
+  F   SupabaseStore save_email_atomic / save_emails_atomic_bulk RPC contract
   G   SupabaseStore enqueue_ai_job upsert contract
   H   SupabaseStore sync state helpers
   I   SupabaseStore credential/account listing safety
+  J   SupabaseStore save_emails_bulk chunked upsert contract
+  K   SupabaseStore get_emails_with_summaries RPC path and fallback
 
 No live Supabase, network, subprocess, filesystem, or real secret access.
 """
@@ -19,14 +21,14 @@ import os
 import sys
 import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
 from backend.infrastructure.control_plane import ControlPlane
-from backend.infrastructure.supabase_store import SupabaseStore
+from backend.infrastructure.supabase_store import SupabaseStore, invalidate_store_caches
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +44,7 @@ class _FakeResult:
 class _FakeChain:
     """
     Chainable fake that records every operation and returns a configurable result.
-    Supports: table, rpc, select, eq, single, order, limit, insert, upsert, delete, execute.
+    Supports: table, rpc, select, eq, in_, single, order, limit, insert, upsert, delete, execute.
     """
 
     def __init__(self, data=None, raise_on_execute=False):
@@ -55,7 +57,11 @@ class _FakeChain:
         self.insert_payload = None
         self.upsert_payload = None
         self.on_conflict_value = None
+        self.returning_value = None
+        self.upsert_calls = []
+        self.insert_calls = []
         self.eq_filters = []
+        self.in_filters = []
         self.selected_cols = None
         self.execute_called = False
 
@@ -67,6 +73,10 @@ class _FakeChain:
         self.eq_filters.append((col, val))
         return self
 
+    def in_(self, col, values):
+        self.in_filters.append((col, list(values)))
+        return self
+
     def single(self):
         return self
 
@@ -78,11 +88,14 @@ class _FakeChain:
 
     def insert(self, payload):
         self.insert_payload = payload
+        self.insert_calls.append(payload)
         return self
 
-    def upsert(self, payload, on_conflict=None):
+    def upsert(self, payload, on_conflict=None, returning=None):
         self.upsert_payload = payload
         self.on_conflict_value = on_conflict
+        self.returning_value = returning
+        self.upsert_calls.append(payload)
         return self
 
     def delete(self):
@@ -148,24 +161,24 @@ class TestControlPlaneSingleton(unittest.TestCase):
 
     def _make_cp(self, chain=None):
         fake_store = _FakeStore(chain=chain)
-        with patch("backend.infrastructure.control_plane.SupabaseStore", return_value=fake_store):
+        with patch("backend.infrastructure.control_plane.get_store_instance", return_value=fake_store):
             return ControlPlane()
 
     def test_singleton_returns_same_instance_on_repeated_calls(self):
         fake_store = _FakeStore()
-        with patch("backend.infrastructure.control_plane.SupabaseStore", return_value=fake_store):
+        with patch("backend.infrastructure.control_plane.get_store_instance", return_value=fake_store):
             cp1 = ControlPlane()
             cp2 = ControlPlane()
         self.assertIs(cp1, cp2)
 
     def test_store_is_initialized_after_construction(self):
         fake_store = _FakeStore()
-        with patch("backend.infrastructure.control_plane.SupabaseStore", return_value=fake_store):
+        with patch("backend.infrastructure.control_plane.get_store_instance", return_value=fake_store):
             cp = ControlPlane()
         self.assertIsNotNone(cp.store)
 
     def test_store_init_failure_is_tolerated_and_store_remains_none(self):
-        with patch("backend.infrastructure.control_plane.SupabaseStore", side_effect=RuntimeError("no env")):
+        with patch("backend.infrastructure.control_plane.get_store_instance", side_effect=RuntimeError("no env")):
             cp = ControlPlane()
         self.assertIsNone(cp.store)
 
@@ -175,7 +188,7 @@ class TestControlPlaneSingleton(unittest.TestCase):
         self.assertTrue(result)
 
     def test_ensure_store_initialized_returns_false_when_store_unavailable(self):
-        with patch("backend.infrastructure.control_plane.SupabaseStore", side_effect=RuntimeError("no env")):
+        with patch("backend.infrastructure.control_plane.get_store_instance", side_effect=RuntimeError("no env")):
             cp = ControlPlane()
         result = cp._ensure_store_initialized()
         self.assertFalse(result)
@@ -193,12 +206,12 @@ class TestControlPlaneWorkerPolicy(unittest.TestCase):
         _reset_control_plane()
 
     def _make_cp_no_store(self):
-        with patch("backend.infrastructure.control_plane.SupabaseStore", side_effect=RuntimeError("no env")):
+        with patch("backend.infrastructure.control_plane.get_store_instance", side_effect=RuntimeError("no env")):
             return ControlPlane()
 
     def _make_cp_with_chain(self, chain):
         fake_store = _FakeStore(chain=chain)
-        with patch("backend.infrastructure.control_plane.SupabaseStore", return_value=fake_store):
+        with patch("backend.infrastructure.control_plane.get_store_instance", return_value=fake_store):
             return ControlPlane()
 
     def test_fail_open_worker_enabled_when_store_is_none(self):
@@ -283,7 +296,7 @@ class TestControlPlaneSchemaVerification(unittest.TestCase):
 
     def _make_cp_with_chain(self, chain):
         fake_store = _FakeStore(chain=chain)
-        with patch("backend.infrastructure.control_plane.SupabaseStore", return_value=fake_store):
+        with patch("backend.infrastructure.control_plane.get_store_instance", return_value=fake_store):
             return ControlPlane()
 
     def test_get_supported_schema_version_returns_v3(self):
@@ -334,7 +347,7 @@ class TestControlPlaneSchemaVerification(unittest.TestCase):
             self.fail(f"verify_schema raised unexpectedly: {exc}")
 
     def test_verify_schema_no_store_sets_state_uninitialized(self):
-        with patch("backend.infrastructure.control_plane.SupabaseStore", side_effect=RuntimeError("no env")):
+        with patch("backend.infrastructure.control_plane.get_store_instance", side_effect=RuntimeError("no env")):
             cp = ControlPlane()
         result = cp.verify_schema()
         self.assertFalse(result)
@@ -360,7 +373,7 @@ class TestControlPlaneAuditLogging(unittest.TestCase):
 
     def _make_cp_with_chain(self, chain):
         fake_store = _FakeStore(chain=chain)
-        with patch("backend.infrastructure.control_plane.SupabaseStore", return_value=fake_store):
+        with patch("backend.infrastructure.control_plane.get_store_instance", return_value=fake_store):
             return ControlPlane()
 
     def test_audit_log_inserts_into_audit_log_table(self):
@@ -396,7 +409,7 @@ class TestControlPlaneAuditLogging(unittest.TestCase):
             self.fail(f"log_audit raised unexpectedly: {exc}")
 
     def test_audit_log_no_store_does_not_raise(self):
-        with patch("backend.infrastructure.control_plane.SupabaseStore", side_effect=RuntimeError("no env")):
+        with patch("backend.infrastructure.control_plane.get_store_instance", side_effect=RuntimeError("no env")):
             cp = ControlPlane()
         try:
             cp.log_audit(action="x", resource="y")
@@ -562,6 +575,94 @@ class TestSupabaseStoreSaveEmailAtomic(unittest.TestCase):
         self.assertEqual(chain.rpc_params["p_body"], "")
 
 
+class TestSupabaseStoreSaveEmailsAtomicBulk(unittest.TestCase):
+    def setUp(self):
+        SupabaseStore._atomic_bulk_rpc_available = True
+
+    def tearDown(self):
+        SupabaseStore._atomic_bulk_rpc_available = True
+
+    def _make_store(self, chain):
+        store = object.__new__(SupabaseStore)
+        store.client = _FakeClient(chain=chain)
+        return store
+
+    def test_batch_saved_with_one_rpc_call(self):
+        chain = _FakeChain(data=[
+            {"message_id": "m1", "email_id": "e1", "job_created": True, "job_existed": False},
+            {"message_id": "m2", "email_id": "e2", "job_created": False, "job_existed": False},
+        ])
+        store = self._make_store(chain)
+        saved = store.save_emails_atomic_bulk(
+            [
+                {"subject": "A", "sender": "a@b.com", "date": "2024-01-01T10:00:00",
+                 "message_id": "m1", "create_ai_job": True},
+                {"subject": "B", "sender": "a@b.com", "date": "2024-01-01T00:00:00Z",
+                 "message_id": "m2", "has_attachments": True},
+                {"subject": "C", "sender": "a@b.com", "date": "2024-01-01T00:00:00Z"},
+            ],
+            tenant_id="primary", account_id="acct-1",
+        )
+        self.assertEqual(chain.rpc_name, "save_emails_with_ai_jobs_v1")
+        self.assertEqual(chain.rpc_params["p_account_id"], "acct-1")
+        self.assertEqual(chain.rpc_params["p_provider"], "gmail")
+        rows = chain.rpc_params["p_emails"]
+        self.assertEqual([r["message_id"] for r in rows], ["m1", "m2"])
+        self.assertEqual(rows[0]["date"], "2024-01-01T10:00:00+00:00")
+        self.assertTrue(rows[0]["create_ai_job"])
+        self.assertTrue(rows[1]["has_attachments"])
+        self.assertEqual(rows[1]["body"], "")
+        self.assertEqual(set(saved), {"m1", "m2"})
+        self.assertTrue(saved["m1"]["job_created"])
+
+    def test_missing_rpc_falls_back_to_per_row_save_and_is_not_retried(self):
+        chain = _FakeChain(data={"email_id": "e1", "job_created": False})
+        client = _FakeClient(chain=chain)
+        missing = Exception("function not found")
+        missing.code = "PGRST202"
+        per_row_rpc = client.rpc
+
+        def rpc(name, params):
+            if name == "save_emails_with_ai_jobs_v1":
+                raise missing
+            return per_row_rpc(name, params)
+
+        client.rpc = rpc
+        store = object.__new__(SupabaseStore)
+        store.client = client
+        saved = store.save_emails_atomic_bulk(
+            [{"subject": "A", "sender": "s", "date": "2024-01-01T00:00:00Z", "message_id": "m1"}],
+            account_id="acct-1",
+        )
+        self.assertFalse(SupabaseStore._atomic_bulk_rpc_available)
+        self.assertEqual(chain.rpc_name, "save_email_with_ai_job_v2")
+        self.assertEqual(saved, {"m1": {"email_id": "e1", "job_created": False}})
+
+    def test_rate_limited_batch_backs_off_and_retries_rpc(self):
+        client = MagicMock()
+        client.rpc.return_value.execute.side_effect = [
+            Exception("429 Too Many Requests"),
+            _FakeResult([{"message_id": "m1", "job_created": False}]),
+        ]
+        store = object.__new__(SupabaseStore)
+        store.client = client
+        with patch("backend.infrastructure.supabase_store.time.sleep") as mock_sleep:
+            saved = store.save_emails_atomic_bulk(
+                [{"subject": "A", "sender": "s", "date": "2024-01-01T00:00:00Z", "message_id": "m1"}]
+            )
+        mock_sleep.assert_called_once_with(1)
+        self.assertEqual(client.rpc.call_count, 2)
+        self.assertIn("m1", saved)
+        self.assertTrue(SupabaseStore._atomic_bulk_rpc_available)
+
+    def test_no_rpc_when_every_item_lacks_message_id(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        saved = store.save_emails_atomic_bulk([{"subject": "A", "date": "2024-01-01T00:00:00Z"}])
+        self.assertEqual(saved, {})
+        self.assertFalse(chain.execute_called)
+
+
 # ---------------------------------------------------------------------------
 # G. enqueue_ai_job — upsert contract
 # ---------------------------------------------------------------------------
@@ -615,6 +716,20 @@ class TestSupabaseStoreEnqueueAiJob(unittest.TestCase):
         store.enqueue_ai_job(account_id="acct-1", gmail_message_id="msg-1")
         self.assertEqual(chain.upsert_payload["status"], "queued")
 
+    def test_payload_timestamps_share_one_instant(self):
+        chain = _FakeChain(data=[{"id": "job-7b"}])
+        store = self._make_store(chain)
+        store.enqueue_ai_job(account_id="acct-1", gmail_message_id="msg-1")
+        p = chain.upsert_payload
+        self.assertEqual(p["run_after"], p["created_at"])
+        self.assertEqual(p["created_at"], p["updated_at"])
+
+    def test_enqueue_selects_only_id_column(self):
+        chain = _FakeChain(data=[{"id": "job-8"}])
+        store = self._make_store(chain)
+        store.enqueue_ai_job(account_id="acct-1", gmail_message_id="msg-1")
+        self.assertEqual(chain.selected_cols, "id")
+
     def test_returns_job_id_when_data_present(self):
         chain = _FakeChain(data=[{"id": "job-42"}])
         store = self._make_store(chain)
@@ -633,12 +748,49 @@ class TestSupabaseStoreEnqueueAiJob(unittest.TestCase):
         job_id = store.enqueue_ai_job(account_id="acct-1", gmail_message_id="msg-1")
         self.assertIsNone(job_id)
 
+    def test_bulk_enqueue_issues_one_upsert_for_all_jobs(self):
+        chain = _FakeChain(data=[{"id": "j1"}, {"id": "j2"}])
+        store = self._make_store(chain)
+        job_ids = store.enqueue_ai_jobs_bulk([("acct-1", "m1"), ("acct-1", "m2"), ("acct-1", "m1")])
+        self.assertEqual(job_ids, ["j1", "j2"])
+        self.assertEqual(len(chain.upsert_calls), 1)
+        self.assertEqual([p["gmail_message_id"] for p in chain.upsert_payload], ["m1", "m2"])
+        self.assertEqual(chain.on_conflict_value, "job_type,account_id,gmail_message_id")
+
+    def test_bulk_enqueue_rows_share_timestamps_and_job_type(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        store.enqueue_ai_jobs_bulk([("a", "m1"), ("a", "m2")], job_type="document_process_v1")
+        rows = chain.upsert_payload
+        self.assertEqual({r["job_type"] for r in rows}, {"document_process_v1"})
+        self.assertEqual(len({r["created_at"] for r in rows}), 1)
+
+    def test_bulk_enqueue_returns_empty_list_on_exception(self):
+        chain = _FakeChain(raise_on_execute=True)
+        store = self._make_store(chain)
+        self.assertEqual(store.enqueue_ai_jobs_bulk([("a", "m1")]), [])
+
+    def test_bulk_enqueue_with_no_jobs_makes_no_request(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        self.assertEqual(store.enqueue_ai_jobs_bulk([]), [])
+        self.assertFalse(chain.execute_called)
+
 
 # ---------------------------------------------------------------------------
 # H. Sync state helpers
 # ---------------------------------------------------------------------------
 
 class TestSupabaseStoreSyncState(unittest.TestCase):
+    # Table-read contract; the RPC path is covered in TestSupabaseStoreSyncStateRpc.
+    def setUp(self):
+        invalidate_store_caches()
+        SupabaseStore._sync_state_rpc_available = False
+
+    def tearDown(self):
+        invalidate_store_caches()
+        SupabaseStore._sync_state_rpc_available = True
+
     def _make_store(self, chain):
         store = object.__new__(SupabaseStore)
         store.client = _FakeClient(chain=chain)
@@ -662,6 +814,47 @@ class TestSupabaseStoreSyncState(unittest.TestCase):
         result = store.get_sync_state(tenant_id="primary", account_id="default")
         self.assertIsNone(result)
 
+    def test_get_sync_states_reads_uncached_accounts_in_one_query(self):
+        import backend.infrastructure.supabase_store as ss
+        ss._sync_state_cache.set(("primary", "a1"), "cached-1")
+        chain = _FakeChain(data=[{"account_id": "a2", "last_history_id": "22"}])
+        store = self._make_store(chain)
+        result = store.get_sync_states("primary", ["a1", "a2", "a3", "a2"])
+        self.assertEqual(result, {"a1": "cached-1", "a2": "22"})
+        self.assertEqual(chain.table_name, "gmail_sync_state")
+        self.assertEqual(chain.eq_filters, [("tenant_id", "primary")])
+        self.assertEqual(chain.in_filters, [("account_id", ["a2", "a3"])])
+        self.assertEqual(ss._sync_state_cache.get(("primary", "a2")), "22")
+
+    def test_get_sync_states_returns_cached_subset_on_exception(self):
+        import backend.infrastructure.supabase_store as ss
+        ss._sync_state_cache.set(("primary", "a1"), "cached-1")
+        store = self._make_store(_FakeChain(raise_on_execute=True))
+        self.assertEqual(store.get_sync_states("primary", ["a1", "a2"]), {"a1": "cached-1"})
+
+    def test_get_sync_state_uses_direct_rest_get_when_configured(self):
+        import httpx
+        chain = _FakeChain(data=[{"last_history_id": "wrong"}])
+        store = self._make_store(chain)
+        store._rest_base = "https://example.supabase.co/rest/v1/"
+        store._rest_headers = {"apikey": "k"}
+        http = MagicMock()
+        http.get.return_value = httpx.Response(
+            200, content=b'[{"last_history_id": "777"}]',
+            request=httpx.Request("GET", "https://example.supabase.co"),
+        )
+        with patch("backend.infrastructure.supabase_store._get_http_client", return_value=http):
+            result = store.get_sync_state(tenant_id="t1", account_id="a1")
+        self.assertEqual(result, "777")
+        self.assertFalse(chain.execute_called)
+        url = http.get.call_args.args[0]
+        params = http.get.call_args.kwargs["params"]
+        self.assertEqual(url, "https://example.supabase.co/rest/v1/gmail_sync_state")
+        self.assertEqual(params["tenant_id"], "eq.t1")
+        self.assertEqual(params["account_id"], "eq.a1")
+        self.assertEqual(params["select"], "last_history_id")
+        self.assertEqual(params["limit"], "1")
+
     def test_get_sync_state_filters_by_tenant_id_and_account_id(self):
         chain = _FakeChain(data=[{"last_history_id": "999"}])
         store = self._make_store(chain)
@@ -693,18 +886,181 @@ class TestSupabaseStoreSyncState(unittest.TestCase):
         store.set_sync_state(tenant_id="primary", account_id="default", last_history_id="1")
         self.assertEqual(chain.on_conflict_value, "tenant_id,account_id")
 
+    def test_set_sync_state_requests_minimal_return(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        store.set_sync_state(tenant_id="primary", account_id="default", last_history_id="1")
+        self.assertEqual(chain.returning_value, "minimal")
+
     def test_set_sync_state_raises_on_exception(self):
         chain = _FakeChain(raise_on_execute=True)
         store = self._make_store(chain)
         with self.assertRaises(Exception):
             store.set_sync_state(tenant_id="primary", account_id="default", last_history_id="1")
 
+    def test_get_sync_state_served_from_cache_on_repeat(self):
+        chain = _FakeChain(data=[{"last_history_id": "777"}])
+        store = self._make_store(chain)
+        store.get_sync_state(tenant_id="t1", account_id="a1")
+        chain.execute_called = False
+        self.assertEqual(store.get_sync_state(tenant_id="t1", account_id="a1"), "777")
+        self.assertFalse(chain.execute_called)
+
+    def test_set_sync_state_refreshes_cached_cursor(self):
+        store = self._make_store(_FakeChain(data=[{"last_history_id": "1"}]))
+        store.get_sync_state(tenant_id="t1", account_id="a1")
+        store.set_sync_state(tenant_id="t1", account_id="a1", last_history_id="2")
+        self.assertEqual(store.get_sync_state(tenant_id="t1", account_id="a1"), "2")
+
 
 # ---------------------------------------------------------------------------
 # I. Credential/account listing safety
 # ---------------------------------------------------------------------------
 
+class TestSupabaseStoreDeferredSyncState(unittest.TestCase):
+    def setUp(self):
+        invalidate_store_caches()
+
+    def tearDown(self):
+        invalidate_store_caches()
+
+    def _make_store(self, chain):
+        store = object.__new__(SupabaseStore)
+        store.client = _FakeClient(chain=chain)
+        return store
+
+    def test_deferred_write_lands_and_cache_is_immediate(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        future = store.set_sync_state_deferred("t1", "a1", "1000")
+        from backend.infrastructure import supabase_store as ss
+        self.assertEqual(ss._sync_state_cache.get(("t1", "a1")), "1000")
+        future.result(timeout=5)
+        self.assertEqual(chain.upsert_payload["last_history_id"], "1000")
+
+    def test_queued_writes_coalesce_to_latest_cursor(self):
+        import threading
+        release = threading.Event()
+        started = threading.Event()
+
+        class _BlockingChain(_FakeChain):
+            def execute(self):
+                started.set()
+                release.wait(5)
+                return super().execute()
+
+        chain = _BlockingChain(data=[])
+        store = self._make_store(chain)
+        first = store.set_sync_state_deferred("t1", "a2", "1")
+        self.assertTrue(started.wait(5))
+        second = store.set_sync_state_deferred("t1", "a2", "2")
+        third = store.set_sync_state_deferred("t1", "a2", "3")
+        # One task drains the key, so writes for it stay in order.
+        self.assertIs(first, second)
+        self.assertIs(second, third)
+        release.set()
+        third.result(timeout=5)
+        self.assertEqual([c["last_history_id"] for c in chain.upsert_calls], ["1", "3"])
+        from backend.infrastructure import supabase_store as ss
+        self.assertEqual(ss._active_writes, {})
+        self.assertEqual(ss._pending_writes, {})
+
+    def test_failed_deferred_write_evicts_cached_cursor(self):
+        from backend.infrastructure import supabase_store as ss
+        store = self._make_store(_FakeChain(raise_on_execute=True))
+        future = store.set_sync_state_deferred("t1", "a3", "55")
+        with self.assertRaises(Exception):
+            future.result(timeout=5)
+        self.assertIsNone(ss._sync_state_cache.get(("t1", "a3")))
+
+    def test_failed_write_keeps_cache_when_newer_cursor_is_queued(self):
+        import threading
+        from backend.infrastructure import supabase_store as ss
+        release = threading.Event()
+        started = threading.Event()
+
+        class _FailOnceChain(_FakeChain):
+            calls = 0
+
+            def execute(self):
+                _FailOnceChain.calls += 1
+                if _FailOnceChain.calls == 1:
+                    started.set()
+                    release.wait(5)
+                    raise Exception("fake db error")
+                return super().execute()
+
+        store = self._make_store(_FailOnceChain(data=[]))
+        first = store.set_sync_state_deferred("t1", "a4", "old")
+        self.assertTrue(started.wait(5))
+        store.set_sync_state_deferred("t1", "a4", "new")
+        release.set()
+        first.result(timeout=5)
+        self.assertEqual(ss._sync_state_cache.get(("t1", "a4")), "new")
+
+
+class TestSupabaseStoreSyncStateRpc(unittest.TestCase):
+    def setUp(self):
+        invalidate_store_caches()
+        SupabaseStore._sync_state_rpc_available = True
+
+    def tearDown(self):
+        invalidate_store_caches()
+        SupabaseStore._sync_state_rpc_available = True
+
+    def _make_store(self, client):
+        store = object.__new__(SupabaseStore)
+        store.client = client
+        return store
+
+    def test_rpc_returns_scalar_cursor(self):
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = _FakeResult("4242")
+        store = self._make_store(client)
+        self.assertEqual(store.get_sync_state(tenant_id="t1", account_id="a1"), "4242")
+        client.rpc.assert_called_once_with("get_sync_state", {"p_tenant_id": "t1", "p_account_id": "a1"})
+        client.table.assert_not_called()
+
+    def test_rpc_null_means_no_cursor(self):
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = _FakeResult(None)
+        store = self._make_store(client)
+        self.assertIsNone(store.get_sync_state(tenant_id="t1", account_id="a1"))
+        client.table.assert_not_called()
+
+    def test_missing_rpc_falls_back_to_table_and_is_not_retried(self):
+        chain = _FakeChain(data=[{"last_history_id": "77"}])
+        client = _FakeClient(chain=chain)
+        missing = Exception("function not found")
+        missing.code = "PGRST202"
+        client.rpc = MagicMock(side_effect=missing)
+        store = self._make_store(client)
+        self.assertEqual(store.get_sync_state(tenant_id="t1", account_id="a1"), "77")
+        self.assertFalse(SupabaseStore._sync_state_rpc_available)
+        self.assertEqual(chain.table_name, "gmail_sync_state")
+
+    def test_direct_http_rpc_maps_missing_function_to_api_error(self):
+        import httpx
+        store = self._make_store(MagicMock())
+        store._rest_base = "https://example.supabase.co/rest/v1/"
+        store._rest_headers = {"apikey": "k"}
+        http = MagicMock()
+        req = httpx.Request("POST", "https://example.supabase.co")
+        http.post.return_value = httpx.Response(404, content=b'{"code": "PGRST202", "message": "nope"}', request=req)
+        http.get.return_value = httpx.Response(200, content=b'[{"last_history_id": "9"}]', request=req)
+        with patch("backend.infrastructure.supabase_store._get_http_client", return_value=http):
+            self.assertEqual(store.get_sync_state(tenant_id="t1", account_id="a1"), "9")
+        self.assertEqual(http.post.call_args.args[0], "https://example.supabase.co/rest/v1/rpc/get_sync_state")
+        self.assertFalse(SupabaseStore._sync_state_rpc_available)
+
+
 class TestSupabaseStoreCredentialListing(unittest.TestCase):
+    def setUp(self):
+        invalidate_store_caches()
+
+    def tearDown(self):
+        invalidate_store_caches()
+
     def _make_store(self, chain):
         store = object.__new__(SupabaseStore)
         store.client = _FakeClient(chain=chain)
@@ -755,6 +1111,287 @@ class TestSupabaseStoreCredentialListing(unittest.TestCase):
         result = store.list_credentials(provider="gmail")
         self.assertEqual(result[0]["scopes"], [])
 
+    def test_get_credential_parses_scopes_and_drops_blanks(self):
+        chain = _FakeChain(data=[{
+            "encrypted_payload": '{"token": "enc"}',
+            "scopes": " email, ,profile ,",
+            "updated_at": "2024-01-01",
+        }])
+        store = self._make_store(chain)
+        result = store.get_credential(provider="gmail", account_id="acct-1")
+        self.assertEqual(result["scopes"], ["email", "profile"])
+        self.assertEqual(result["encrypted_payload"], {"token": "enc"})
+        self.assertEqual(chain.selected_cols, "encrypted_payload,scopes,updated_at")
+
+    def test_get_credential_decodes_json_array_text_from_legacy_column(self):
+        # save_credential() sends a list; a not-yet-migrated TEXT column stores its JSON text
+        chain = _FakeChain(data=[{
+            "encrypted_payload": '{"token": "enc"}',
+            "scopes": '["https://www.googleapis.com/auth/gmail.readonly", "https://www.googleapis.com/auth/gmail.modify"]',
+            "updated_at": "2024-01-01",
+        }])
+        store = self._make_store(chain)
+        result = store.get_credential(provider="gmail", account_id="acct-1")
+        self.assertEqual(result["scopes"], [
+            "https://www.googleapis.com/auth/gmail.readonly",
+            "https://www.googleapis.com/auth/gmail.modify",
+        ])
+
+    def test_save_credential_sends_payload_as_object(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        store.save_credential("gmail", "acct-1", {"token": "enc", "n": 1}, ["email", "profile"])
+        self.assertEqual(chain.on_conflict_value, "provider,account_id")
+        self.assertEqual(chain.upsert_payload["encrypted_payload"], {"token": "enc", "n": 1})
+        self.assertEqual(chain.upsert_payload["scopes"], ["email", "profile"])
+
+    def test_save_credential_without_scopes_sends_empty_array(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        store.save_credential("gmail", "acct-1", {"token": "enc"})
+        self.assertEqual(chain.upsert_payload["scopes"], [])
+
+    def test_get_credential_passes_text_array_scopes_through(self):
+        chain = _FakeChain(data=[{"encrypted_payload": {"token": "enc"}, "scopes": ["email", "profile"]}])
+        store = self._make_store(chain)
+        result = store.get_credential(provider="gmail", account_id="acct-3")
+        self.assertEqual(result["scopes"], ["email", "profile"])
+
+    def test_get_credential_accepts_jsonb_object_payload(self):
+        chain = _FakeChain(data=[{"encrypted_payload": {"token": "enc"}, "scopes": "email"}])
+        store = self._make_store(chain)
+        result = store.get_credential(provider="gmail", account_id="acct-2")
+        self.assertEqual(result["encrypted_payload"], {"token": "enc"})
+
+    def test_get_credential_cached_until_save_or_delete(self):
+        chain = _FakeChain(data=[{"encrypted_payload": '{"token": "enc"}', "scopes": "email"}])
+        store = self._make_store(chain)
+        store.get_credential(provider="gmail", account_id="acct-1")
+        chain.execute_called = False
+        self.assertIsNotNone(store.get_credential(provider="gmail", account_id="acct-1"))
+        self.assertFalse(chain.execute_called)
+
+        store.delete_credential(provider="gmail", account_id="acct-1")
+        chain.execute_called = False
+        store.get_credential(provider="gmail", account_id="acct-1")
+        self.assertTrue(chain.execute_called)
+
+    def test_get_credential_returns_none_when_row_absent(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        self.assertIsNone(store.get_credential(provider="gmail", account_id="acct-1"))
+
+
+
+# ---------------------------------------------------------------------------
+# J. save_emails_bulk — chunked upsert contract
+# ---------------------------------------------------------------------------
+
+class TestSupabaseStoreSaveEmailsBulk(unittest.TestCase):
+    def _make_store(self, chain):
+        store = object.__new__(SupabaseStore)
+        store.client = _FakeClient(chain=chain)
+        return store
+
+    @staticmethod
+    def _emails(n, with_id=True):
+        return [
+            {
+                "subject": f"s{i}",
+                "sender": "a@b.c",
+                "date": "2024-01-01T00:00:00+00:00",
+                "body": "b",
+                "message_id": f"m{i}" if with_id else None,
+                "thread_id": f"t{i}",
+                "has_attachments": False,
+            }
+            for i in range(n)
+        ]
+
+    def test_single_upsert_for_small_batch(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        store.save_emails_bulk(self._emails(25), tenant_id="primary", account_id="acct-1")
+        self.assertEqual(len(chain.upsert_calls), 1)
+        self.assertEqual(len(chain.upsert_payload), 25)
+        self.assertEqual(chain.on_conflict_value, "account_id,gmail_message_id")
+        self.assertEqual(chain.returning_value, "minimal")
+
+    def test_large_batch_is_chunked(self):
+        from backend.infrastructure.supabase_store import POSTGREST_UPSERT_CHUNK_SIZE
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        results = store.save_emails_bulk(self._emails(POSTGREST_UPSERT_CHUNK_SIZE + 1), account_id="acct-1")
+        self.assertEqual([len(c) for c in chain.upsert_calls], [POSTGREST_UPSERT_CHUNK_SIZE, 1])
+        self.assertEqual(len(results), 2)
+
+    def test_rows_carry_account_id_and_message_id(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        store.save_emails_bulk(self._emails(2), account_id="acct-9")
+        row = chain.upsert_payload[0]
+        self.assertEqual(row["account_id"], "acct-9")
+        self.assertEqual(row["gmail_message_id"], "m0")
+        self.assertNotIn("created_at", row)
+
+    def test_rows_missing_message_id_are_skipped_by_default(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        with patch("backend.infrastructure.supabase_store.ALLOW_NULL_GMAIL_ID", False):
+            store.save_emails_bulk(self._emails(2) + self._emails(3, with_id=False))
+        self.assertEqual(len(chain.upsert_payload), 2)
+        self.assertEqual(chain.insert_calls, [])
+
+    def test_rows_missing_message_id_inserted_in_unsafe_mode(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        with patch("backend.infrastructure.supabase_store.ALLOW_NULL_GMAIL_ID", True):
+            store.save_emails_bulk(self._emails(2, with_id=False))
+        self.assertEqual(len(chain.insert_calls), 1)
+        self.assertEqual(len(chain.insert_calls[0]), 2)
+
+    def test_missing_message_ids_logged_once_per_batch(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        with patch("backend.infrastructure.supabase_store.ALLOW_NULL_GMAIL_ID", False):
+            with self.assertLogs("backend.infrastructure.supabase_store", level="WARNING") as cm:
+                store.save_emails_bulk(self._emails(10, with_id=False))
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn("Skipped 10 emails", cm.output[0])
+
+    def test_naive_date_gets_utc_suffix(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        emails = self._emails(1)
+        emails[0]["date"] = "2024-01-01T00:00:00"
+        store.save_emails_bulk(emails)
+        self.assertEqual(chain.upsert_payload[0]["date"], "2024-01-01T00:00:00+00:00")
+
+    def test_duplicate_message_ids_collapse_to_one_row(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        emails = self._emails(2) + self._emails(1)
+        store.save_emails_bulk(emails)
+        self.assertEqual(sorted(r["gmail_message_id"] for r in chain.upsert_payload), ["m0", "m1"])
+
+    def test_save_email_wraps_bulk_path(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        result = store.save_email("s", "a@b.c", "2024-01-01T00:00:00Z", message_id="m1", account_id="acct-1")
+        self.assertIsNotNone(result)
+        self.assertEqual(len(chain.upsert_payload), 1)
+        # Single-row writes return the row so callers can confirm the write.
+        self.assertEqual(chain.returning_value, "representation")
+
+    def test_save_email_without_id_returns_none(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(chain)
+        with patch("backend.infrastructure.supabase_store.ALLOW_NULL_GMAIL_ID", False):
+            self.assertIsNone(store.save_email("s", "a@b.c", "2024-01-01T00:00:00Z"))
+        self.assertFalse(chain.execute_called)
+
+
+
+# ---------------------------------------------------------------------------
+# K. get_emails_with_summaries — single RPC with two-query fallback
+# ---------------------------------------------------------------------------
+
+class TestSupabaseStoreEmailsWithSummaries(unittest.TestCase):
+    def setUp(self):
+        SupabaseStore._summaries_rpc_available = True
+
+    def tearDown(self):
+        SupabaseStore._summaries_rpc_available = True
+
+    def _make_store(self, client):
+        store = object.__new__(SupabaseStore)
+        store.client = client
+        return store
+
+    def test_rpc_result_returned_without_table_queries(self):
+        client = MagicMock()
+        rows = [{"gmail_message_id": "m1", "ai_summary_text": "hi"}]
+        client.rpc.return_value.execute.return_value = _FakeResult(rows)
+        store = self._make_store(client)
+
+        result = store.get_emails_with_summaries(limit=10, account_id="acct-1", preferred_language="fr")
+
+        self.assertEqual(result, rows)
+        name, params = client.rpc.call_args[0]
+        self.assertEqual(name, "get_emails_with_summaries")
+        self.assertEqual(params["p_account_id"], "acct-1")
+        self.assertEqual(params["p_limit"], 10)
+        self.assertEqual(params["p_preferred_language"], "fr")
+        client.table.assert_not_called()
+
+    def test_get_emails_selects_explicit_columns(self):
+        chain = _FakeChain(data=[])
+        store = self._make_store(_FakeClient(chain=chain))
+        store.get_emails(limit=5, account_id="acct-1")
+        cols = chain.selected_cols.split(",")
+        self.assertIn("gmail_message_id", cols)
+        self.assertIn("has_attachments", cols)
+        self.assertNotIn("*", cols)
+        self.assertNotIn("search_vector", cols)
+
+    def test_read_errors_return_empty_response(self):
+        store = self._make_store(_FakeClient(chain=_FakeChain(raise_on_execute=True)))
+        for result in (store.get_emails(account_id="acct-1"), store.get_threads("acct-1")):
+            self.assertEqual(result.data, [])
+            self.assertEqual(result.count, 0)
+        # Each error path gets its own list; callers may mutate .data.
+        self.assertIsNot(store.get_emails().data, store.get_emails().data)
+
+    def test_missing_rpc_falls_back_and_is_not_retried(self):
+        client = MagicMock()
+        missing = Exception("function not found")
+        missing.code = "PGRST202"
+        client.rpc.return_value.execute.side_effect = missing
+        chain = client.table.return_value
+        for method in ("select", "eq", "order", "limit", "in_"):
+            getattr(chain, method).return_value = chain
+        chain.execute.return_value = _FakeResult([])
+        store = self._make_store(client)
+
+        self.assertEqual(store.get_emails_with_summaries(account_id="acct-1"), [])
+        self.assertFalse(SupabaseStore._summaries_rpc_available)
+        client.table.assert_called_with("emails")
+
+        store.get_emails_with_summaries(account_id="acct-1")
+        self.assertEqual(client.rpc.call_count, 1)
+
+    def test_fallback_merge_resolves_preferred_then_english(self):
+        SupabaseStore._summaries_rpc_available = False
+        emails = [{"gmail_message_id": "m1"}, {"gmail_message_id": "m2"}, {"gmail_message_id": None}]
+        summaries = [
+            {"gmail_message_id": "m1", "summary_language": "en", "summary_text": "en-1", "updated_at": "2"},
+            {"gmail_message_id": "m1", "summary_language": "fr", "summary_text": "fr-1", "updated_at": "1"},
+            {"gmail_message_id": "m2", "summary_language": "en", "summary_text": "en-2", "updated_at": "1"},
+        ]
+
+        def make_chain(data):
+            chain = MagicMock()
+            for method in ("select", "eq", "order", "limit", "in_"):
+                getattr(chain, method).return_value = chain
+            chain.execute.return_value = _FakeResult(data)
+            return chain
+
+        chains = {"emails": make_chain(emails), "email_ai_summaries": make_chain(summaries)}
+        client = MagicMock()
+        client.table.side_effect = lambda name: chains[name]
+        store = self._make_store(client)
+
+        result = store.get_emails_with_summaries(account_id="acct-1", preferred_language="fr")
+
+        self.assertEqual(result[0]["ai_summary_text"], "fr-1")
+        self.assertFalse(result[0]["ai_summary_is_fallback"])
+        self.assertTrue(result[0]["ai_preferred_language_available"])
+        self.assertEqual(result[1]["ai_summary_text"], "en-2")
+        self.assertTrue(result[1]["ai_summary_is_fallback"])
+        self.assertIsNone(result[2]["ai_summary_text"])
+        self.assertEqual(result[2]["ai_preferred_language"], "fr")
+        client.rpc.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+"""EMAIL-PREP-01 - EmailPreprocessor signature, reply-chain and whitespace stripping."""
+
+import unittest
+from unittest.mock import patch
+
+from backend.services import email_preprocessor as ep
+from backend.services.email_preprocessor import EmailPreprocessor, preprocess_email
+
+_HTML = (
+    "<html><head><title>T</title><style>p{}</style></head><body>"
+    "<p>Hello <b>world</b></p><!-- note --><script>track()</script>"
+    "<p>A&amp;B</p><table><tr><td>a</td><td>b</td></tr></table></body></html>"
+)
+
+
+class TestEmailPreprocessor(unittest.TestCase):
+    def test_cuts_at_first_signature_pattern(self):
+        text, removed = EmailPreprocessor()._remove_signature(
+            "Please review the attached plan before Friday.\n-- \nAlice\nSenior Engineer"
+        )
+        self.assertEqual(text, "Please review the attached plan before Friday.")
+        self.assertTrue(removed)
+
+    def test_pattern_order_not_position_picks_the_cut(self):
+        # 'Sent from my' appears first in the text, but the '--' delimiter is
+        # earlier in SIGNATURE_PATTERNS, so it decides where the body is cut.
+        text, _ = EmailPreprocessor()._remove_signature(
+            "Status update: Sent from my laptop, all green.\n--\nAlice"
+        )
+        self.assertEqual(text, "Status update: Sent from my laptop, all green.")
+
+    def test_body_without_markers_is_untouched(self):
+        body = "Can we move the sync to 3pm tomorrow?"
+        self.assertEqual(EmailPreprocessor()._remove_signature(body), (body, False))
+        self.assertEqual(EmailPreprocessor()._remove_reply_chain(body), (body, False))
+
+    def test_cuts_at_reply_indicator(self):
+        text, removed = EmailPreprocessor()._remove_reply_chain(
+            "Sounds good, ship it.\nOn Mon, Jan 1, 2024 John Doe wrote:\n> earlier message\n> more"
+        )
+        self.assertEqual(text, "Sounds good, ship it.")
+        self.assertTrue(removed)
+
+    def test_pipeline_strips_html_and_collapses_whitespace(self):
+        cleaned, stats = preprocess_email(
+            "<html><body><p>Hello   there</p><script>track()</script>"
+            "<p>Agenda attached.</p></body></html>"
+        )
+        self.assertTrue(stats["html_stripped"])
+        self.assertNotIn("track()", cleaned)
+        self.assertNotIn("  ", cleaned)
+        self.assertIn("Hello there", cleaned)
+        self.assertIn("Agenda attached.", cleaned)
+
+
+@unittest.skipIf(ep._FastHTMLParser is None, "selectolax not installed")
+class TestFastHtmlParserParity(unittest.TestCase):
+    def test_preprocessor_strip_matches_beautifulsoup(self):
+        fast = EmailPreprocessor()._strip_html_tags(_HTML)
+        with patch.object(ep, "_FastHTMLParser", None):
+            slow = EmailPreprocessor()._strip_html_tags(_HTML)
+        self.assertEqual(fast, slow)
+
+    def test_gmail_clean_html_matches_beautifulsoup(self):
+        from backend.services import gmail_engine
+        fast = gmail_engine.clean_html(_HTML)
+        with patch.object(gmail_engine, "_FastHTMLParser", None):
+            slow = gmail_engine.clean_html(_HTML)
+        self.assertEqual(fast, slow)
+        self.assertNotIn("track()", fast)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,281 @@
+"""
+Gmail message batch fetch — unit tests.
+
+Coverage:
+  A   GmailClient.get_messages_batch chunking, 404 handling and per-message retry
+      (delegates to the shared gmail_client.fetch_messages_batch helper)
+  B   GmailProvider.get_delta_emails fetches history messages through the batch path
+  C   GmailProvider reuses one Gmail API client and token load per account across cycles
+  D   gmail_engine.run_engine / fetch_sent_messages fetch each listed page in one batch
+
+No live Gmail, OAuth or network access.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from googleapiclient.errors import HttpError
+
+from backend.api.gmail_client import GmailClient
+
+
+def _http_error(status):
+    resp = MagicMock()
+    resp.status = status
+    resp.reason = "err"
+    return HttpError(resp, b"{}")
+
+
+class _FakeBatch:
+    def __init__(self, callback, outcomes, executed):
+        self._callback = callback
+        self._outcomes = outcomes
+        self._executed = executed
+        self._ids = []
+
+    def add(self, request, request_id=None):
+        self._ids.append(request_id)
+
+    def execute(self):
+        self._executed.append(list(self._ids))
+        for message_id in self._ids:
+            outcome = self._outcomes[message_id]
+            if isinstance(outcome, Exception):
+                self._callback(message_id, None, outcome)
+            else:
+                self._callback(message_id, outcome, None)
+
+
+def _fake_service(outcomes):
+    service = MagicMock()
+    executed = []
+    service.new_batch_http_request.side_effect = (
+        lambda callback: _FakeBatch(callback, outcomes, executed)
+    )
+    return service, executed
+
+
+def _make_client(outcomes):
+    client = object.__new__(GmailClient)
+    client.service, executed = _fake_service(outcomes)
+    return client, executed
+
+
+def _reset_provider_caches():
+    from backend.providers import gmail as gmail_provider_module
+    gmail_provider_module._IDLE_WORKER_CLIENTS.clear()
+    gmail_provider_module._TOKEN_DATA_CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# A. GmailClient.get_messages_batch
+# ---------------------------------------------------------------------------
+
+class TestGetMessagesBatch(unittest.TestCase):
+
+    def test_ids_are_chunked_per_batch_request(self):
+        ids = [f"m{i}" for i in range(GmailClient.MESSAGE_BATCH_SIZE + 3)]
+        client, executed = _make_client({m: {"id": m} for m in ids})
+        result = client.get_messages_batch(ids + ["m0"])
+        self.assertEqual([len(chunk) for chunk in executed], [GmailClient.MESSAGE_BATCH_SIZE, 3])
+        self.assertEqual(set(result), set(ids))
+        self.assertEqual(result["m1"], {"id": "m1"})
+
+    def test_not_found_maps_to_none(self):
+        client, _ = _make_client({"m1": {"id": "m1"}, "m2": _http_error(404)})
+        result = client.get_messages_batch(["m1", "m2"])
+        self.assertIsNone(result["m2"])
+
+    def test_other_errors_retried_individually(self):
+        client, _ = _make_client({"m1": _http_error(429)})
+        get = client.service.users.return_value.messages.return_value.get
+        get.return_value.execute.return_value = {"id": "m1"}
+        result = client.get_messages_batch(["m1"])
+        get.return_value.execute.assert_called_once_with()
+        self.assertEqual(result["m1"], {"id": "m1"})
+
+    def test_retry_failure_raises(self):
+        client, _ = _make_client({"m1": _http_error(500)})
+        get = client.service.users.return_value.messages.return_value.get
+        get.return_value.execute.side_effect = _http_error(500)
+        with self.assertRaises(RuntimeError):
+            client.get_messages_batch(["m1"])
+
+    def test_retry_not_found_maps_to_none(self):
+        client, _ = _make_client({"m1": _http_error(429)})
+        get = client.service.users.return_value.messages.return_value.get
+        get.return_value.execute.side_effect = _http_error(404)
+        self.assertIsNone(client.get_messages_batch(["m1"])["m1"])
+
+
+# ---------------------------------------------------------------------------
+# B. GmailProvider.get_delta_emails
+# ---------------------------------------------------------------------------
+
+class TestGmailProviderDeltaBatch(unittest.TestCase):
+
+    def setUp(self):
+        _reset_provider_caches()
+        self.addCleanup(_reset_provider_caches)
+
+    def _raw(self, message_id):
+        return {
+            "id": message_id,
+            "threadId": f"t-{message_id}",
+            "labelIds": ["INBOX"],
+            "payload": {"headers": [{"name": "Subject", "value": f"s-{message_id}"}]},
+        }
+
+    def test_history_messages_fetched_in_one_batch_call(self):
+        # Imported here, not at module level: backend.providers.gmail loads
+        # backend.core, and doing that during collection (before
+        # backend.api.service swaps sys.stdout) breaks pytest's capture fd.
+        from backend.providers.gmail import GmailProvider
+
+        fake_client = MagicMock()
+        fake_client.get_current_history_id.return_value = "200"
+        fake_client.list_history.return_value = [
+            {"messagesAdded": [{"message": {"id": "m1"}}, {"message": {"id": "m2"}}]},
+            {"messagesAdded": [{"message": {"id": "m1"}}]},
+        ]
+        fake_client.get_messages_batch.return_value = {"m1": self._raw("m1"), "m2": None}
+
+        provider = GmailProvider()
+        with patch.object(provider, "_load_token_data", return_value={"token": "t"}), \
+                patch("backend.providers.gmail.WorkerGmailClient", return_value=fake_client):
+            emails, cursor = provider.get_delta_emails("acc1", "100")
+
+        fake_client.get_messages_batch.assert_called_once_with(["m1", "m2"])
+        fake_client.get_message.assert_not_called()
+        self.assertEqual(cursor, "200")
+        self.assertEqual([e.message_id for e in emails], ["m1"])
+        self.assertEqual(emails[0].subject, "s-m1")
+
+
+# ---------------------------------------------------------------------------
+# C. GmailProvider client reuse
+# ---------------------------------------------------------------------------
+
+class TestGmailProviderClientReuse(unittest.TestCase):
+
+    def setUp(self):
+        _reset_provider_caches()
+        self.addCleanup(_reset_provider_caches)
+
+    def _sync(self, provider, token_data, client_factory):
+        with patch.object(provider, "_load_token_data", return_value=token_data), \
+                patch("backend.providers.gmail.WorkerGmailClient", side_effect=client_factory) as mock_cls:
+            provider.get_delta_emails("acc1", "100")
+        return mock_cls.call_count
+
+    def _client(self):
+        client = MagicMock()
+        client.get_current_history_id.return_value = "100"
+        return client
+
+    def test_client_built_once_and_reused_across_cycles(self):
+        from backend.providers.gmail import GmailProvider
+
+        provider = GmailProvider()
+        token = {"token": "t1", "refresh_token": "r1", "client_id": "c"}
+        self.assertEqual(self._sync(provider, token, lambda _: self._client()), 1)
+        # A refreshed access token alone does not rebuild the client.
+        from backend.providers import gmail as gmail_provider_module
+        gmail_provider_module._TOKEN_DATA_CACHE.clear()  # token TTL expired
+        self.assertEqual(self._sync(GmailProvider(), dict(token, token="t2"), lambda _: self._client()), 0)
+
+    def test_token_data_loaded_once_across_cycles(self):
+        from backend.providers.gmail import GmailProvider
+
+        provider = GmailProvider()
+        token = {"token": "t", "refresh_token": "r"}
+        with patch.object(provider, "_load_token_data", return_value=token) as mock_load, \
+                patch("backend.providers.gmail.WorkerGmailClient", side_effect=lambda _: self._client()):
+            provider.get_delta_emails("acc1", "100")
+            provider.get_delta_emails("acc1", "100")
+        mock_load.assert_called_once_with("acc1")
+
+    def test_new_grant_rebuilds_client(self):
+        from backend.providers.gmail import GmailProvider
+
+        provider = GmailProvider()
+        self._sync(provider, {"token": "t", "refresh_token": "r1"}, lambda _: self._client())
+        from backend.providers import gmail as gmail_provider_module
+        gmail_provider_module._TOKEN_DATA_CACHE.clear()  # token TTL expired
+        self.assertEqual(self._sync(provider, {"token": "t", "refresh_token": "r2"}, lambda _: self._client()), 1)
+
+    def test_failed_client_is_not_reused(self):
+        from backend.providers.gmail import GmailProvider
+
+        broken = self._client()
+        broken.get_current_history_id.side_effect = RuntimeError("Gmail history fetch failed")
+        provider = GmailProvider()
+        token = {"token": "t", "refresh_token": "r"}
+        with self.assertRaises(RuntimeError):
+            self._sync(provider, token, lambda _: broken)
+        from backend.providers import gmail as gmail_provider_module
+        self.assertNotIn("acc1", gmail_provider_module._TOKEN_DATA_CACHE)
+        self.assertEqual(self._sync(provider, token, lambda _: self._client()), 1)
+
+
+# ---------------------------------------------------------------------------
+# D. gmail_engine batched page fetch
+# ---------------------------------------------------------------------------
+
+def _engine_message(message_id, labels=("INBOX", "UNREAD")):
+    return {
+        "id": message_id,
+        "threadId": f"t-{message_id}",
+        "labelIds": list(labels),
+        "internalDate": "1700000000000",
+        "payload": {"headers": [{"name": "Subject", "value": f"s-{message_id}"}], "mimeType": "text/plain"},
+    }
+
+
+class TestGmailEngineBatch(unittest.TestCase):
+    _TOKEN = {"token": "t", "refresh_token": "r", "client_id": "c", "client_secret": "s"}
+
+    def _service(self, ids, outcomes):
+        service, executed = _fake_service(outcomes)
+        service.users.return_value.messages.return_value.list.return_value.execute.return_value = {
+            "messages": [{"id": i} for i in ids]
+        }
+        return service, executed
+
+    def _run(self, fn, service, **kwargs):
+        from backend.services import gmail_engine
+        with patch.object(gmail_engine, "build", return_value=service), \
+                patch.object(gmail_engine, "Credentials"):
+            return getattr(gmail_engine, fn)(self._TOKEN, **kwargs)
+
+    def test_run_engine_fetches_page_in_one_batch_and_skips_deleted(self):
+        service, executed = self._service(
+            ["m1", "m2", "m3"],
+            {"m1": _engine_message("m1"), "m2": _http_error(404), "m3": _engine_message("m3")},
+        )
+        emails = self._run("run_engine", service, max_emails=3)
+        self.assertEqual(executed, [["m1", "m2", "m3"]])
+        self.assertEqual([e["message_id"] for e in emails], ["m1", "m3"])
+        self.assertEqual(emails[0]["subject"], "s-m1")
+        service.users.return_value.messages.return_value.get.return_value.execute.assert_not_called()
+
+    def test_sent_backfill_retries_throttled_message_once(self):
+        service, executed = self._service(
+            ["s1", "s2"], {"s1": _http_error(429), "s2": _engine_message("s2", ("SENT",))}
+        )
+        service.users.return_value.messages.return_value.get.return_value.execute.return_value = (
+            _engine_message("s1", ("SENT",))
+        )
+        sent = self._run("fetch_sent_messages", service, max_messages=2)
+        self.assertEqual(executed, [["s1", "s2"]])
+        self.assertEqual([m["gmail_message_id"] for m in sent], ["s1", "s2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
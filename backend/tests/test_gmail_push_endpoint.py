@@ -0,0 +1,63 @@
+"""GMAIL-PUSH-01 - Pub/Sub push endpoint wakes the sync worker."""
+
+import base64
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+
+def _envelope(notification):
+    data = base64.b64encode(json.dumps(notification).encode("utf-8")).decode("ascii")
+    return {"message": {"data": data, "messageId": "1"}, "subscription": "projects/p/subscriptions/s"}
+
+
+class TestGmailPushEndpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from backend.api import service
+
+        cls.client = TestClient(service.app)
+
+    def test_notification_wakes_worker(self):
+        with patch.dict(os.environ, {"PUBSUB_PUSH_TOKEN": "s3cret"}), \
+                patch("backend.infrastructure.worker.request_sync_wakeup") as mock_wake:
+            resp = self.client.post(
+                "/pubsub/push?token=s3cret",
+                json=_envelope({"emailAddress": "a@example.com", "historyId": 42}),
+            )
+        self.assertEqual(resp.status_code, 204)
+        mock_wake.assert_called_once_with()
+
+    def test_malformed_message_acknowledged_without_wake(self):
+        with patch.dict(os.environ, {"PUBSUB_PUSH_TOKEN": "s3cret"}), \
+                patch("backend.infrastructure.worker.request_sync_wakeup") as mock_wake:
+            resp = self.client.post("/pubsub/push?token=s3cret", json={"message": {}})
+        self.assertEqual(resp.status_code, 204)
+        mock_wake.assert_not_called()
+
+    def test_push_token_enforced_when_configured(self):
+        body = _envelope({"historyId": 1})
+        with patch.dict(os.environ, {"PUBSUB_PUSH_TOKEN": "s3cret"}), \
+                patch("backend.infrastructure.worker.request_sync_wakeup") as mock_wake:
+            denied = self.client.post("/pubsub/push?token=wrong", json=body)
+            allowed = self.client.post("/pubsub/push?token=s3cret", json=body)
+        self.assertEqual(denied.status_code, 403)
+        self.assertEqual(allowed.status_code, 204)
+        mock_wake.assert_called_once_with()
+
+    def test_rejected_when_no_token_configured(self):
+        env = {k: v for k, v in os.environ.items() if k != "PUBSUB_PUSH_TOKEN"}
+        with patch.dict(os.environ, env, clear=True), \
+                patch("backend.infrastructure.worker.request_sync_wakeup") as mock_wake:
+            bare = self.client.post("/pubsub/push", json=_envelope({"historyId": 1}))
+            guessed = self.client.post("/pubsub/push?token=", json=_envelope({"historyId": 1}))
+        self.assertEqual(bare.status_code, 403)
+        self.assertEqual(guessed.status_code, 403)
+        mock_wake.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""SEC-MGR-01 - SecurityManager singleton initialization and token round trip."""
+
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from cryptography.fernet import Fernet
+
+from backend.security import security_manager as sm
+
+
+class TestSecurityManagerSingleton(unittest.TestCase):
+    def setUp(self):
+        sm._security_manager_instance = None
+        self.addCleanup(setattr, sm, "_security_manager_instance", None)
+
+    def test_concurrent_first_use_builds_one_instance(self):
+        barrier = threading.Barrier(8)
+        instances = []
+
+        def grab():
+            barrier.wait()
+            instances.append(sm.get_security_manager())
+
+        with patch.dict(os.environ, {"FERNET_KEY": Fernet.generate_key().decode()}), \
+                patch.object(sm, "SecurityManager", wraps=sm.SecurityManager) as mock_cls:
+            threads = [threading.Thread(target=grab) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(mock_cls.call_count, 1)
+        self.assertEqual(len({id(i) for i in instances}), 1)
+
+    def test_token_round_trip(self):
+        with patch.dict(os.environ, {"FERNET_KEY": Fernet.generate_key().decode()}):
+            encrypted = sm.encrypt_oauth_token("ya29.token")
+            self.assertNotEqual(encrypted, "ya29.token")
+            self.assertEqual(sm.decrypt_oauth_token(encrypted), "ya29.token")
+
+    def test_blank_tokens_still_rejected(self):
+        with patch.dict(os.environ, {"FERNET_KEY": Fernet.generate_key().decode()}):
+            for fn in (sm.encrypt_oauth_token, sm.decrypt_oauth_token):
+                for value in ("", "   "):
+                    with self.assertRaises(sm.SecurityManagerError):
+                        fn(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
 from unittest.mock import patch, MagicMock
 import threading
 
+from backend.infrastructure import supabase_store
 from backend.infrastructure.supabase_store import (
+    SUPABASE_HTTP_LIMITS,
+    SUPABASE_HTTP_TIMEOUT,
+    _get_http_client,
     get_store_instance,
     reset_store_instance,
     SupabaseStore,
@@ -87,4 +91,52 @@ def test_safe_get_store_returns_none_on_failure():
     with patch("backend.api.service.get_store_instance", side_effect=RuntimeError("no env")):
         result = safe_get_store()
 
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_http_client_is_shared_across_calls():
+    assert _get_http_client() is _get_http_client()
+
+
+def test_http_client_uses_http2_and_fast_connect_timeout():
+    original = supabase_store._http_client
+    supabase_store._http_client = None
+    try:
+        with patch("backend.infrastructure.supabase_store.httpx.Client") as mock_client:
+            client = _get_http_client()
+
+        assert client is mock_client.return_value
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"] is SUPABASE_HTTP_LIMITS
+        assert kwargs["timeout"] is SUPABASE_HTTP_TIMEOUT
+        assert kwargs["follow_redirects"] is True
+        assert SUPABASE_HTTP_TIMEOUT.connect == 10.0
+    finally:
+        supabase_store._http_client = original
+
+
+def test_store_client_reuses_shared_http_client():
+    reset_store_instance()
+    try:
+        with patch.dict("os.environ", {"SUPABASE_URL": "https://example.supabase.co", "SUPABASE_SERVICE_KEY": "k"}), \
+                patch("backend.infrastructure.supabase_store.create_client") as mock_create:
+            SupabaseStore()
+
+        options = mock_create.call_args.kwargs["options"]
+        assert options.httpx_client is _get_http_client()
+    finally:
+        reset_store_instance()
+
+
+def test_store_construction_reuses_cached_client():
+    reset_store_instance()
+    try:
+        with patch.dict("os.environ", {"SUPABASE_URL": "https://example.supabase.co", "SUPABASE_SERVICE_KEY": "k"}), \
+                patch("backend.infrastructure.supabase_store.create_client") as mock_create:
+            first = SupabaseStore()
+            second = SupabaseStore()
+
+        assert first.client is second.client
+        mock_create.assert_called_once()
+    finally:
+        reset_store_instance()
@@ -18,6 +18,7 @@ from backend.infrastructure.supabase_store import (
     SupabaseStore,
     _DEFAULT_NOTIFICATION_PREFERENCES,
     _build_default_intelligence_profile,
+    _get_client,
 )
 
 TEST_JWT_SECRET = "test-secret-for-intelligence-profile-tests-32bytes"
@@ -75,6 +76,7 @@ class _FakeClient:
 
 
 def _make_store(chain):
+    _get_client.cache_clear()
     with (
         patch(
             "backend.infrastructure.supabase_store.create_client",
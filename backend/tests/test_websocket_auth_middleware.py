@@ -0,0 +1,87 @@
+"""WS-AUTH-MW-01 - legacy WebSocket auth middleware cookie parsing and verification."""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from backend.middleware import websocket_auth as wa
+
+
+class TestExtractTokenFromCookie(unittest.TestCase):
+    def test_token_found_among_other_cookies(self):
+        header = "theme=dark; auth_token=abc.def.ghi ; lang=en"
+        self.assertEqual(wa.extract_token_from_cookie(header), "abc.def.ghi")
+
+    def test_first_cookie_and_value_with_equals(self):
+        self.assertEqual(wa.extract_token_from_cookie("auth_token=a=b;x=1"), "a=b")
+
+    def test_suffix_cookie_name_is_not_matched(self):
+        self.assertIsNone(wa.extract_token_from_cookie("x_auth_token=nope; other=1"))
+
+    def test_missing_or_empty_header(self):
+        self.assertIsNone(wa.extract_token_from_cookie(""))
+        self.assertIsNone(wa.extract_token_from_cookie("theme=dark"))
+
+    def test_quoted_and_url_encoded_values_are_decoded(self):
+        self.assertEqual(wa.extract_token_from_cookie('lang=en; auth_token="abc.def.ghi"'), "abc.def.ghi")
+        self.assertEqual(wa.extract_token_from_cookie("auth_token=abc%2Edef.ghi; lang=en"), "abc.def.ghi")
+
+
+class TestAuthenticateSocket(unittest.TestCase):
+    def setUp(self):
+        wa._verified_tokens.clear()
+        self.addCleanup(wa._verified_tokens.clear)
+
+    def test_valid_cookie_token_authenticates(self):
+        with patch.object(wa.JWTService, "verify_token", return_value={"email": "a@example.com"}) as mock_verify:
+            ok = asyncio.run(wa.authenticate_socket("sid1", {"HTTP_COOKIE": "auth_token=tok"}))
+        self.assertTrue(ok)
+        mock_verify.assert_called_once_with("tok")
+
+    def test_missing_token_rejected_without_verification(self):
+        with patch.object(wa.JWTService, "verify_token") as mock_verify:
+            ok = asyncio.run(wa.authenticate_socket("sid1", {"HTTP_COOKIE": "theme=dark"}))
+        self.assertFalse(ok)
+        mock_verify.assert_not_called()
+
+    def test_repeat_token_verified_once(self):
+        payload = {"email": "a@example.com", "exp": time.time() + 3600}
+        with patch.object(wa.JWTService, "verify_token", return_value=payload) as mock_verify:
+            for sid in ("sid1", "sid2", "sid3"):
+                self.assertTrue(asyncio.run(wa.authenticate_socket(sid, {"HTTP_COOKIE": "auth_token=tok"})))
+        mock_verify.assert_called_once_with("tok")
+
+    def test_cached_token_reverified_after_expiry(self):
+        payload = {"email": "a@example.com", "exp": time.time() + 3600}
+        with patch.object(wa.JWTService, "verify_token", return_value=payload):
+            self.assertTrue(asyncio.run(wa.authenticate_socket("sid1", {"HTTP_COOKIE": "auth_token=tok"})))
+        with patch.object(wa.JWTService, "verify_token", return_value=None) as mock_verify, \
+                patch.object(wa, "time") as mock_time:
+            mock_time.time.return_value = payload["exp"] + 1
+            self.assertFalse(asyncio.run(wa.authenticate_socket("sid2", {"HTTP_COOKIE": "auth_token=tok"})))
+        mock_verify.assert_called_once_with("tok")
+
+    def test_rejected_token_is_not_cached(self):
+        with patch.object(wa.JWTService, "verify_token", side_effect=[None, {"email": "a@example.com"}]) as mock_verify:
+            self.assertFalse(asyncio.run(wa.authenticate_socket("sid1", {"HTTP_COOKIE": "auth_token=tok"})))
+            self.assertTrue(asyncio.run(wa.authenticate_socket("sid2", {"HTTP_COOKIE": "auth_token=tok"})))
+        self.assertEqual(mock_verify.call_count, 2)
+
+    def test_callers_get_independent_payload_copies(self):
+        payload = {"email": "a@example.com", "exp": time.time() + 3600}
+        with patch.object(wa.JWTService, "verify_token", return_value=payload):
+            first = wa._verify_token("tok")
+            first["email"] = "mutated@example.com"
+            second = wa._verify_token("tok")
+        self.assertEqual(second["email"], "a@example.com")
+
+    def test_cache_is_bounded(self):
+        with patch.object(wa, "VERIFY_CACHE_MAXSIZE", 2), \
+                patch.object(wa.JWTService, "verify_token", return_value={"email": "a@example.com"}):
+            for tok in ("t1", "t2", "t3"):
+                wa._verify_token(tok)
+        self.assertEqual(list(wa._verified_tokens), ["t2", "t3"])
+
+if __name__ == "__main__":
+    unittest.main()
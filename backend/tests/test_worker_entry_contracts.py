@@ -13,6 +13,7 @@ Coverage groups:
 No live uvicorn, threads, Supabase, Gmail, Mistral, OAuth, network, or real secrets.
 """
 
+import asyncio
 import io
 import os
 import sys
@@ -164,50 +165,76 @@ class TestWorkerEntryImportSafety(unittest.TestCase):
 # B. FastAPI app and /healthz endpoint behavior
 # ---------------------------------------------------------------------------
 
+def _healthz():
+    return asyncio.run(entry_module.healthz())
+
+
 class TestWorkerEntryHealthzEndpoint(unittest.TestCase):
     def test_healthz_returns_worker_ok_when_last_cycle_within_180s(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {"last_cycle": time.time() - 10}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertEqual(result["status"], "worker-ok")
 
     def test_healthz_returns_stalled_when_last_cycle_older_than_180s(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {"last_cycle": time.time() - 500}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertEqual(result["status"], "stalled")
 
+    def test_healthz_allows_idle_backoff_sleep(self):
+        heartbeat = {"last_cycle": time.time() - 500, "next_poll_seconds": 600}
+        with patch.object(entry_module, 'WORKER_HEARTBEAT', heartbeat):
+            result = _healthz()
+        self.assertEqual(result["status"], "worker-ok")
+
+    def test_healthz_prefers_monotonic_age_over_wall_clock(self):
+        # Wall clock stepped back an hour after the worker's last write.
+        heartbeat = {"last_cycle": time.time() + 3600, "last_cycle_monotonic": time.monotonic() - 500}
+        with patch.object(entry_module, 'WORKER_HEARTBEAT', heartbeat):
+            result = _healthz()
+        self.assertEqual(result["status"], "stalled")
+        self.assertGreaterEqual(result["last_cycle_seconds_ago"], 500)
+
     def test_healthz_returns_stalled_when_no_last_cycle_key(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertEqual(result["status"], "stalled")
 
+    def test_healthz_route_serves_compact_json(self):
+        from fastapi.testclient import TestClient
+        with patch.object(entry_module, 'WORKER_HEARTBEAT', {"last_cycle": time.time() - 10}):
+            res = TestClient(entry_module.app).get("/healthz")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.headers["content-type"], "application/json")
+        self.assertEqual(res.json()["status"], "worker-ok")
+
     def test_healthz_returns_minus_one_last_cycle_when_no_key(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertEqual(result["last_cycle_seconds_ago"], -1)
 
     def test_healthz_always_returns_mode_worker(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertEqual(result["mode"], "worker")
 
     def test_healthz_returns_integer_age_when_last_cycle_set(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {"last_cycle": time.time() - 60}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertIsInstance(result["last_cycle_seconds_ago"], int)
 
     def test_healthz_returns_positive_age_when_last_cycle_set(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {"last_cycle": time.time() - 90}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertGreater(result["last_cycle_seconds_ago"], 0)
 
     def test_healthz_boundary_just_inside_180s_is_worker_ok(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {"last_cycle": time.time() - 179}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertEqual(result["status"], "worker-ok")
 
     def test_healthz_boundary_just_outside_180s_is_stalled(self):
         with patch.object(entry_module, 'WORKER_HEARTBEAT', {"last_cycle": time.time() - 181}):
-            result = entry_module.healthz()
+            result = _healthz()
         self.assertEqual(result["status"], "stalled")
 
 
@@ -251,6 +278,30 @@ class TestWorkerEntryStartWorker(unittest.TestCase):
 
         self.assertGreaterEqual(call_count[0], 2, "Loop must restart after exception")
 
+    def test_restart_delay_backs_off_and_counts_crashes(self):
+        """Consecutive crashes double the (jittered) delay up to the cap and bump restart_count."""
+        call_count = [0]
+
+        def fake_run():
+            call_count[0] += 1
+            if call_count[0] <= 10:
+                raise Exception("simulated crash")
+            raise KeyboardInterrupt
+
+        sleeps = []
+        with patch.object(entry_module, 'run_worker_loop', fake_run), \
+                patch.object(entry_module.random, 'random', return_value=0.5), \
+                patch.dict(entry_module.WORKER_HEARTBEAT, {"restart_count": 0}), \
+                patch('time.sleep', side_effect=sleeps.append):
+            try:
+                entry_module.start_worker()
+            except KeyboardInterrupt:
+                pass
+            restart_count = entry_module.WORKER_HEARTBEAT["restart_count"]
+
+        self.assertEqual(sleeps, [1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0, 300.0])
+        self.assertEqual(restart_count, 10)
+
 
 # ---------------------------------------------------------------------------
 # D. start_ai_worker() execution and exception handling
@@ -446,6 +497,17 @@ class TestWorkerEntryMainUvicorn(unittest.TestCase):
                             entry_module.main()
         mock_vs.assert_called_once()
 
+    def test_main_skips_validate_startup_when_flag_set(self):
+        with patch.dict(sys.modules, {'backend.api.service': _make_svc_stub()}):
+            with patch.object(entry_module, 'validate_startup') as mock_vs:
+                with patch('threading.Thread'):
+                    with patch.object(entry_module.uvicorn, 'run'):
+                        env = {'WORKER_MODE': 'false', 'AI_SUMM_ENABLED': 'false', 'SKIP_STARTUP_VALIDATION': 'true'}
+                        with patch.dict(os.environ, env, clear=False):
+                            os.environ.pop('PORT', None)
+                            entry_module.main()
+        mock_vs.assert_not_called()
+
     def test_main_raises_value_error_on_invalid_port(self):
         """int() on a non-numeric PORT string propagates ValueError."""
         with patch.dict(sys.modules, {'backend.api.service': _make_svc_stub()}):
@@ -5,7 +5,8 @@ Coverage groups:
   A   _fetch_account_records — credential query and cursor resolution
   B   _save_delta_cursor — conditional persistence
   C   _sync_one_account — provider dispatch, error handling, email ingestion
-  D   run_worker_loop — controlled-exit paths (schema mismatch, no accounts, disabled)
+  D   run_worker_loop — controlled-exit paths (schema mismatch, no accounts, disabled),
+      adaptive cycle sleep
   E   require_env — environment variable validation
   F   get_stable_worker_id — ID generation
   G   main disabled path
@@ -27,6 +28,7 @@ if _REPO_ROOT not in sys.path:
 
 import io
 import logging
+import time
 import types
 
 # ── Capture-safety block ────────────────────────────────────────────────────
@@ -204,7 +206,7 @@ class TestFetchAccountRecords(unittest.TestCase):
             return first_chain if call_count["n"] == 1 else fallback_chain
 
         store.client.table.side_effect = table_side_effect
-        store.get_sync_state.return_value = None
+        store.get_sync_states.return_value = {}
         ctrl = _make_control(store)
 
         records = worker_module._fetch_account_records(ctrl, "primary")
@@ -229,20 +231,25 @@ class TestFetchAccountRecords(unittest.TestCase):
         records = worker_module._fetch_account_records(ctrl, "primary")
         self.assertEqual(records[0]["provider"], "gmail")
 
-    # A5 — when delta_cursor is missing, calls control.store.get_sync_state
-    def test_calls_get_sync_state_when_no_delta_cursor(self):
-        data = [{"account_id": "acc5", "provider": "gmail", "delta_cursor": None}]
+    # A5 — accounts missing delta_cursor get legacy cursors from one batched read
+    def test_calls_get_sync_states_once_for_accounts_without_delta_cursor(self):
+        data = [
+            {"account_id": "acc5", "provider": "gmail", "delta_cursor": None},
+            {"account_id": "acc5b", "provider": "gmail", "delta_cursor": "own"},
+            {"account_id": "acc5c", "provider": "gmail", "delta_cursor": None},
+        ]
         ctrl = self._ctrl(table_data=data)
-        ctrl.store.get_sync_state.return_value = "legacy-cursor"
+        ctrl.store.get_sync_states.return_value = {"acc5": "legacy-cursor"}
         records = worker_module._fetch_account_records(ctrl, "primary")
-        ctrl.store.get_sync_state.assert_called_once_with("primary", "acc5")
-        self.assertEqual(records[0]["delta_cursor"], "legacy-cursor")
+        ctrl.store.get_sync_states.assert_called_once_with("primary", ["acc5", "acc5c"])
+        ctrl.store.get_sync_state.assert_not_called()
+        self.assertEqual([r["delta_cursor"] for r in records], ["legacy-cursor", "own", None])
 
-    # A6 — if get_sync_state raises, record still included with delta_cursor=None
+    # A6 — if get_sync_states raises, records still included with delta_cursor=None
     def test_get_sync_state_exception_yields_none_cursor(self):
         data = [{"account_id": "acc6", "provider": "gmail", "delta_cursor": None}]
         ctrl = self._ctrl(table_data=data)
-        ctrl.store.get_sync_state.side_effect = RuntimeError("db error")
+        ctrl.store.get_sync_states.side_effect = RuntimeError("db error")
         records = worker_module._fetch_account_records(ctrl, "primary")
         self.assertEqual(len(records), 1)
         self.assertIsNone(records[0]["delta_cursor"])
@@ -309,8 +316,11 @@ class TestSyncOneAccount(unittest.TestCase):
         chain = _make_chain(data=existing_data)
         store = MagicMock()
         store.client.table.return_value = chain
-        store.save_email_atomic.return_value = _FakeResponse({"job_created": True, "job_existed": False})
-        store.enqueue_ai_job.return_value = "job-001"
+        store.save_emails_atomic_bulk.side_effect = lambda rows, **kw: {
+            row["message_id"]: {"job_created": row["create_ai_job"], "job_existed": False}
+            for row in rows
+        }
+        store.enqueue_ai_jobs_bulk.return_value = ["job-001"]
         ctrl = _make_control(store)
         return ctrl
 
@@ -319,7 +329,7 @@ class TestSyncOneAccount(unittest.TestCase):
         ctrl = _make_control()
         with patch("backend.infrastructure.worker.get_provider", side_effect=ValueError("unknown")):
             worker_module._sync_one_account("acc1", "unknown_prov", None, ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_not_called()
+        ctrl.store.save_emails_atomic_bulk.assert_not_called()
 
     # C2 — provider.get_delta_emails raises RuntimeError with "invalid_grant" -> returns
     def test_returns_on_invalid_grant(self):
@@ -328,7 +338,7 @@ class TestSyncOneAccount(unittest.TestCase):
         fake_provider.get_delta_emails.side_effect = RuntimeError("invalid_grant token expired")
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_not_called()
+        ctrl.store.save_emails_atomic_bulk.assert_not_called()
 
     # C3 — provider.get_delta_emails raises RuntimeError with "auth_required" -> returns
     def test_returns_on_auth_required(self):
@@ -337,7 +347,7 @@ class TestSyncOneAccount(unittest.TestCase):
         fake_provider.get_delta_emails.side_effect = RuntimeError("auth_required: no token")
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_not_called()
+        ctrl.store.save_emails_atomic_bulk.assert_not_called()
 
     # C4 — no-op cursor path: last_cursor == current_cursor and no emails -> returns without save
     def test_noop_when_cursor_unchanged_and_no_emails(self):
@@ -346,7 +356,7 @@ class TestSyncOneAccount(unittest.TestCase):
         fake_provider.get_delta_emails.return_value = ([], "stable-cursor")
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             worker_module._sync_one_account("acc1", "gmail", "stable-cursor", ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_not_called()
+        ctrl.store.save_emails_atomic_bulk.assert_not_called()
 
     # C5 — missing message_id email is skipped
     def test_skips_email_with_no_message_id(self):
@@ -357,9 +367,9 @@ class TestSyncOneAccount(unittest.TestCase):
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             with patch.object(worker_module, "_save_delta_cursor") as mock_save:
                 worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_not_called()
+        ctrl.store.save_emails_atomic_bulk.assert_not_called()
 
-    # C6 — new email calls save_email_atomic with create_ai_job=True
+    # C6 — new email is saved with create_ai_job=True
     def test_new_email_saved_with_ai_job_true(self):
         ctrl = self._ctrl_with_emails_table(existing_ids=[])
         fake_provider = MagicMock()
@@ -368,12 +378,12 @@ class TestSyncOneAccount(unittest.TestCase):
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             with patch.object(worker_module, "_save_delta_cursor"):
                 worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_called_once()
-        kwargs = ctrl.store.save_email_atomic.call_args[1]
-        self.assertTrue(kwargs["create_ai_job"])
-        self.assertEqual(kwargs["message_id"], "mid-new")
+        ctrl.store.save_emails_atomic_bulk.assert_called_once()
+        (row,) = ctrl.store.save_emails_atomic_bulk.call_args[0][0]
+        self.assertTrue(row["create_ai_job"])
+        self.assertEqual(row["message_id"], "mid-new")
 
-    # C7 — existing email calls save_email_atomic with create_ai_job=False
+    # C7 — existing email is saved with create_ai_job=False
     def test_existing_email_saved_with_ai_job_false(self):
         ctrl = self._ctrl_with_emails_table(existing_ids=["mid-existing"])
         fake_provider = MagicMock()
@@ -382,9 +392,9 @@ class TestSyncOneAccount(unittest.TestCase):
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             with patch.object(worker_module, "_save_delta_cursor"):
                 worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_called_once()
-        kwargs = ctrl.store.save_email_atomic.call_args[1]
-        self.assertFalse(kwargs["create_ai_job"])
+        ctrl.store.save_emails_atomic_bulk.assert_called_once()
+        (row,) = ctrl.store.save_emails_atomic_bulk.call_args[0][0]
+        self.assertFalse(row["create_ai_job"])
 
     # C8 — document_process_v1 job is enqueued for new emails
     def test_document_job_enqueued_for_new_email(self):
@@ -395,12 +405,41 @@ class TestSyncOneAccount(unittest.TestCase):
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             with patch.object(worker_module, "_save_delta_cursor"):
                 worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
-        ctrl.store.enqueue_ai_job.assert_called_once_with(
-            account_id="acc1",
-            gmail_message_id="mid-new2",
+        ctrl.store.enqueue_ai_jobs_bulk.assert_called_once_with(
+            [("acc1", "mid-new2")],
+            job_type="document_process_v1",
+        )
+        ctrl.store.enqueue_ai_job.assert_not_called()
+
+    # C8b — document jobs for a whole sync are enqueued in one bulk call
+    def test_document_jobs_for_all_new_emails_enqueued_once(self):
+        ctrl = self._ctrl_with_emails_table(existing_ids=["mid-old"])
+        fake_provider = MagicMock()
+        emails = [_FakeEmail(message_id=m) for m in ("mid-a", "mid-old", "mid-b")]
+        fake_provider.get_delta_emails.return_value = (emails, "cursor-v3")
+        with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
+            with patch.object(worker_module, "_save_delta_cursor"):
+                worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
+        ctrl.store.enqueue_ai_jobs_bulk.assert_called_once_with(
+            [("acc1", "mid-a"), ("acc1", "mid-b")],
             job_type="document_process_v1",
         )
 
+    # C8c — a batch is saved with one store call, AI jobs capped per cycle
+    def test_batch_saved_in_one_call_with_ai_job_cap(self):
+        ctrl = self._ctrl_with_emails_table(existing_ids=[])
+        fake_provider = MagicMock()
+        emails = [_FakeEmail(message_id=f"mid-{n}") for n in range(25)]
+        fake_provider.get_delta_emails.return_value = (emails, "cursor-c8c")
+        with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
+            with patch.object(worker_module, "_save_delta_cursor"):
+                worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
+        ctrl.store.save_emails_atomic_bulk.assert_called_once()
+        rows = ctrl.store.save_emails_atomic_bulk.call_args[0][0]
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(sum(row["create_ai_job"] for row in rows), 20)
+        self.assertEqual(ctrl.store.save_emails_atomic_bulk.call_args[1]["account_id"], "acc1")
+
     # C9 — _save_delta_cursor is called when current_cursor is present
     def test_save_delta_cursor_called_when_cursor_present(self):
         ctrl = self._ctrl_with_emails_table(existing_ids=[])
@@ -409,8 +448,14 @@ class TestSyncOneAccount(unittest.TestCase):
         fake_provider.get_delta_emails.return_value = ([email], "returned-cursor")
         with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider):
             with patch.object(worker_module, "_save_delta_cursor") as mock_save:
-                worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
+                # Run the deferred write inline so the assertion is deterministic.
+                with patch.object(
+                    worker_module, "defer_coalesced_write",
+                    side_effect=lambda key, value, write: write(value),
+                ) as mock_defer:
+                    worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
         mock_save.assert_called_once_with(ctrl, "gmail", "acc1", "returned-cursor")
+        self.assertEqual(mock_defer.call_args[0][0], ("credentials.delta_cursor", "gmail", "acc1"))
 
     # C10 — SOCKETIO_AVAILABLE=False does not break per-account logic
     def test_no_socketio_does_not_raise(self):
@@ -423,7 +468,171 @@ class TestSyncOneAccount(unittest.TestCase):
                 with patch.object(worker_module, "_save_delta_cursor"):
                     # Should complete without error
                     worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
-        ctrl.store.save_email_atomic.assert_called_once()
+        ctrl.store.save_emails_atomic_bulk.assert_called_once()
+
+
+    # C11 — emails_updated is emitted on one long-lived loop, not a loop per emit
+    def test_socketio_emit_reuses_shared_event_loop(self):
+        from unittest.mock import AsyncMock
+        ctrl = self._ctrl_with_emails_table(existing_ids=[])
+        fake_provider = MagicMock()
+        fake_provider.get_delta_emails.return_value = ([_FakeEmail(message_id="mid-c11")], "cursor-c11")
+        fake_sio = MagicMock()
+        fake_sio.emit = AsyncMock()
+        with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider), \
+                patch.object(worker_module, "SOCKETIO_AVAILABLE", True), \
+                patch.object(worker_module, "sio", fake_sio), \
+                patch.object(worker_module, "safe_get_store", return_value=None), \
+                patch.object(worker_module, "_save_delta_cursor"), \
+                patch.object(worker_module.asyncio, "run") as mock_run:
+            worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
+            first_loop = worker_module._get_emit_loop()
+            worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
+            # Emits are fire-and-forget; wait for both to land on the loop.
+            deadline = time.monotonic() + 5
+            while fake_sio.emit.await_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        mock_run.assert_not_called()
+        self.assertEqual(fake_sio.emit.await_count, 2)
+        self.assertEqual(fake_sio.emit.await_args.args[0], "emails_updated")
+        self.assertIs(worker_module._get_emit_loop(), first_loop)
+        self.assertTrue(first_loop.is_running())
+
+    # C12 — a full emit backlog drops the event instead of blocking ingest
+    def test_socketio_emit_dropped_when_backlog_full(self):
+        import threading
+        ctrl = self._ctrl_with_emails_table(existing_ids=[])
+        fake_provider = MagicMock()
+        fake_provider.get_delta_emails.return_value = ([_FakeEmail(message_id="mid-c12")], "cursor-c12")
+        fake_sio = MagicMock()
+        with patch("backend.infrastructure.worker.get_provider", return_value=fake_provider), \
+                patch.object(worker_module, "SOCKETIO_AVAILABLE", True), \
+                patch.object(worker_module, "sio", fake_sio), \
+                patch.object(worker_module, "_emit_slots", threading.Semaphore(0)), \
+                patch.object(worker_module, "_save_delta_cursor"):
+            written = worker_module._sync_one_account("acc1", "gmail", None, ctrl, "primary")
+        self.assertEqual(written, 1)
+        fake_sio.emit.assert_not_called()
+
+class TestLoadSocketio(unittest.TestCase):
+
+    def test_service_imported_on_first_use_and_cached(self):
+        stub = types.ModuleType("backend.api.service")
+        stub.sio = object()
+        stub.safe_get_store = lambda: None
+        with patch.object(worker_module, "SOCKETIO_AVAILABLE", None), \
+                patch.object(worker_module, "sio", None), \
+                patch.object(worker_module, "safe_get_store", None), \
+                patch.dict(sys.modules, {"backend.api.service": stub}):
+            self.assertTrue(worker_module._load_socketio())
+            self.assertIs(worker_module.sio, stub.sio)
+            stub.sio = object()
+            self.assertTrue(worker_module._load_socketio())
+            self.assertIsNot(worker_module.sio, stub.sio)
+
+    def test_import_error_disables_emits(self):
+        with patch.object(worker_module, "SOCKETIO_AVAILABLE", None), \
+                patch.dict(sys.modules, {"backend.api.service": None}):
+            self.assertFalse(worker_module._load_socketio())
+            self.assertFalse(worker_module.SOCKETIO_AVAILABLE)
+
+
+class TestSyncAccounts(unittest.TestCase):
+
+    def test_every_record_synced_and_missing_account_skipped(self):
+        records = [
+            {"account_id": "a1", "provider": "gmail", "delta_cursor": "c1"},
+            {"account_id": None},
+            {"account_id": "a2", "provider": None, "delta_cursor": None},
+        ]
+        with patch.object(worker_module, "_sync_one_account") as mock_sync:
+            worker_module._sync_accounts(records, MagicMock(), "primary")
+        synced = sorted(c.args[:3] for c in mock_sync.call_args_list)
+        self.assertEqual(synced, [("a1", "gmail", "c1"), ("a2", "gmail", None)])
+
+    def test_accounts_overlap_and_one_failure_does_not_stop_others(self):
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+        done = []
+
+        def fake_sync(account_id, provider_name, last_cursor, control, tenant_id):
+            barrier.wait()  # both accounts must be in flight at once
+            if account_id == "bad":
+                raise RuntimeError("boom")
+            done.append(account_id)
+
+        records = [{"account_id": "bad"}, {"account_id": "good"}]
+        with patch.object(worker_module, "WORKER_ACCOUNT_CONCURRENCY", 2), \
+                patch.object(worker_module, "_sync_one_account", side_effect=fake_sync):
+            worker_module._sync_accounts(records, MagicMock(), "primary")
+        self.assertEqual(done, ["good"])
+
+    def test_returns_total_written_count(self):
+        records = [{"account_id": "a1"}, {"account_id": "a2"}, {"account_id": "bad"}]
+
+        def fake_sync(account_id, provider_name, last_cursor, control, tenant_id):
+            if account_id == "bad":
+                raise RuntimeError("boom")
+            return {"a1": 3, "a2": 0}[account_id]
+
+        for concurrency in (1, 3):
+            with patch.object(worker_module, "WORKER_ACCOUNT_CONCURRENCY", concurrency), \
+                    patch.object(worker_module, "_sync_one_account", side_effect=fake_sync):
+                self.assertEqual(worker_module._sync_accounts(records, MagicMock(), "primary"), 3)
+
+
+class TestGmailPushWakeup(unittest.TestCase):
+
+    def setUp(self):
+        worker_module._wake_event.clear()
+        worker_module._watch_renewed_at.clear()
+
+    def tearDown(self):
+        worker_module._wake_event.clear()
+        worker_module._watch_renewed_at.clear()
+
+    def test_wakeup_ends_wait_early_and_is_consumed(self):
+        worker_module.request_sync_wakeup()
+        self.assertTrue(worker_module._wait_for_next_cycle(5))
+        self.assertFalse(worker_module._wait_for_next_cycle(0))
+
+    def test_watch_not_registered_without_topic(self):
+        provider = MagicMock()
+        with patch.object(worker_module, "GMAIL_WATCH_TOPIC", ""):
+            worker_module._renew_gmail_watch("acc1", provider)
+        provider.start_watch.assert_not_called()
+
+    def test_watch_registered_once_per_renew_window(self):
+        provider = MagicMock()
+        provider.start_watch.return_value = {"historyId": "1", "expiration": "0"}
+        with patch.object(worker_module, "GMAIL_WATCH_TOPIC", "projects/p/topics/t"):
+            worker_module._renew_gmail_watch("acc1", provider)
+            worker_module._renew_gmail_watch("acc1", provider)
+        provider.start_watch.assert_called_once_with("acc1", "projects/p/topics/t")
+
+    def test_watch_failure_retried_after_retry_window(self):
+        provider = MagicMock()
+        provider.start_watch.side_effect = RuntimeError("Gmail watch failed: denied")
+        with patch.object(worker_module, "GMAIL_WATCH_TOPIC", "projects/p/topics/t"), \
+                patch("backend.infrastructure.worker.time") as mock_time:
+            mock_time.time.return_value = 1_000_000.0
+            worker_module._renew_gmail_watch("acc1", provider)
+            worker_module._renew_gmail_watch("acc1", provider)
+            mock_time.time.return_value += worker_module.GMAIL_WATCH_RETRY_SECONDS
+            worker_module._renew_gmail_watch("acc1", provider)
+        self.assertEqual(provider.start_watch.call_count, 2)
+
+
+class TestNextPollInterval(unittest.TestCase):
+
+    def test_empty_cycles_double_up_to_cap_and_hit_resets(self):
+        streak = 0
+        sleeps = []
+        for _ in range(7):
+            sleep_s, streak = worker_module._next_poll_interval(0, streak)
+            sleeps.append(sleep_s)
+        self.assertEqual(sleeps, [60, 120, 240, 480, 600, 600, 600])
+        self.assertEqual(worker_module._next_poll_interval(2, streak), (15, 0))
 
 
 # ===========================================================================
@@ -510,6 +719,38 @@ class TestRunWorkerLoop(unittest.TestCase):
 
         self.assertEqual(worker_module.WORKER_HEARTBEAT["status"], "disabled")
 
+    # D4 — cycle sleep adapts to what the previous cycle wrote
+    def test_cycle_sleep_backs_off_when_idle_and_resets_on_write(self):
+        sleeps = []
+
+        def sleep_sentinel(secs):
+            sleeps.append(secs)
+            if len(sleeps) >= 4:
+                raise _LoopEscaped("exit after four cycles")
+
+        fake_control = MagicMock()
+        fake_control.is_worker_enabled.return_value = True
+        fake_control.verify_schema.return_value = None
+
+        with patch("backend.infrastructure.worker.ControlPlane", return_value=fake_control) as MockCP:
+            MockCP.schema_state = "ok"
+            with patch("backend.infrastructure.worker._fetch_account_records",
+                       return_value=[{"account_id": "a1"}]), \
+                    patch("backend.infrastructure.worker._sync_accounts", side_effect=[0, 0, 5, 0]), \
+                    patch("backend.infrastructure.worker._wait_for_next_cycle", side_effect=sleep_sentinel):
+                with patch("backend.infrastructure.worker.time") as mock_time:
+                    mock_time.time.return_value = 0.0
+                    mock_time.strftime.return_value = "2026-01-01"
+                    with self.assertRaises(_LoopEscaped):
+                        worker_module.run_worker_loop()
+
+        self.assertEqual(sleeps, [60, 120, 15, 60])
+        self.assertEqual(worker_module.WORKER_HEARTBEAT["next_poll_seconds"], 60)
+        # Only the cycle that wrote mail is audited.
+        fake_control.log_audit.assert_called_once_with(
+            "cycle_complete", "provider_ingest", {"accounts": 1, "count": 5}
+        )
+
 
 # ===========================================================================
 # E — require_env
@@ -588,9 +829,9 @@ class TestMainDisabled(unittest.TestCase):
         entry_module.AI_WORKER_HEARTBEAT.update(self._ORIGINAL_HEARTBEAT)
         entry_module.AI_SUMM_ENABLED = self._ORIGINAL_ENABLED
 
-    # G1 — main returns without constructing SupabaseStore, MistralEngine, AISummarizerWorker
+    # G1 — main returns without resolving the store, MistralEngine, AISummarizerWorker
     def test_main_disabled_returns_early(self):
-        with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore") as MockStore:
+        with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance") as MockStore:
             with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine") as MockEngine:
                 with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker") as MockWorker:
                     entry_module.main()
@@ -600,7 +841,7 @@ class TestMainDisabled(unittest.TestCase):
 
     # G2 — AI_WORKER_HEARTBEAT updates enabled=False and status=disabled
     def test_main_disabled_updates_heartbeat(self):
-        with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore"):
+        with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance"):
             with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine"):
                 with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker"):
                     entry_module.main()
@@ -629,7 +870,7 @@ class TestMainMissingEnv(unittest.TestCase):
     def test_main_returns_on_missing_env(self):
         with patch("backend.infrastructure.ai_summarizer_entry.require_env", return_value=False):
             with patch("backend.infrastructure.ai_summarizer_entry.get_stable_worker_id", return_value="wid"):
-                with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore") as MockStore:
+                with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance") as MockStore:
                     with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine") as MockEngine:
                         with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker") as MockWorker:
                             with patch("backend.infrastructure.ai_summarizer_entry.time") as mock_time:
@@ -643,7 +884,7 @@ class TestMainMissingEnv(unittest.TestCase):
     def test_main_missing_env_sets_heartbeat(self):
         with patch("backend.infrastructure.ai_summarizer_entry.require_env", return_value=False):
             with patch("backend.infrastructure.ai_summarizer_entry.get_stable_worker_id", return_value="wid"):
-                with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore"):
+                with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance"):
                     with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine"):
                         with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker"):
                             with patch("backend.infrastructure.ai_summarizer_entry.time") as mock_time:
@@ -670,11 +911,11 @@ class TestMainInitFailure(unittest.TestCase):
         entry_module.AI_WORKER_HEARTBEAT.update(self._ORIGINAL_HEARTBEAT)
         entry_module.AI_SUMM_ENABLED = self._ORIGINAL_ENABLED
 
-    # I1/I2/I3 — SupabaseStore raises -> main returns, heartbeat init_failed
+    # I1/I2/I3 — get_store_instance raises -> main returns, heartbeat init_failed
     def test_store_init_failure_returns_and_sets_heartbeat(self):
         with patch("backend.infrastructure.ai_summarizer_entry.require_env", return_value=True):
             with patch("backend.infrastructure.ai_summarizer_entry.get_stable_worker_id", return_value="wid"):
-                with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore", side_effect=ConnectionError("no db")):
+                with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance", side_effect=ConnectionError("no db")):
                     with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine") as MockEngine:
                         with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker") as MockWorker:
                             with patch("backend.infrastructure.ai_summarizer_entry.time") as mock_time:
@@ -689,7 +930,7 @@ class TestMainInitFailure(unittest.TestCase):
     def test_engine_init_failure_sets_correct_error_type(self):
         with patch("backend.infrastructure.ai_summarizer_entry.require_env", return_value=True):
             with patch("backend.infrastructure.ai_summarizer_entry.get_stable_worker_id", return_value="wid"):
-                with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore"):
+                with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance"):
                     with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine", side_effect=ValueError("bad key")):
                         with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker") as MockWorker:
                             with patch("backend.infrastructure.ai_summarizer_entry.time") as mock_time:
@@ -731,7 +972,7 @@ class TestMainLoopControlledExit(unittest.TestCase):
         fake_worker.process_batch.side_effect = KeyboardInterrupt()
 
         with patch("backend.infrastructure.ai_summarizer_entry.require_env", return_value=True):
-            with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore"):
+            with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance"):
                 with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine"):
                     with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker", return_value=fake_worker):
                         with patch("backend.infrastructure.ai_summarizer_entry.time") as mock_time:
@@ -753,7 +994,7 @@ class TestMainLoopControlledExit(unittest.TestCase):
         fake_worker.process_batch.side_effect = side_effect
 
         with patch("backend.infrastructure.ai_summarizer_entry.require_env", return_value=True):
-            with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore"):
+            with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance"):
                 with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine"):
                     with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker", return_value=fake_worker):
                         with patch("backend.infrastructure.ai_summarizer_entry.time") as mock_time:
@@ -774,7 +1015,7 @@ class TestMainLoopControlledExit(unittest.TestCase):
         fake_worker.process_batch.side_effect = side_effect
 
         with patch("backend.infrastructure.ai_summarizer_entry.require_env", return_value=True):
-            with patch("backend.infrastructure.ai_summarizer_entry.SupabaseStore"):
+            with patch("backend.infrastructure.ai_summarizer_entry.get_store_instance"):
                 with patch("backend.infrastructure.ai_summarizer_entry.MistralEngine"):
                     with patch("backend.infrastructure.ai_summarizer_entry.AISummarizerWorker", return_value=fake_worker):
                         with patch("backend.infrastructure.ai_summarizer_entry.time") as mock_time: